@@ -0,0 +1,49 @@
+import importlib
+
+# CPU scheduling simulator. Importing the package costs nothing: the names
+# below and the submodules are loaded on first use, and only cpusched.gui
+# and cpusched.gantt ever import Tk or matplotlib, so headless code never
+# pays for them.
+#   backend    processes, Gantt charts, the simulation core and algorithms
+#   registry   named algorithms for the GUI, batch and bench tools
+#   files      CSV, JSON and binary .cpus workloads and results
+#   metrics    streaming percentiles, response time, fairness
+#   profiling  per-phase timers and counters for the engines
+#   trace      event sinks
+#   stream     FCFS/SJF/priority/SRTF over unbounded arrival streams
+#   smp        multi-CPU simulation
+#   workload   synthetic workload generator (needs numpy)
+#   batch, bench, cache, worker, gantt, gui, cli
+
+_EXPORTS = {
+    "Process": "backend", "ProcessTable": "backend", "GanttChart": "backend", "NO_PRIORITY": "backend",
+    "SchedulingError": "backend", "StepBudgetExceeded": "backend", "Policy": "backend",
+    "simulate": "backend", "calculate_metrics": "backend", "step_budget": "backend",
+    "fcfs": "backend", "sjf": "backend", "preemptive_sjf": "backend", "round_robin": "backend",
+    "priority_scheduling": "backend", "mlfq": "backend", "cfs": "backend",
+    "register": "registry",
+    "load_workload": "files", "save_workload": "files", "read_binary": "files",
+    "RunningMetrics": "metrics", "summarize": "metrics",
+    "Profiler": "profiling",
+    "ListTrace": "trace", "StdoutTrace": "trace", "FileTrace": "trace",
+    "smp_schedule": "smp",
+    "generate": "workload",
+}
+
+_SUBMODULES = ("backend", "batch", "bench", "cache", "cli", "files", "gantt", "gui", "metrics", "profiling",
+               "registry", "smp", "stream", "trace", "worker", "workload")
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULES))
@@ -0,0 +1,872 @@
+import heapq
+import math
+from array import array
+from collections import deque
+from collections.abc import Sequence
+
+# numpy is optional and takes longer to import than the rest of the
+# package, so only the vectorized table paths load it, the first time one
+# runs; _numpy() returns None when it is not installed.
+_np = None
+
+def _numpy():
+    global _np
+    if _np is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _np = numpy
+    return _np or None
+
+# Stored in the priority column for processes without a priority; it sorts
+# after every real priority, matching the old float('inf') fallback.
+NO_PRIORITY = 2 ** 63 - 1
+
+class Process:
+    def __init__(self, pid, arrival_time, burst_time, priority=None):
+        self.pid = pid
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.priority = priority
+        self.waiting_time = 0
+        self.turnaround_time = 0
+        self.completion_time = 0
+        self.remaining_burst = burst_time
+
+_TABLE_COLUMNS = ("pid", "arrival_time", "burst_time", "priority",
+                  "completion_time", "waiting_time", "turnaround_time")
+
+def _array_from_numpy(values):
+    np = _numpy()
+    column = array('q')
+    column.frombytes(memoryview(np.ascontiguousarray(values, dtype=np.int64)).cast('B'))
+    return column
+
+def _column_from_numpy(values):
+    # An int64 memoryview over the numpy array itself: a column without the
+    # copy _array_from_numpy() makes.
+    np = _numpy()
+    return memoryview(np.ascontiguousarray(values, dtype=np.int64)).cast('B').cast('q')
+
+def _as_array(column):
+    # Columns may also be read-only int64 memoryviews (e.g. memory-mapped
+    # files); this copies them into an array when mutation or pickling needs it.
+    if isinstance(column, array):
+        return column
+    copy = array('q')
+    copy.frombytes(memoryview(column).cast('B'))
+    return copy
+
+def _row_column(name):
+    def fget(row):
+        return getattr(row._table, name)[row._index]
+    def fset(row, value):
+        getattr(row._table, name)[row._index] = value
+    return property(fget, fset)
+
+class ProcessRow:
+    # A view of one row of a ProcessTable with the same attributes as Process.
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    pid = _row_column("pid")
+    arrival_time = _row_column("arrival_time")
+    burst_time = _row_column("burst_time")
+    completion_time = _row_column("completion_time")
+    waiting_time = _row_column("waiting_time")
+    turnaround_time = _row_column("turnaround_time")
+
+    @property
+    def priority(self):
+        priority = self._table.priority[self._index]
+        return None if priority == NO_PRIORITY else priority
+
+    @priority.setter
+    def priority(self, value):
+        self._table.priority[self._index] = NO_PRIORITY if value is None else value
+
+    def __repr__(self):
+        return (f"ProcessRow(pid={self.pid}, arrival_time={self.arrival_time}, "
+                f"burst_time={self.burst_time}, priority={self.priority})")
+
+def _priority_column(priority, n):
+    if priority is None:
+        return array('q', [NO_PRIORITY]) * n
+    if isinstance(priority, array):
+        return array('q', priority)
+    return array('q', [NO_PRIORITY if p is None else p for p in priority])
+
+class ProcessTable:
+    # Columnar process list: one int64 array per attribute instead of one
+    # Python object per process. Algorithms read the input columns directly
+    # and return a new table, in completion order, with the result columns set.
+    def __init__(self, pid=(), arrival_time=(), burst_time=(), priority=None):
+        self.pid = array('q', pid)
+        self.arrival_time = array('q', arrival_time)
+        self.burst_time = array('q', burst_time)
+        n = len(self.pid)
+        self.priority = _priority_column(priority, n)
+        if not len(self.arrival_time) == len(self.burst_time) == len(self.priority) == n:
+            raise ValueError("ProcessTable columns must have the same length")
+        self.completion_time = array('q', [0]) * n
+        self.waiting_time = array('q', [0]) * n
+        self.turnaround_time = array('q', [0]) * n
+
+    @classmethod
+    def from_processes(cls, processes):
+        table = cls([p.pid for p in processes],
+                    [p.arrival_time for p in processes],
+                    [p.burst_time for p in processes],
+                    [p.priority for p in processes])
+        table.completion_time = array('q', [p.completion_time for p in processes])
+        table.waiting_time = array('q', [p.waiting_time for p in processes])
+        table.turnaround_time = array('q', [p.turnaround_time for p in processes])
+        return table
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.pid)
+        if not 0 <= index < len(self.pid):
+            raise IndexError("ProcessTable index out of range")
+        return ProcessRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.pid)):
+            yield ProcessRow(self, index)
+
+    def __getstate__(self):
+        return {name: _as_array(column) for name, column in self.__dict__.items()}
+
+    def append(self, pid, arrival_time, burst_time, priority=None):
+        for name in _TABLE_COLUMNS:
+            setattr(self, name, _as_array(getattr(self, name)))
+        self.pid.append(pid)
+        self.arrival_time.append(arrival_time)
+        self.burst_time.append(burst_time)
+        self.priority.append(NO_PRIORITY if priority is None else priority)
+        self.completion_time.append(0)
+        self.waiting_time.append(0)
+        self.turnaround_time.append(0)
+
+    def take(self, indices):
+        # New table holding the given rows, in the given order, results included.
+        table = ProcessTable.__new__(ProcessTable)
+        if isinstance(indices, range) and indices == range(len(self)):
+            # Every row, in order: a plain copy of each column, no gather.
+            for name in _TABLE_COLUMNS:
+                column = array('q')
+                column.frombytes(memoryview(getattr(self, name)).cast('B'))
+                setattr(table, name, column)
+            return table
+        np = _numpy() if len(indices) else None
+        if np is not None:
+            indices = np.asarray(indices, dtype=np.intp)
+            for name in _TABLE_COLUMNS:
+                column = np.frombuffer(getattr(self, name), dtype=np.int64)
+                setattr(table, name, _array_from_numpy(column[indices]))
+            return table
+        for name in _TABLE_COLUMNS:
+            column = getattr(self, name)
+            setattr(table, name, array('q', [column[i] for i in indices]))
+        return table
+
+class GanttChart(Sequence):
+    # Gantt segments held as pid/start/end int64 columns; iterating or indexing
+    # yields the same (pid, start, end) tuples as a plain list of segments.
+    def __init__(self, pid=(), start=(), end=()):
+        self.pid = array('q', pid)
+        self.start = array('q', start)
+        self.end = array('q', end)
+
+    @classmethod
+    def from_segments(cls, segments):
+        chart = cls()
+        for pid, start_time, end_time in segments:
+            chart.pid.append(pid)
+            chart.start.append(start_time)
+            chart.end.append(end_time)
+        return chart
+
+    def __getstate__(self):
+        return {name: _as_array(column) for name, column in self.__dict__.items()}
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(zip(self.pid[index], self.start[index], self.end[index]))
+        return self.pid[index], self.start[index], self.end[index]
+
+    def __iter__(self):
+        return zip(self.pid, self.start, self.end)
+
+    def __eq__(self, other):
+        if not isinstance(other, (GanttChart, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+def _columns(processes):
+    if isinstance(processes, ProcessTable):
+        return processes.pid, processes.arrival_time, processes.burst_time, processes.priority
+    return ([p.pid for p in processes],
+            [p.arrival_time for p in processes],
+            [p.burst_time for p in processes],
+            [NO_PRIORITY if p.priority is None else p.priority for p in processes])
+
+def _arrival_order(arrival_times):
+    np = None if isinstance(arrival_times, list) else _numpy()
+    if np is not None:
+        arrivals = np.frombuffer(arrival_times, dtype=np.int64)
+        if len(arrivals) and np.all(arrivals[1:] >= arrivals[:-1]):
+            # Already in arrival order, as traces usually are: no index list.
+            return range(len(arrivals))
+        return _array_from_numpy(np.argsort(arrivals, kind="stable"))
+    return sorted(range(len(arrival_times)), key=arrival_times.__getitem__)
+
+def _collect(processes, order, completion_times):
+    # Completed processes in completion order: a new ProcessTable for table
+    # input, otherwise the caller's Process objects with completion_time set.
+    if isinstance(processes, ProcessTable):
+        completed = processes.take(order)
+        completed.completion_time = (completion_times if isinstance(completion_times, array)
+                                     else array('q', completion_times))
+        return completed
+    completed = [processes[i] for i in order]
+    for process, completion_time in zip(completed, completion_times):
+        process.completion_time = completion_time
+    return completed
+
+class SchedulingError(Exception):
+    pass
+
+class StepBudgetExceeded(SchedulingError):
+    def __init__(self, algorithm, steps, budget, completed_pids):
+        self.algorithm = algorithm
+        self.steps = steps
+        self.budget = budget
+        self.completed_pids = completed_pids
+        super().__init__(f"{algorithm}: exceeded step budget of {budget} after {steps} steps "
+                         f"with {len(completed_pids)} processes completed")
+
+    def __reduce__(self):
+        # Rebuilt from the constructor arguments, so it survives the trip
+        # back from a worker process.
+        return type(self), (self.algorithm, self.steps, self.budget, self.completed_pids)
+
+def _step_budget(n, burst_times, quantum=1):
+    # Every step either admits an arrival, preempts on an arrival, completes a
+    # process or runs at least one quantum of burst, so no correct run can
+    # take more steps than this. A quantum of None means slices only end at
+    # completions, so the burst lengths do not count.
+    if quantum is None:
+        return 3 * n + 1
+    return 3 * n + math.ceil(sum(burst_times) / quantum) + 1
+
+def step_budget(processes, quantum=1):
+    return _step_budget(len(processes), _columns(processes)[2], quantum)
+
+def calculate_metrics(processes, trace=None):
+    if not processes:
+        return 0, 0, 0, 0
+    np = _numpy() if isinstance(processes, ProcessTable) else None
+    if np is not None:
+        completion_times = np.frombuffer(processes.completion_time, dtype=np.int64)
+        burst_times = np.frombuffer(processes.burst_time, dtype=np.int64)
+        turnaround_times = completion_times - np.frombuffer(processes.arrival_time, dtype=np.int64)
+        waiting_times = turnaround_times - burst_times
+        processes.turnaround_time = _column_from_numpy(turnaround_times)
+        processes.waiting_time = _column_from_numpy(waiting_times)
+        total_waiting_time = int(waiting_times.sum())
+        total_turnaround_time = int(turnaround_times.sum())
+        total_burst_time = int(burst_times.sum())
+        end_time = int(completion_times.max())
+    elif isinstance(processes, ProcessTable):
+        turnaround_times = array('q', [c - a for c, a in zip(processes.completion_time, processes.arrival_time)])
+        waiting_times = array('q', [t - b for t, b in zip(turnaround_times, processes.burst_time)])
+        processes.turnaround_time = turnaround_times
+        processes.waiting_time = waiting_times
+        total_waiting_time = sum(waiting_times)
+        total_turnaround_time = sum(turnaround_times)
+        total_burst_time = sum(processes.burst_time)
+        end_time = max(processes.completion_time)
+    else:
+        total_waiting_time = 0
+        total_turnaround_time = 0
+        total_burst_time = sum(p.burst_time for p in processes)
+        end_time = max(p.completion_time for p in processes)
+
+        for process in processes:
+            process.turnaround_time = process.completion_time - process.arrival_time
+            process.waiting_time = process.turnaround_time - process.burst_time
+            total_waiting_time += process.waiting_time
+            total_turnaround_time += process.turnaround_time
+
+    avg_waiting_time = total_waiting_time / len(processes)
+    avg_turnaround_time = total_turnaround_time / len(processes)
+    cpu_utilization = (total_burst_time / end_time) * 100 if end_time > 0 else 0
+    throughput = len(processes) / end_time if end_time > 0 else 0
+
+    if trace is not None:
+        trace.emit("metrics", avg_waiting_time, avg_turnaround_time, cpu_utilization, throughput)
+    return avg_waiting_time, avg_turnaround_time, cpu_utilization, throughput
+
+def _fcfs_numpy(table):
+    # Completion is a running max: c[i] = max(c[i-1], a[i]) + b[i]. With
+    # prefix sums S of the bursts this unrolls to
+    # c[i] = S[i] + max(0, max over j <= i of (a[j] - S[j-1])).
+    # Input already in arrival order, the usual case, skips the sort and
+    # the gathers: _arrival_order() then returns a range. The result columns
+    # are memoryviews over the numpy arrays rather than copies into arrays,
+    # and read-only input columns (memory-mapped files) are shared as is.
+    np = _numpy()
+    order = _arrival_order(table.arrival_time)
+    arrivals = np.frombuffer(table.arrival_time, dtype=np.int64)
+    bursts = np.frombuffer(table.burst_time, dtype=np.int64)
+    indices = None
+    if not isinstance(order, range):
+        indices = np.frombuffer(order, dtype=np.int64)
+        arrivals = arrivals[indices]
+        bursts = bursts[indices]
+    ends = np.cumsum(bursts)
+    offsets = np.maximum.accumulate(arrivals - (ends - bursts))
+    np.maximum(offsets, 0, out=offsets)
+    completion_times = ends + offsets
+
+    def unshared(column):
+        # A copy the caller may write to; read-only columns are shared.
+        if isinstance(column, memoryview) and column.readonly:
+            return column
+        return _column_from_numpy(np.frombuffer(column, dtype=np.int64).copy())
+
+    completed = ProcessTable.__new__(ProcessTable)
+    for name, values in (("pid", None), ("arrival_time", arrivals), ("burst_time", bursts), ("priority", None)):
+        if indices is None:
+            completed_column = unshared(getattr(table, name))
+        elif values is None:
+            completed_column = _column_from_numpy(np.frombuffer(getattr(table, name), dtype=np.int64)[indices])
+        else:
+            completed_column = _column_from_numpy(values)
+        setattr(completed, name, completed_column)
+    completed.completion_time = _column_from_numpy(completion_times)
+    # Set by calculate_metrics().
+    completed.waiting_time = completed.turnaround_time = None
+    gantt_chart = GanttChart.__new__(GanttChart)
+    gantt_chart.pid = unshared(completed.pid)
+    gantt_chart.start = _column_from_numpy(completion_times - bursts)
+    gantt_chart.end = unshared(completed.completion_time)
+    return gantt_chart, completed
+
+class Policy:
+    # A scheduling policy for simulate(). The policy owns the ready queue and
+    # decides who runs next and for how long; simulate() advances the clock,
+    # admits arrivals, skips idle periods, charges context switches and
+    # builds the Gantt chart, trace and metrics the same way for every policy.
+    label = "Policy"
+    # Shortest slice that can end without finishing a process; it bounds the
+    # number of steps a correct run can take. None for policies that never
+    # cut a process short.
+    min_slice = 1
+
+    def parameters(self):
+        return {}
+
+    def start(self, columns, remaining_burst):
+        # columns are (pids, arrival_times, burst_times, priorities), indexed
+        # like remaining_burst, which simulate() keeps up to date.
+        self.columns = columns
+        self.remaining_burst = remaining_burst
+
+    def admit(self, index, time):
+        raise NotImplementedError
+
+    def select(self, time):
+        # Takes the next process off the ready queue; None if it is empty.
+        raise NotImplementedError
+
+    def time_slice(self, index, time, next_arrival):
+        # How long the selected process runs; next_arrival is the time of the
+        # next arrival, or None. Non-preemptive by default.
+        return self.remaining_burst[index]
+
+    def requeue(self, index, time, ran):
+        # The process ran for `ran` without finishing; arrivals up to `time`
+        # have already been admitted.
+        self.admit(index, time)
+
+    def complete(self, index, time):
+        pass
+
+def _add_segment(gantt_chart, pid, start_time, end_time):
+    # Back-to-back slices of one process, with no switch between them, are
+    # drawn as a single segment. gantt_chart is a GanttChart for table input
+    # and a list of (pid, start, end) tuples otherwise.
+    if isinstance(gantt_chart, list):
+        if gantt_chart and gantt_chart[-1][0] == pid and gantt_chart[-1][2] == start_time:
+            gantt_chart[-1] = (pid, gantt_chart[-1][1], end_time)
+        else:
+            gantt_chart.append((pid, start_time, end_time))
+    elif gantt_chart.pid and gantt_chart.pid[-1] == pid and gantt_chart.end[-1] == start_time:
+        gantt_chart.end[-1] = end_time
+    else:
+        gantt_chart.pid.append(pid)
+        gantt_chart.start.append(start_time)
+        gantt_chart.end.append(end_time)
+
+def simulate(processes, policy, context_switch=0, max_steps=None, trace=None, profiler=None):
+    # Shared event loop: jumps from decision to decision (an arrival, the
+    # end of a slice or a completion) rather than ticking, so the cost is
+    # per slice whatever the burst lengths. Switching to a different process
+    # costs `context_switch` time units of idle CPU. A cpusched.profiling
+    # Profiler, if given, times each phase of the loop. For table input the
+    # per-process state and the Gantt chart are int64 arrays, so it stays
+    # columnar; Process lists keep plain lists and may hold any pids and
+    # numeric times.
+    columns = _columns(processes)
+    pids, arrival_times, burst_times = columns[:3]
+    order = _arrival_order(arrival_times)
+    n = len(order)
+    if isinstance(processes, ProcessTable):
+        remaining_burst = array('q', burst_times) if isinstance(burst_times, array) else _as_array(burst_times)
+        completion_times = array('q')
+        gantt_chart = GanttChart()
+    else:
+        remaining_burst = list(burst_times)
+        completion_times = []
+        gantt_chart = []
+    policy.start(columns, remaining_burst)
+    label = policy.label
+    next_arrival = 0
+    current_time = 0
+    last = None
+    preempted = False
+    # Whether gantt_chart[-1] holds a slice the trace has not seen yet.
+    unreported = False
+    completed_order = array('q')
+    if max_steps is None:
+        max_steps = _step_budget(n, burst_times, policy.min_slice)
+    steps = 0
+    if trace is not None:
+        parameters = policy.parameters()
+        if context_switch:
+            parameters = dict(parameters, context_switch=context_switch)
+        trace.emit("begin", label, parameters)
+    if profiler is not None:
+        clock = profiler.clock
+        profiler.begin(label)
+    while next_arrival < n or len(completed_order) < next_arrival:
+        steps += 1
+        if steps > max_steps:
+            raise StepBudgetExceeded(label, steps, max_steps, [pids[i] for i in completed_order])
+        if profiler is not None:
+            profiler.step(next_arrival - len(completed_order))
+            mark = clock()
+        while next_arrival < n and arrival_times[order[next_arrival]] <= current_time:
+            policy.admit(order[next_arrival], current_time)
+            next_arrival += 1
+        if profiler is not None:
+            mark = profiler.phase("admit", mark)
+        index = policy.select(current_time)
+        if profiler is not None:
+            mark = profiler.phase("select", mark)
+        if index is None:
+            current_time = arrival_times[order[next_arrival]]
+            if trace is not None:
+                trace.emit("idle", current_time)
+            if profiler is not None:
+                profiler.count("idle")
+            continue
+
+        if index != last:
+            if trace is not None and unreported:
+                trace.emit("segment", *gantt_chart[-1])
+                unreported = False
+            if context_switch and last is not None:
+                current_time += context_switch
+            if trace is not None:
+                trace.emit("preempt" if preempted else "dispatch", pids[index], current_time)
+            if profiler is not None:
+                profiler.count("preemptions" if preempted else "dispatches")
+            last = index
+        time_slice = policy.time_slice(index, current_time,
+                                       arrival_times[order[next_arrival]] if next_arrival < n else None)
+        if profiler is not None:
+            mark = profiler.phase("slice", mark)
+        if time_slice <= 0 and remaining_burst[index] > 0:
+            # Something arrived during the context switch and goes first. A
+            # process with nothing left to run falls through and completes.
+            policy.requeue(index, current_time, 0)
+            preempted = True
+            continue
+        start_time = current_time
+        current_time += time_slice
+        remaining_burst[index] -= time_slice
+        _add_segment(gantt_chart, pids[index], start_time, current_time)
+        unreported = True
+        if profiler is not None:
+            mark = profiler.phase("gantt", mark)
+        if remaining_burst[index] == 0:
+            completed_order.append(index)
+            completion_times.append(current_time)
+            policy.complete(index, current_time)
+            preempted = False
+            if trace is not None:
+                trace.emit("segment", *gantt_chart[-1])
+                trace.emit("complete", pids[index], current_time)
+                unreported = False
+            if profiler is not None:
+                profiler.phase("complete", mark)
+        else:
+            # Arrivals during the slice queue ahead of the process.
+            while next_arrival < n and arrival_times[order[next_arrival]] <= current_time:
+                policy.admit(order[next_arrival], current_time)
+                next_arrival += 1
+            if profiler is not None:
+                mark = profiler.phase("admit", mark)
+            policy.requeue(index, current_time, time_slice)
+            preempted = True
+            if profiler is not None:
+                profiler.phase("requeue", mark)
+    if profiler is not None:
+        mark = clock()
+    completed = _collect(processes, completed_order, completion_times)
+    metrics = calculate_metrics(completed, trace)
+    if profiler is not None:
+        profiler.phase("metrics", mark)
+        profiler.end()
+    return gantt_chart, completed, *metrics
+
+class FifoPolicy(Policy):
+    label = "FCFS"
+    min_slice = None
+
+    def start(self, columns, remaining_burst):
+        super().start(columns, remaining_burst)
+        self.queue = deque()
+
+    def admit(self, index, time):
+        self.queue.append(index)
+
+    def select(self, time):
+        return self.queue.popleft() if self.queue else None
+
+class KeyPolicy(Policy):
+    # Non-preemptive, smallest value of a _columns() column first; the
+    # admission sequence keeps ties FIFO.
+    min_slice = None
+
+    def __init__(self, key_column, label):
+        self.key_column = key_column
+        self.label = label
+
+    def start(self, columns, remaining_burst):
+        super().start(columns, remaining_burst)
+        self.keys = columns[self.key_column]
+        self.ready_queue = []
+        self.sequence = 0
+
+    def admit(self, index, time):
+        heapq.heappush(self.ready_queue, (self.keys[index], self.sequence, index))
+        self.sequence += 1
+
+    def select(self, time):
+        return heapq.heappop(self.ready_queue)[2] if self.ready_queue else None
+
+class ShortestRemainingPolicy(Policy):
+    # Shortest remaining time first. The running process is only cut at
+    # arrivals, and keeps the CPU unless one of them is strictly shorter.
+    label = "Preemptive SJF"
+
+    def start(self, columns, remaining_burst):
+        super().start(columns, remaining_burst)
+        self.ready_queue = []
+        self.sequence = 0
+        self.running = None
+
+    def admit(self, index, time):
+        heapq.heappush(self.ready_queue, (self.remaining_burst[index], self.sequence, index))
+        self.sequence += 1
+
+    def select(self, time):
+        running = self.running
+        self.running = None
+        if running is not None:
+            if not self.ready_queue or self.remaining_burst[running] <= self.ready_queue[0][0]:
+                return running
+            self.admit(running, time)
+        return heapq.heappop(self.ready_queue)[2] if self.ready_queue else None
+
+    def time_slice(self, index, time, next_arrival):
+        remaining = self.remaining_burst[index]
+        if next_arrival is not None and next_arrival < time + remaining:
+            return next_arrival - time
+        return remaining
+
+    def requeue(self, index, time, ran):
+        self.running = index
+
+class RoundRobinPolicy(Policy):
+    label = "Round Robin"
+
+    def __init__(self, quantum):
+        if quantum <= 0:
+            raise ValueError("Round Robin needs a positive quantum")
+        self.quantum = quantum
+        self.min_slice = quantum
+
+    def parameters(self):
+        return {"quantum": self.quantum}
+
+    def start(self, columns, remaining_burst):
+        super().start(columns, remaining_burst)
+        self.queue = deque()
+
+    def admit(self, index, time):
+        self.queue.append(index)
+
+    def select(self, time):
+        return self.queue.popleft() if self.queue else None
+
+    def time_slice(self, index, time, next_arrival):
+        remaining = self.remaining_burst[index]
+        if self.queue:
+            return min(self.quantum, remaining)
+        # With nobody else waiting the process keeps the CPU for whole quanta
+        # until the next arrival, so that run is taken as one slice.
+        if next_arrival is not None:
+            return min(remaining, self.quantum * max(1, math.ceil((next_arrival - time) / self.quantum)))
+        return remaining
+
+class MLFQPolicy(Policy):
+    # Multilevel feedback queue with one FIFO per level. Arrivals enter level
+    # 0; a process that uses up the quantum of its level drops one level,
+    # and one running below level 0 is preempted by an arrival (it keeps its
+    # place at the front of its level). Every `boost` time units all waiting
+    # processes return to level 0.
+    label = "MLFQ"
+
+    def __init__(self, quanta=(2, 4, 8), boost=None):
+        if not quanta or min(quanta) <= 0:
+            raise ValueError("MLFQ needs at least one positive quantum")
+        self.quanta = tuple(quanta)
+        self.boost = boost
+        self.min_slice = min(self.quanta)
+
+    def parameters(self):
+        return {"quanta": self.quanta, "boost": self.boost}
+
+    def start(self, columns, remaining_burst):
+        super().start(columns, remaining_burst)
+        n = len(remaining_burst)
+        self.level = array('q', [0]) * n
+        self.used = array('q', [0]) * n if isinstance(remaining_burst, array) else [0] * n
+        self.queues = [deque() for _ in self.quanta]
+        self.queued = 0
+        self.next_boost = self.boost or None
+        self.current_level = 0
+
+    def admit(self, index, time):
+        self.queues[0].append(index)
+        self.queued += 1
+
+    def select(self, time):
+        if self.next_boost is not None and time >= self.next_boost:
+            for lower in self.queues[1:]:
+                for index in lower:
+                    self.level[index] = 0
+                    self.used[index] = 0
+                self.queues[0].extend(lower)
+                lower.clear()
+            self.next_boost = (time // self.boost + 1) * self.boost
+        if not self.queued:
+            return None
+        level = 0
+        while not self.queues[level]:
+            level += 1
+        self.current_level = level
+        self.queued -= 1
+        return self.queues[level].popleft()
+
+    def time_slice(self, index, time, next_arrival):
+        level = self.current_level
+        quantum = self.quanta[level]
+        used = self.used[index]
+        time_slice = quantum - used
+        if level == len(self.quanta) - 1 and not self.queued:
+            # Alone on the lowest level the process keeps the CPU for whole
+            # quanta until the next boost, or arrival if that cannot preempt.
+            horizons = [self.next_boost] if self.next_boost is not None else []
+            if level == 0 and next_arrival is not None:
+                horizons.append(next_arrival)
+            if horizons:
+                time_slice = quantum * max(1, math.ceil((min(horizons) - time + used) / quantum)) - used
+            else:
+                time_slice = self.remaining_burst[index]
+        time_slice = min(time_slice, self.remaining_burst[index])
+        if level > 0 and next_arrival is not None and next_arrival < time + time_slice:
+            time_slice = next_arrival - time
+        return time_slice
+
+    def requeue(self, index, time, ran):
+        level = self.current_level
+        quantum = self.quanta[level]
+        self.used[index] += ran
+        self.queued += 1
+        if ran and self.used[index] % quantum == 0:
+            self.level[index] = min(level + 1, len(self.quanta) - 1)
+            self.used[index] = 0
+            self.queues[self.level[index]].append(index)
+        else:
+            # Cut short by an arrival; a run over several quanta on the
+            # lowest level only counts its last, unfinished one.
+            self.used[index] %= quantum
+            self.queues[level].appendleft(index)
+
+# Weight of a nice-0 process; every nice level is worth a factor of 1.25.
+NICE_0_WEIGHT = 1024
+
+def _cfs_weight(priority):
+    nice = 0 if priority == NO_PRIORITY else max(-20, min(19, priority))
+    return NICE_0_WEIGHT / 1.25 ** nice
+
+class CFSPolicy(Policy):
+    # Completely-fair style: runnable processes sit in a heap keyed on
+    # virtual runtime, and the smallest runs next for its weighted share of
+    # `latency` (at least `min_granularity`). Running advances vruntime by
+    # the time run x 1024 / weight, with priorities used as nice values;
+    # arrivals start at the current minimum vruntime.
+    label = "CFS"
+
+    def __init__(self, latency=12, min_granularity=2):
+        if min_granularity <= 0:
+            raise ValueError("CFS needs a positive minimum granularity")
+        self.latency = latency
+        self.min_granularity = min_granularity
+        self.min_slice = min_granularity
+
+    def parameters(self):
+        return {"latency": self.latency, "min_granularity": self.min_granularity}
+
+    def start(self, columns, remaining_burst):
+        super().start(columns, remaining_burst)
+        self.weights = array('d', map(_cfs_weight, columns[3]))
+        self.vruntime = array('d', [0.0]) * len(remaining_burst)
+        self.ready_queue = []
+        self.sequence = 0
+        self.total_weight = 0.0
+        self.min_vruntime = 0.0
+
+    def _push(self, index):
+        heapq.heappush(self.ready_queue, (self.vruntime[index], self.sequence, index))
+        self.sequence += 1
+        if self.ready_queue[0][0] > self.min_vruntime:
+            self.min_vruntime = self.ready_queue[0][0]
+
+    def admit(self, index, time):
+        self.vruntime[index] = self.min_vruntime
+        self.total_weight += self.weights[index]
+        self._push(index)
+
+    def select(self, time):
+        return heapq.heappop(self.ready_queue)[2] if self.ready_queue else None
+
+    def time_slice(self, index, time, next_arrival):
+        time_slice = max(self.min_granularity, int(self.latency * self.weights[index] / self.total_weight))
+        if not self.ready_queue:
+            # Nobody to share with: run until the next arrival.
+            if next_arrival is None:
+                return self.remaining_burst[index]
+            time_slice = max(time_slice, next_arrival - time)
+        return min(time_slice, self.remaining_burst[index])
+
+    def requeue(self, index, time, ran):
+        self.vruntime[index] += ran * NICE_0_WEIGHT / self.weights[index]
+        self._push(index)
+
+    def complete(self, index, time):
+        self.total_weight -= self.weights[index]
+        if self.ready_queue and self.ready_queue[0][0] > self.min_vruntime:
+            self.min_vruntime = self.ready_queue[0][0]
+
+def fcfs(processes, trace=None, profiler=None):
+    if isinstance(processes, ProcessTable) and len(processes) and _numpy() is not None:
+        if trace is not None:
+            trace.emit("begin", "FCFS", {})
+        if profiler is not None:
+            # One vectorized pass; the whole schedule is charged to "select".
+            profiler.begin("FCFS")
+            mark = profiler.clock()
+        gantt_chart, completed = _fcfs_numpy(processes)
+        if profiler is not None:
+            mark = profiler.phase("select", mark)
+            profiler.count("dispatches", len(completed))
+        if trace is not None:
+            # The same events, in the same order, as simulate() emits.
+            previous_end = 0
+            for pid, start_time, end_time in gantt_chart:
+                if start_time > previous_end:
+                    trace.emit("idle", start_time)
+                trace.emit("dispatch", pid, start_time)
+                trace.emit("segment", pid, start_time, end_time)
+                trace.emit("complete", pid, end_time)
+                previous_end = end_time
+        metrics = calculate_metrics(completed, trace)
+        if profiler is not None:
+            profiler.phase("metrics", mark)
+            profiler.end()
+        return gantt_chart, completed, *metrics
+    return simulate(processes, FifoPolicy(), trace=trace, profiler=profiler)
+
+def sjf(processes, max_steps=None, trace=None, profiler=None):
+    return simulate(processes, KeyPolicy(2, "SJF"), 0, max_steps, trace, profiler)
+
+def preemptive_sjf(processes, max_steps=None, trace=None, profiler=None):
+    return simulate(processes, ShortestRemainingPolicy(), 0, max_steps, trace, profiler)
+
+def round_robin(processes, quantum, max_steps=None, trace=None, profiler=None):
+    return simulate(processes, RoundRobinPolicy(quantum), 0, max_steps, trace, profiler)
+
+def priority_scheduling(processes, max_steps=None, trace=None, profiler=None):
+    return simulate(processes, KeyPolicy(3, "Priority Scheduling"), 0, max_steps, trace, profiler)
+
+def mlfq(processes, quanta=(2, 4, 8), boost=None, context_switch=0, max_steps=None, trace=None, profiler=None):
+    return simulate(processes, MLFQPolicy(quanta, boost), context_switch, max_steps, trace, profiler)
+
+def cfs(processes, latency=12, min_granularity=2, context_switch=0, max_steps=None, trace=None, profiler=None):
+    return simulate(processes, CFSPolicy(latency, min_granularity), context_switch, max_steps, trace, profiler)
+
+if __name__ == "__main__":
+    from .trace import StdoutTrace
+
+    # Test with sample processes
+    processes = [
+        Process(1, 0, 4, 2),
+        Process(2, 1, 3, 1),
+        Process(3, 2, 5, 3)
+    ]
+    quantum = 2
+    trace = StdoutTrace()
+
+    print("\nTesting FCFS:")
+    gantt, completed, wait, turn, cpu, throughput = fcfs(processes[:], trace=trace)
+    print("\nTesting SJF:")
+    sjf(processes[:], trace=trace)
+    print("\nTesting Preemptive SJF:")
+    preemptive_sjf(processes[:], trace=trace)
+    print("\nTesting Round Robin:")
+    round_robin(processes[:], quantum, trace=trace)
+    print("\nTesting Priority Scheduling:")
+    priority_scheduling(processes[:], trace=trace)
+    print("\nTesting MLFQ:")
+    mlfq(processes[:], trace=trace)
+    print("\nTesting CFS:")
+    cfs(processes[:], trace=trace)
@@ -0,0 +1,137 @@
+import argparse
+import ast
+import csv
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from . import registry
+from .backend import SchedulingError
+from .cache import ResultCache
+from .files import load_workload
+from .metrics import PERCENTILES, summarize
+
+# Beyond the four averages every algorithm returns, rows carry the
+# distribution and overhead metrics of metrics.summarize().
+SUMMARY_FIELDS = tuple(f"p{q}_{name}_time" for name in ("waiting", "turnaround") for q in PERCENTILES) + (
+    "avg_response_time",) + tuple(f"p{q}_response_time" for q in PERCENTILES) + (
+    "context_switches", "idle_time", "fairness")
+
+RESULT_FIELDS = ("workload", "algorithm", "quantum", "processes", "avg_waiting_time",
+                 "avg_turnaround_time", "cpu_utilization", "throughput") + SUMMARY_FIELDS + (
+                 "seconds", "error", "parameters")
+
+def make_jobs(workload_names, algorithms, parameters):
+    # Every workload x algorithm pair, expanded over the values given for
+    # each parameter the algorithm accepts (e.g. quantum for "rr" only);
+    # parameters without values keep their registered default.
+    jobs = []
+    for workload in workload_names:
+        for algorithm in algorithms:
+            grid = [{}]
+            for name, default in registry.get(algorithm).params.items():
+                values = parameters.get(name) or [default]
+                grid = [dict(params, **{name: value}) for params in grid for value in values]
+            for params in grid:
+                jobs.append((workload, algorithm, params))
+    return jobs
+
+def _run_job(workloads, cache, workload, algorithm, params):
+    processes = workloads[workload]
+    if isinstance(processes, str):
+        processes = workloads[workload] = load_workload(processes)
+    row = {"workload": workload, "algorithm": algorithm, "processes": len(processes), **params,
+           "parameters": " ".join(f"{name}={value}" for name, value in params.items() if name != "quantum")}
+    started = time.perf_counter()
+    try:
+        function = registry.get(algorithm).function
+        if cache is not None:
+            gantt, completed, *metrics = cache.run(function, processes, **params)
+        else:
+            gantt, completed, *metrics = function(processes, **params)
+        summary = summarize(gantt, completed).summary()
+    except (SchedulingError, ValueError, TypeError) as e:
+        # A bad grid value (a zero quantum, say) or workload (duplicate pids)
+        # fails its own row, not the whole sweep.
+        row["error"] = str(e)
+    else:
+        row.update(zip(RESULT_FIELDS[4:8], metrics))
+        row.update((name, summary[name]) for name in SUMMARY_FIELDS)
+    row["seconds"] = time.perf_counter() - started
+    return row
+
+# Workloads are sent to each worker process once, when it starts, rather
+# than with every job; paths are loaded lazily inside the worker.
+_worker_workloads = {}
+_worker_cache = None
+
+def _init_worker(workloads, cache_dir):
+    global _worker_cache
+    _worker_workloads.update(workloads)
+    if cache_dir is not None:
+        _worker_cache = ResultCache(directory=cache_dir)
+
+def _worker_job(workload, algorithm, params):
+    return _run_job(_worker_workloads, _worker_cache, workload, algorithm, params)
+
+def iter_batch(workloads, algorithms, parameters=None, max_workers=None, ordered=False, cache_dir=None):
+    # workloads maps a name to a ProcessTable, a list of Process objects or a
+    # workload file path. Rows are yielded as jobs finish (or in job order
+    # with ordered=True); max_workers=1 runs everything in this process.
+    # With cache_dir, results are shared through an on-disk ResultCache.
+    jobs = make_jobs(list(workloads), algorithms, parameters or {})
+    if max_workers == 1:
+        workloads = dict(workloads)
+        cache = ResultCache(directory=cache_dir) if cache_dir is not None else None
+        for job in jobs:
+            yield _run_job(workloads, cache, *job)
+        return
+    executor = ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(dict(workloads), cache_dir))
+    try:
+        futures = [executor.submit(_worker_job, *job) for job in jobs]
+        for future in (futures if ordered else as_completed(futures)):
+            yield future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+def run_batch(workloads, algorithms, parameters=None, max_workers=None, cache_dir=None):
+    return list(iter_batch(workloads, algorithms, parameters, max_workers, ordered=True, cache_dir=cache_dir))
+
+def write_results(rows, f):
+    writer = csv.DictWriter(f, RESULT_FIELDS, restval="", extrasaction="ignore")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        f.flush()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run scheduling algorithms over workload files in parallel.")
+    parser.add_argument("workloads", nargs="+", help="workload files (.csv, .json or .cpus)")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=registry.names(),
+                        choices=registry.names())
+    parser.add_argument("-q", "--quantum", nargs="+", type=int, default=[], help="Round Robin quantum values to sweep")
+    parser.add_argument("-p", "--param", nargs="*", action="extend", default=[], metavar="NAME=VALUE",
+                        help="parameter values to sweep, repeatable, e.g. quanta=(2,4,8) quanta=(1,2) boost=50")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("-o", "--output", help="CSV file for the results (default: stdout)")
+    parser.add_argument("--cache", metavar="DIR", help="reuse and store results in this cache directory")
+    args = parser.parse_args(argv)
+
+    parameters = {"quantum": args.quantum}
+    for pair in args.param:
+        name, _, value = pair.partition("=")
+        try:
+            value = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            parser.error(f"invalid value for {name}: {value}")
+        parameters.setdefault(name, []).append(value)
+    workloads = {path: path for path in args.workloads}
+    rows = iter_batch(workloads, args.algorithms, parameters, args.jobs, cache_dir=args.cache)
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            write_results(rows, f)
+    else:
+        write_results(rows, sys.stdout)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from . import registry
+from .workload import BURSTS, generate
+
+# Mean burst of each distribution with generate()'s default parameters; the
+# arrival rate is derived from it so every workload runs at the same load.
+BURST_MEANS = {"exponential": 10.0, "pareto": 10.0, "bimodal": 13.6}
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+def _run(function, processes, params):
+    gantt, completed, *_ = function(processes, **params)
+    # Events: one per Gantt segment (dispatch/preemption) plus one per
+    # completion, which is comparable across algorithms.
+    return len(gantt) + len(completed)
+
+def measure(function, processes, params=None, repeat=3):
+    # Best wall time of `repeat` runs, then one extra run under tracemalloc
+    # for the peak memory, which would otherwise distort the timings.
+    params = params or {}
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        events = _run(function, processes, params)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _run(function, processes, params)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak, "events": events,
+            "events_per_second": events / best if best else None}
+
+def run_benchmarks(algorithms=None, sizes=DEFAULT_SIZES, distributions=None, quantum=4, load=0.9,
+                   repeat=3, seed=0, progress=None):
+    results = []
+    for distribution in distributions or list(BURSTS):
+        for size in sizes:
+            processes = generate(size, "poisson", distribution, seed=seed,
+                                 arrival_params={"rate": load / BURST_MEANS[distribution]})
+            for algorithm in algorithms or registry.names():
+                entry = registry.get(algorithm)
+                params = {"quantum": quantum} if "quantum" in entry.params else {}
+                row = {"algorithm": algorithm, "size": size, "distribution": distribution, **params}
+                row.update(measure(entry.function, processes, params, repeat))
+                results.append(row)
+                if progress is not None:
+                    progress(row)
+    return results
+
+def environment():
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "machine": platform.machine(), "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+def save_baseline(results, path):
+    with open(path, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=1)
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+def _key(row):
+    return (row["algorithm"], row["size"], row["distribution"], row.get("quantum"))
+
+def compare(baseline, results, tolerance=0.25, min_seconds=0.01):
+    # Rows that got more than `tolerance` (a fraction) slower than the
+    # baseline, as (row, baseline seconds, slowdown ratio). Cases faster
+    # than `min_seconds` in both runs are timer noise and are skipped.
+    previous = {_key(row): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get(_key(row))
+        if old is None or max(old["seconds"], row["seconds"]) < min_seconds or not old["seconds"]:
+            continue
+        ratio = row["seconds"] / old["seconds"]
+        if ratio > 1 + tolerance:
+            regressions.append((row, old["seconds"], ratio))
+    return regressions
+
+def _print_row(row):
+    rate = row["events_per_second"]
+    print(f"{row['algorithm']:>8} {row['distribution']:>11} {row['size']:>9} "
+          f"{row['seconds']:>10.4f}s {row['peak_bytes'] / 2 ** 20:>9.1f} MiB "
+          f"{rate or 0:>12.0f} events/s", flush=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling algorithms on synthetic workloads.")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=registry.names(),
+                        choices=registry.names())
+    parser.add_argument("-n", "--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES),
+                        help="process counts, e.g. 1000 10000 100000 1000000 10000000")
+    parser.add_argument("-d", "--distributions", nargs="+", default=list(BURSTS), choices=list(BURSTS))
+    parser.add_argument("-q", "--quantum", type=int, default=4, help="Round Robin quantum")
+    parser.add_argument("--load", type=float, default=0.9, help="offered CPU load (arrival rate x mean burst)")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="timed runs per case (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="save the results as a JSON baseline")
+    parser.add_argument("--baseline", help="compare against this JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown against the baseline (0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.01,
+                        help="ignore cases faster than this in both runs")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.algorithms, args.sizes, args.distributions, args.quantum, args.load,
+                             args.repeat, args.seed, progress=_print_row)
+    if args.output:
+        save_baseline(results, args.output)
+    if args.baseline:
+        regressions = compare(load_baseline(args.baseline), results, args.tolerance, args.min_seconds)
+        for row, seconds, ratio in regressions:
+            print(f"REGRESSION {row['algorithm']} {row['distribution']} n={row['size']}: "
+                  f"{seconds:.4f}s -> {row['seconds']:.4f}s ({ratio:.2f}x)")
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
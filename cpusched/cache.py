@@ -0,0 +1,172 @@
+import copy
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .backend import _TABLE_COLUMNS, GanttChart, ProcessTable
+
+# Part of every key. On-disk entries outlive the code that computed them, so
+# bump this whenever a change to an engine changes its results.
+CACHE_VERSION = 2
+
+def _fits_table(processes):
+    # Whether a Process list fits ProcessTable's int64 columns; string pids or
+    # fractional times do not.
+    return all(isinstance(value, int) for p in processes
+               for value in (p.pid, p.arrival_time, p.burst_time, 0 if p.priority is None else p.priority))
+
+def fingerprint(processes, algorithm, params=None):
+    # Content hash of the input columns plus the algorithm and its parameters,
+    # so equal workloads share results however they were built. Lists that
+    # do not fit a table are hashed by the repr of their rows.
+    if not isinstance(processes, ProcessTable) and _fits_table(processes):
+        processes = ProcessTable.from_processes(processes)
+    digest = hashlib.sha256()
+    digest.update(CACHE_VERSION.to_bytes(8, "little"))
+    digest.update(len(processes).to_bytes(8, "little"))
+    if isinstance(processes, ProcessTable):
+        for column in (processes.pid, processes.arrival_time, processes.burst_time, processes.priority):
+            digest.update(column)
+    else:
+        digest.update(repr([(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]).encode())
+    digest.update(repr((algorithm, sorted((params or {}).items()))).encode())
+    return digest.hexdigest()
+
+def _algorithm_name(function):
+    return f"{function.__module__}.{function.__qualname__}"
+
+def snapshot(result):
+    # Cached results must not alias the caller's Process objects, which the
+    # next algorithm run will overwrite, so they are stored as columns, or as
+    # copies when the Process objects do not fit a table.
+    gantt, completed, *metrics = result
+    if not isinstance(completed, ProcessTable) and not _fits_table(completed):
+        return (list(gantt), [copy.copy(p) for p in completed], *metrics)
+    if not isinstance(gantt, GanttChart):
+        gantt = GanttChart.from_segments(gantt)
+    if not isinstance(completed, ProcessTable):
+        completed = ProcessTable.from_processes(completed)
+    return (gantt, completed, *metrics)
+
+def result_size(result):
+    # Bytes held by the columns of a snapshot()ed result; for one kept as
+    # Process copies, the same count per value.
+    gantt, completed = result[:2]
+    if isinstance(completed, list):
+        return 8 * (3 * len(gantt) + len(_TABLE_COLUMNS) * len(completed))
+    columns = [gantt.pid, gantt.start, gantt.end] + [getattr(completed, name) for name in _TABLE_COLUMNS]
+    return sum(memoryview(column).nbytes for column in columns)
+
+class ResultCache:
+    # LRU cache of (gantt, completed, *metrics) results keyed on fingerprint();
+    # with a directory, entries are also persisted there as pickle files and
+    # survive across processes and sessions. In memory it keeps at most
+    # maxsize entries and max_bytes of result columns; a result bigger than
+    # that only goes to the directory. The directory keeps at most max_files
+    # entries, dropping the least recently used (by mtime) first.
+    def __init__(self, maxsize=32, directory=None, max_files=1024, max_bytes=256 << 20):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        # key -> (result, result_size(result))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pickle")
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+        if self.directory is not None:
+            try:
+                with open(self._path(key), "rb") as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+            else:
+                try:
+                    os.utime(self._path(key))
+                except OSError:
+                    pass
+                self._remember(key, value)
+                with self._lock:
+                    self.hits += 1
+                return value
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _remember(self, key, value):
+        size = result_size(value)
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while len(self._entries) > self.maxsize or self.nbytes > self.max_bytes:
+                self.nbytes -= self._entries.popitem(last=False)[1][1]
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.directory is not None:
+            fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self._path(key))
+            self._evict_files()
+
+    def _evict_files(self):
+        # Several processes may share the directory and evict concurrently.
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".pickle"):
+                    try:
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+                    except OSError:
+                        pass
+        if len(entries) <= self.max_files:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - self.max_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def key(self, function, processes, **params):
+        return fingerprint(processes, _algorithm_name(function), params)
+
+    def run(self, function, processes, **params):
+        key = self.key(function, processes, **params)
+        result = self.get(key)
+        if result is None:
+            result = snapshot(function(processes, **params))
+            self.put(key, result)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+# Shared by the GUI and any other caller in this process.
+default_cache = ResultCache()
+
+def cached_run(function, processes, **params):
+    return default_cache.run(function, processes, **params)
@@ -0,0 +1,101 @@
+import argparse
+import ast
+import importlib
+import json
+import sys
+import time
+
+# python -m cpusched <command>. "run" is implemented here; the others hand
+# their arguments to the main() of the module that implements them. Each
+# command imports only what it needs: nothing but "gui" loads Tk or
+# matplotlib.
+COMMANDS = {
+    "batch": ("batch", "parallel workload x algorithm sweeps to CSV"),
+    "bench": ("bench", "benchmark the algorithms on synthetic workloads"),
+    "smp": ("smp", "multi-CPU scaling table"),
+    "generate": ("workload", "write a synthetic workload file"),
+    "gui": ("gui", "open the Tk simulator"),
+}
+
+# Table output: (row key, heading, width, format spec).
+COLUMNS = (("algorithm", "algorithm", 10, ""), ("avg_waiting_time", "avg wait", 10, ".2f"),
+           ("avg_turnaround_time", "avg turn", 10, ".2f"), ("cpu_utilization", "util %", 7, ".2f"),
+           ("throughput", "throughput", 10, ".4f"), ("seconds", "seconds", 8, ".3f"))
+SUMMARY_COLUMNS = (("p95_waiting_time", "p95 wait", 9, ""), ("p99_waiting_time", "p99 wait", 9, ""),
+                   ("avg_response_time", "avg resp", 9, ".2f"), ("context_switches", "switches", 9, ""),
+                   ("idle_time", "idle", 9, ""), ("fairness", "fairness", 8, ".3f"))
+
+def _parameters(pairs, parser):
+    params = {}
+    for pair in pairs:
+        name, _, value = pair.partition("=")
+        try:
+            params[name] = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            parser.error(f"invalid value for {name}: {value}")
+    return params
+
+def run(argv=None):
+    from . import registry
+    from .backend import SchedulingError
+    from .files import load_workload
+    from .metrics import summarize
+
+    parser = argparse.ArgumentParser(prog="python -m cpusched run",
+                                     description="Run a workload file through scheduling algorithms.")
+    parser.add_argument("workload", help="workload file (.csv, .json or .cpus)")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=registry.names(), choices=registry.names())
+    parser.add_argument("-p", "--param", nargs="*", action="extend", default=[], metavar="NAME=VALUE",
+                        help="parameters for the algorithms that accept them, e.g. quantum=4 quanta=(2,4,8)")
+    parser.add_argument("-m", "--metrics", action="store_true",
+                        help="add percentiles, response time, context switches, idle time and fairness")
+    parser.add_argument("-f", "--format", choices=("table", "json"), default="table")
+    args = parser.parse_args(argv)
+    given = _parameters(args.param, parser)
+
+    processes = load_workload(args.workload)
+    columns = COLUMNS + (SUMMARY_COLUMNS if args.metrics else ())
+    rows = []
+    if args.format == "table":
+        print(" ".join(f"{heading:>{width}}" for _, heading, width, _ in columns))
+    for name in args.algorithms:
+        algorithm = registry.get(name)
+        params = {key: value for key, value in given.items() if key in algorithm.params}
+        row = {"algorithm": name, **params}
+        started = time.perf_counter()
+        try:
+            gantt, completed, *metrics = algorithm.run(processes, **params)
+            seconds = time.perf_counter() - started
+            summary = summarize(gantt, completed).summary() if args.metrics else {}
+        except (SchedulingError, ValueError, TypeError) as e:
+            row["error"] = str(e)
+            rows.append(row)
+            print(f"{name}: {e}", file=sys.stderr)
+            continue
+        row["seconds"] = seconds
+        row.update(zip(("avg_waiting_time", "avg_turnaround_time", "cpu_utilization", "throughput"), metrics))
+        row.update(summary)
+        rows.append(row)
+        if args.format == "table":
+            print(" ".join(f"{row[key]:>{width}{spec}}" for key, _, width, spec in columns), flush=True)
+    if args.format == "json":
+        json.dump(rows, sys.stdout, indent=1)
+        print()
+    return 0
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    commands = "\n".join(f"  {name:<9} {help}" for name, (_, help) in
+                         [("run", (None, "run a workload file through chosen algorithms"))] + list(COMMANDS.items()))
+    parser = argparse.ArgumentParser(prog="python -m cpusched", description="CPU scheduling simulator.",
+                                     epilog=f"commands:\n{commands}\n\n"
+                                            "python -m cpusched <command> -h shows a command's options.",
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["run"] + list(COMMANDS), metavar="command")
+    args = parser.parse_args(argv[:1])
+    if args.command == "run":
+        return run(argv[1:])
+    module = importlib.import_module(f".{COMMANDS[args.command][0]}", __package__)
+    if args.command == "gui":
+        return module.main()
+    return module.main(argv[1:])
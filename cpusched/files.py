@@ -0,0 +1,207 @@
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from .backend import GanttChart, ProcessTable
+
+FIELDS = ("pid", "arrival_time", "burst_time", "priority")
+
+# Binary format (.cpus), version 1, all integers little-endian:
+#   header   magic b"CPUSCHED", version u16, kind u16, column count u16,
+#            reserved u16, row count u64
+#   names    16-byte NUL-padded ASCII name per column
+#   padding  up to the next multiple of 64 bytes
+#   columns  one int64 array of `row count` values per column, back to back
+# Columns are fixed width and aligned, so read_binary maps them straight
+# from the file with mmap instead of parsing anything.
+BINARY_EXTENSION = ".cpus"
+BINARY_MAGIC = b"CPUSCHED"
+BINARY_VERSION = 1
+WORKLOAD, RESULTS, GANTT = 1, 2, 3
+BINARY_COLUMNS = {
+    WORKLOAD: FIELDS,
+    RESULTS: FIELDS + ("completion_time", "waiting_time", "turnaround_time"),
+    GANTT: ("pid", "start", "end"),
+}
+_HEADER = struct.Struct("<8sHHHHQ")
+
+def _optional_int(value):
+    value = value.strip()
+    if value in ("", "-"):
+        return None
+    return int(value)
+
+def _check_pids(path, pids):
+    # Results and response times are matched to processes by pid.
+    seen = set()
+    for pid in pids:
+        if pid in seen:
+            raise ValueError(f"{path}: duplicate pid {pid}")
+        seen.add(pid)
+
+def iter_csv(path):
+    # Yields (pid, arrival_time, burst_time, priority) tuples one row at a
+    # time. The header row names the columns; pid defaults to the row number
+    # and priority may be left empty (or "-") for processes without one.
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = {name.strip(): i for i, name in enumerate(next(reader, ()))}
+        missing = {"arrival_time", "burst_time"} - set(header)
+        if missing:
+            raise ValueError(f"{path}: missing column(s) {', '.join(sorted(missing))}")
+        pid_column = header.get("pid")
+        arrival_column = header["arrival_time"]
+        burst_column = header["burst_time"]
+        priority_column = header.get("priority")
+        for number, row in enumerate(reader, 1):
+            if not row:
+                continue
+            pid = _optional_int(row[pid_column]) if pid_column is not None else None
+            yield (number if pid is None else pid,
+                   int(row[arrival_column]),
+                   int(row[burst_column]),
+                   _optional_int(row[priority_column]) if priority_column is not None else None)
+
+def read_csv(path):
+    pids, arrival_times, burst_times, priorities = [], [], [], []
+    for pid, arrival_time, burst_time, priority in iter_csv(path):
+        pids.append(pid)
+        arrival_times.append(arrival_time)
+        burst_times.append(burst_time)
+        priorities.append(priority)
+    _check_pids(path, pids)
+    return ProcessTable(pids, arrival_times, burst_times, priorities)
+
+def write_csv(processes, path):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for p in processes:
+            writer.writerow((p.pid, p.arrival_time, p.burst_time, "" if p.priority is None else p.priority))
+
+def read_json(path):
+    # Either column lists ({"pid": [...], "arrival_time": [...], ...}) or a
+    # list of per-process objects with the same keys.
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        columns = data
+    else:
+        columns = {field: [record.get(field) for record in data] for field in FIELDS}
+    arrival_times = columns["arrival_time"]
+    pids = columns.get("pid") or [None] * len(arrival_times)
+    pids = [number if pid is None else pid for number, pid in enumerate(pids, 1)]
+    _check_pids(path, pids)
+    return ProcessTable(pids, arrival_times, columns["burst_time"], columns.get("priority"))
+
+def write_json(processes, path):
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_processes(processes)
+    with open(path, "w") as f:
+        json.dump({"pid": processes.pid.tolist(),
+                   "arrival_time": processes.arrival_time.tolist(),
+                   "burst_time": processes.burst_time.tolist(),
+                   "priority": [p.priority for p in processes]}, f)
+
+def _write_binary(path, kind, columns):
+    names = BINARY_COLUMNS[kind]
+    rows = len(columns[0])
+    header = _HEADER.pack(BINARY_MAGIC, BINARY_VERSION, kind, len(names), 0, rows)
+    header += b"".join(name.encode("ascii").ljust(16, b"\0") for name in names)
+    header += b"\0" * (-len(header) % 64)
+    with open(path, "wb") as f:
+        f.write(header)
+        for column in columns:
+            if len(column) != rows:
+                raise ValueError("all columns must have the same length")
+            if (not isinstance(column, (array, memoryview)) or memoryview(column).format != 'q'
+                    or sys.byteorder != "little"):
+                column = array('q', column)
+                if sys.byteorder != "little":
+                    column.byteswap()
+            f.write(column)
+
+def write_workload_binary(processes, path):
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_processes(processes)
+    _write_binary(path, WORKLOAD, [getattr(processes, name) for name in BINARY_COLUMNS[WORKLOAD]])
+
+def write_results_binary(completed, path):
+    if not isinstance(completed, ProcessTable):
+        completed = ProcessTable.from_processes(completed)
+    _write_binary(path, RESULTS, [getattr(completed, name) for name in BINARY_COLUMNS[RESULTS]])
+
+def write_gantt_binary(gantt, path):
+    if not isinstance(gantt, GanttChart):
+        gantt = GanttChart.from_segments(gantt)
+    _write_binary(path, GANTT, [gantt.pid, gantt.start, gantt.end])
+
+def _zeros(rows):
+    # Anonymous mappings are zero-filled on demand, so unused result columns
+    # of a huge workload cost address space rather than memory.
+    if not rows:
+        return array('q')
+    return memoryview(mmap.mmap(-1, 8 * rows)).cast('q')
+
+def read_binary(path):
+    # Returns a ProcessTable (workload or results file) or a GanttChart whose
+    # columns are read-only int64 memoryviews over a private mmap of the file.
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapped) < _HEADER.size:
+        raise ValueError(f"{path}: not a {BINARY_EXTENSION} file")
+    magic, version, kind, column_count, _, rows = _HEADER.unpack_from(mapped)
+    if magic != BINARY_MAGIC:
+        raise ValueError(f"{path}: not a {BINARY_EXTENSION} file")
+    if version != BINARY_VERSION or kind not in BINARY_COLUMNS:
+        raise ValueError(f"{path}: unsupported version {version} / kind {kind}")
+    names = [mapped[_HEADER.size + 16 * i:_HEADER.size + 16 * (i + 1)].rstrip(b"\0").decode("ascii")
+             for i in range(column_count)]
+    offset = _HEADER.size + 16 * column_count
+    offset += -offset % 64
+    if len(mapped) < offset + 8 * rows * column_count:
+        raise ValueError(f"{path}: truncated file")
+    view = memoryview(mapped)
+    columns = {}
+    for name in names:
+        column = view[offset:offset + 8 * rows].cast('q')
+        if sys.byteorder != "little":
+            column = array('q', column)
+            column.byteswap()
+        columns[name] = column
+        offset += 8 * rows
+
+    if kind == GANTT:
+        result = GanttChart.__new__(GanttChart)
+    else:
+        result = ProcessTable.__new__(ProcessTable)
+        if kind == WORKLOAD:
+            for name in ("completion_time", "waiting_time", "turnaround_time"):
+                columns[name] = _zeros(rows)
+    for name, column in columns.items():
+        setattr(result, name, column)
+    return result
+
+def load_workload(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return read_csv(path)
+    if extension == ".json":
+        return read_json(path)
+    if extension == BINARY_EXTENSION:
+        return read_binary(path)
+    raise ValueError(f"{path}: unsupported workload format '{extension}'")
+
+def save_workload(processes, path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return write_csv(processes, path)
+    if extension == ".json":
+        return write_json(processes, path)
+    if extension == BINARY_EXTENSION:
+        return write_workload_binary(processes, path)
+    raise ValueError(f"{path}: unsupported workload format '{extension}'")
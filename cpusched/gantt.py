@@ -0,0 +1,109 @@
+from itertools import chain
+
+import numpy as np
+from matplotlib.collections import PolyCollection
+
+from .backend import GanttChart
+
+def gantt_columns(gantt):
+    if isinstance(gantt, GanttChart):
+        return (np.frombuffer(gantt.pid, dtype=np.int64),
+                np.frombuffer(gantt.start, dtype=np.int64),
+                np.frombuffer(gantt.end, dtype=np.int64))
+    # Straight from the tuples into one array, without an intermediate list.
+    count = 3 * len(gantt) if hasattr(gantt, "__len__") else -1
+    segments = np.fromiter(chain.from_iterable(gantt), dtype=np.int64, count=count).reshape(-1, 3)
+    return segments[:, 0], segments[:, 1], segments[:, 2]
+
+def merge_segments(pids, starts, ends):
+    # Joins consecutive segments of the same process that touch end to start.
+    if not len(pids):
+        return pids, starts, ends
+    first = np.ones(len(pids), dtype=bool)
+    first[1:] = (pids[1:] != pids[:-1]) | (starts[1:] != ends[:-1])
+    heads = np.flatnonzero(first)
+    tails = np.append(heads[1:] - 1, len(pids) - 1)
+    return pids[heads], starts[heads], ends[tails]
+
+def coalesce(rows, starts, ends, resolution):
+    # Level of detail: per row (a pid, or a band of pids), segments separated
+    # by less than `resolution` time units (about one pixel) are drawn as one
+    # span. Spans in a row are over a pixel apart, so a row holds at most
+    # one per pixel of plot width.
+    if not len(rows):
+        return rows, starts, ends
+    order = np.lexsort((starts, rows))
+    rows, starts, ends = rows[order], starts[order], ends[order]
+    new_row = np.empty(len(rows), dtype=bool)
+    new_row[0] = True
+    new_row[1:] = rows[1:] != rows[:-1]
+    # Running max of the ends within each row, so a long span swallows the
+    # shorter ones of other pids in its band. Offsetting each row past the
+    # previous one lets a single accumulate do every row at once.
+    offset = (np.cumsum(new_row) - 1) * (int(ends.max() - starts.min()) + 1)
+    reach = np.maximum.accumulate(ends - starts.min() + offset) - offset + starts.min()
+    first = new_row.copy()
+    first[1:] |= starts[1:] - reach[:-1] > resolution
+    heads = np.flatnonzero(first)
+    return rows[heads], starts[heads], np.maximum.reduceat(ends, heads)
+
+class GanttPlot:
+    # Draws a Gantt chart on a matplotlib Axes as a single PolyCollection and
+    # re-renders the visible window at pixel resolution whenever the limits
+    # change, so zooming and panning stay cheap with millions of segments.
+    # When pids are closer than a pixel apart they are drawn in one-pixel
+    # bands, so the rectangle count is bounded by the plot size in pixels.
+    def __init__(self, ax, gantt, color="#4a90e2", label_min_pixels=24, max_labels=200):
+        self.ax = ax
+        self.color = color
+        self.label_min_pixels = label_min_pixels
+        self.max_labels = max_labels
+        self.pids, self.starts, self.ends = merge_segments(*gantt_columns(gantt))
+        self._artists = []
+        if len(self.pids):
+            ax.set_xlim(self.starts.min(), max(self.ends.max(), self.starts.min() + 1))
+            ax.set_ylim(self.pids.min() - 1, self.pids.max() + 1)
+        self.render()
+        ax.callbacks.connect("xlim_changed", lambda ax: self.render())
+        ax.callbacks.connect("ylim_changed", lambda ax: self.render())
+
+    def render(self):
+        for artist in self._artists:
+            artist.remove()
+        self._artists = []
+        if not len(self.pids):
+            return
+        left, right = self.ax.get_xlim()
+        resolution = (right - left) / max(self.ax.bbox.width, 1)
+        bottom, top = sorted(self.ax.get_ylim())
+        band = (top - bottom) / max(self.ax.bbox.height, 1)
+        visible = ((self.ends >= left) & (self.starts <= right)
+                   & (self.pids >= bottom - 0.5) & (self.pids <= top + 0.5))
+        pids, starts, ends = self.pids[visible], self.starts[visible], self.ends[visible]
+        if band > 1:
+            rows = ((pids - bottom) // band).astype(np.int64)
+            rows, starts, ends = coalesce(rows, starts, ends, resolution)
+            lower = bottom + rows * band
+            upper = lower + band
+        else:
+            pids, starts, ends = coalesce(pids, starts, ends, resolution)
+            lower = pids - 0.4
+            upper = pids + 0.4
+
+        verts = np.empty((len(starts), 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = starts
+        verts[:, 2, 0] = verts[:, 3, 0] = ends
+        verts[:, 0, 1] = verts[:, 3, 1] = lower
+        verts[:, 1, 1] = verts[:, 2, 1] = upper
+        bars = PolyCollection(verts, facecolors=self.color, edgecolors="none")
+        self.ax.add_collection(bars)
+        self._artists.append(bars)
+
+        if band > 1:
+            # Bands hold many pids; no single one to label.
+            return
+        wide = np.flatnonzero((ends - starts) >= self.label_min_pixels * resolution)
+        if len(wide) <= self.max_labels:
+            for i in wide:
+                self._artists.append(self.ax.text((starts[i] + ends[i]) / 2, pids[i], str(pids[i]),
+                                                  ha='center', va='center', color="white"))
@@ -0,0 +1,503 @@
+import ast
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox, simpledialog, filedialog
+from . import registry
+from .backend import NO_PRIORITY, ProcessTable
+from .cache import default_cache
+from .files import load_workload, write_gantt_binary, write_results_binary
+from .metrics import summarize
+from .profiling import Profiler
+from .worker import SimulationWorker
+
+def _plotting():
+    # matplotlib is only imported, with the Tk backend, when the first chart
+    # is drawn, so the window opens without paying for it.
+    import matplotlib
+    matplotlib.use("TkAgg")
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    from .gantt import GanttPlot
+    return plt, FigureCanvasTkAgg, NavigationToolbar2Tk, GanttPlot
+
+class VirtualTable:
+    # A Treeview that only holds the rows currently on screen. Row values are
+    # fetched from get_row(index) as the view scrolls, so it can page through
+    # millions of processes kept in columnar form.
+    def __init__(self, master, columns, height=5):
+        self.tree = ttk.Treeview(master, columns=[name for name, _, _ in columns], show="headings", height=height)
+        for name, heading, width in columns:
+            self.tree.heading(name, text=heading)
+            self.tree.column(name, width=width)
+        self.scrollbar = ttk.Scrollbar(master, orient="vertical", command=self.scroll)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.tree.bind("<Configure>", lambda event: self.refresh())
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll("scroll", -1 if event.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda event: self.scroll("scroll", -1, "units"))
+        self.tree.bind("<Button-5>", lambda event: self.scroll("scroll", 1, "units"))
+        self.get_row = None
+        self.count = 0
+        self.first = 0
+
+    def set_source(self, get_row, count, first=0):
+        self.get_row = get_row
+        self.count = count
+        self.first = first
+        self.refresh()
+
+    def visible_rows(self):
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        return max(int(self.tree.cget("height")), self.tree.winfo_height() // row_height)
+
+    def scroll(self, action, amount, unit=None):
+        rows = self.visible_rows()
+        if action == "moveto":
+            self.first = int(float(amount) * self.count)
+        else:
+            self.first += int(amount) * (rows if unit == "pages" else 1)
+        self.refresh()
+
+    def refresh(self):
+        rows = self.visible_rows()
+        self.first = max(0, min(self.first, self.count - rows))
+        self.tree.delete(*self.tree.get_children())
+        for index in range(self.first, min(self.first + rows, self.count)):
+            self.tree.insert("", "end", values=self.get_row(index))
+        if self.count:
+            self.scrollbar.set(self.first / self.count, min(1.0, (self.first + rows) / self.count))
+        else:
+            self.scrollbar.set(0, 1)
+
+class SchedulerApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("CPU Scheduling Simulator")
+        self.root.geometry("1200x800")
+        self.processes = ProcessTable()
+        self.results = {}
+        self.worker = SimulationWorker()
+        self.pending = {}
+        # Algorithms being profiled on a background thread.
+        self.profiling = set()
+
+        # Apply a modern theme
+        style = ttk.Style()
+        style.theme_use("clam")
+        style.configure("TButton", font=("Helvetica", 10), padding=5)
+        style.configure("TLabel", font=("Helvetica", 12))
+        style.configure("TCheckbutton", font=("Helvetica", 10))
+
+        # Main container
+        self.main_frame = ttk.Frame(self.root, padding="10", style="Main.TFrame")
+        self.main_frame.grid(row=0, column=0, sticky="nsew")
+        self.root.rowconfigure(0, weight=1)
+        self.root.columnconfigure(0, weight=1)
+
+        style.configure("Main.TFrame", background="#f0f0f0")
+
+        # Title banner
+        title_label = ttk.Label(self.main_frame, text="CPU Scheduling Simulator", font=("Helvetica", 16, "bold"), 
+                                background="#4a90e2", foreground="white", padding=10)
+        title_label.grid(row=0, column=0, columnspan=2, sticky="ew")
+
+        # Frames
+        self.input_frame = ttk.LabelFrame(self.main_frame, text="Process Input", padding="10")
+        self.input_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
+        self.control_frame = ttk.LabelFrame(self.main_frame, text="Scheduling Options", padding="10")
+        self.control_frame.grid(row=1, column=1, sticky="nsew", padx=10, pady=5)
+        self.output_frame = ttk.LabelFrame(self.main_frame, text="Simulation Results", padding="10")
+        self.output_frame.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
+
+        self.main_frame.rowconfigure(2, weight=1)
+        self.main_frame.columnconfigure(0, weight=1)
+        self.main_frame.columnconfigure(1, weight=1)
+
+        # Input Frame
+        self.process_view = VirtualTable(self.input_frame, [("PID", "PID", 50), ("Arrival", "Arrival Time", 100),
+                                                            ("Burst", "Burst Time", 100), ("Priority", "Priority", 100)])
+        self.process_view.set_source(self.process_row, 0)
+        self.input_frame.rowconfigure(0, weight=1)
+        self.input_frame.columnconfigure(0, weight=1)
+
+        button_frame = ttk.Frame(self.input_frame)
+        button_frame.grid(row=1, column=0, columnspan=2, sticky="ew")
+        ttk.Button(button_frame, text="Add Process", command=self.add_process).pack(side=tk.LEFT, pady=5)
+        ttk.Button(button_frame, text="Import...", command=self.import_processes).pack(side=tk.LEFT, padx=5, pady=5)
+        ttk.Button(button_frame, text="Clear Processes", command=self.clear_processes).pack(side=tk.RIGHT, pady=5)
+
+        # Control Frame: one checkbox per registered algorithm, then one entry
+        # per parameter name, shared by the algorithms that accept it.
+        self.algorithms = {algorithm.label: algorithm for algorithm in registry.algorithms()}
+        self.algo_vars = {}
+        for i, algo in enumerate(self.algorithms):
+            var = tk.BooleanVar()
+            ttk.Checkbutton(self.control_frame, text=algo, variable=var).grid(row=i, column=0, sticky="w", pady=2)
+            self.algo_vars[algo] = var
+        row = len(self.algorithms)
+        self.param_entries = {}
+        for algorithm in self.algorithms.values():
+            for name, default in algorithm.params.items():
+                if name in self.param_entries:
+                    continue
+                users = [other.label for other in self.algorithms.values() if name in other.params]
+                ttk.Label(self.control_frame, text=f"{name.replace('_', ' ').capitalize()} (for {', '.join(users)}):"
+                          ).grid(row=row, column=0, sticky="w", pady=5)
+                entry = ttk.Entry(self.control_frame, width=10)
+                entry.grid(row=row, column=1, sticky="w")
+                entry.insert(0, repr(default))
+                self.param_entries[name] = entry
+                row += 1
+        self.run_button = ttk.Button(self.control_frame, text="Run Simulation", command=self.run_simulation, style="Accent.TButton")
+        self.run_button.grid(row=row, column=0, pady=10)
+        self.cancel_button = ttk.Button(self.control_frame, text="Cancel", command=self.cancel_simulation, state="disabled")
+        self.cancel_button.grid(row=row, column=1, pady=10)
+        style.configure("Accent.TButton", background="#4a90e2", foreground="white")
+        self.progress = ttk.Progressbar(self.control_frame, mode="determinate")
+        self.progress.grid(row=row + 1, column=0, columnspan=2, sticky="ew")
+        self.status_label = ttk.Label(self.control_frame, text="", font=("Helvetica", 10))
+        self.status_label.grid(row=row + 2, column=0, columnspan=2, sticky="w")
+
+        # Output Frame
+        self.notebook = ttk.Notebook(self.output_frame)
+        self.notebook.grid(row=0, column=0, sticky="nsew")
+        self.output_frame.rowconfigure(0, weight=1)
+        self.output_frame.columnconfigure(0, weight=1)
+
+    def process_row(self, index):
+        priority = self.processes.priority[index]
+        return (self.processes.pid[index], self.processes.arrival_time[index], self.processes.burst_time[index],
+                "-" if priority == NO_PRIORITY else priority)
+
+    def add_process(self):
+        pid = max(self.processes.pid, default=0) + 1
+        arrival = simpledialog.askinteger("Input", f"Arrival Time for P{pid} (non-negative):", minvalue=0, parent=self.root)
+        if arrival is None:
+            messagebox.showwarning("Cancelled", "Process addition cancelled at Arrival Time.")
+            return
+        burst = simpledialog.askinteger("Input", f"Burst Time for P{pid} (positive):", minvalue=1, parent=self.root)
+        if burst is None:
+            messagebox.showwarning("Cancelled", "Process addition cancelled at Burst Time.")
+            return
+        priority_input = simpledialog.askstring("Input", f"Priority for P{pid} (lower is higher, press Cancel to skip):", parent=self.root)
+        if priority_input is None or priority_input.strip() == "":
+            priority = None
+        else:
+            try:
+                priority = int(priority_input)
+                if priority < 0:
+                    messagebox.showerror("Error", "Priority cannot be negative.")
+                    return
+            except ValueError:
+                messagebox.showerror("Error", "Invalid priority value. Must be a non-negative integer.")
+                return
+        self.processes.append(pid, arrival, burst, priority)
+        self.process_view.set_source(self.process_row, len(self.processes), first=len(self.processes))
+        messagebox.showinfo("Success", f"Process P{pid} added successfully!")
+
+    def import_processes(self):
+        path = filedialog.askopenfilename(parent=self.root, title="Import Processes",
+                                          filetypes=[("Workloads", "*.csv *.json *.cpus"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            self.processes = load_workload(path)
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror("Error", f"Could not import {path}: {e}")
+            return
+        self.process_view.set_source(self.process_row, len(self.processes))
+        self.status_label.config(text=f"Imported {len(self.processes)} processes.")
+
+    def clear_processes(self):
+        self.processes = ProcessTable()
+        self.process_view.set_source(self.process_row, 0)
+
+    def run_simulation(self):
+        if not self.processes:
+            messagebox.showerror("Error", "No processes added!")
+            return
+        selected_algos = [algo for algo, var in self.algo_vars.items() if var.get()]
+        if not selected_algos:
+            messagebox.showerror("Error", "No algorithms selected!")
+            return
+        values = {}
+        for name, entry in self.param_entries.items():
+            try:
+                values[name] = ast.literal_eval(entry.get().strip())
+            except (ValueError, SyntaxError):
+                messagebox.showerror("Error", f"Invalid {name.replace('_', ' ')}: {entry.get()}")
+                return
+
+        self.results.clear()
+        for tab in self.notebook.winfo_children():
+            tab.destroy()
+
+        # Every algorithm is needed for the comparison tab; cached results are
+        # used directly and the rest run in the background worker.
+        self.selected_algos = selected_algos
+        self.outcomes = {}
+        self.pending = {}
+        self.run_params = {}
+        self.run_table = table = self.processes
+        jobs = []
+        for algo, algorithm in self.algorithms.items():
+            function = algorithm.function
+            params = self.run_params[algo] = {name: values[name] for name in algorithm.params}
+            key = default_cache.key(function, table, **params)
+            result = default_cache.get(key)
+            if result is not None:
+                self.outcomes[algo] = result
+            else:
+                self.pending[algo] = key
+                jobs.append((algo, function, table, params))
+
+        if not jobs:
+            self.show_results()
+            return
+        self.worker.submit(jobs)
+        self.run_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.progress.config(maximum=len(jobs), value=0)
+        self.status_label.config(text=f"Running 0/{len(jobs)}...")
+        self.root.after(50, self.poll_simulation)
+
+    def poll_simulation(self):
+        if not self.pending:
+            return
+        for kind, algo, payload in self.worker.poll():
+            if kind == "error":
+                self.cancel_simulation()
+                messagebox.showerror("Error", f"{algo} failed: {payload}")
+                return
+            default_cache.put(self.pending.pop(algo), payload)
+            self.outcomes[algo] = payload
+        self.progress.config(value=self.worker.finished)
+        self.status_label.config(text=f"Running {self.worker.finished}/{self.worker.total}...")
+        if self.pending:
+            self.root.after(50, self.poll_simulation)
+        else:
+            self.finish_simulation("")
+            self.show_results()
+
+    def cancel_simulation(self):
+        self.worker.cancel()
+        self.pending = {}
+        self.finish_simulation("Cancelled.")
+
+    def finish_simulation(self, status):
+        self.run_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        self.progress.config(value=0)
+        self.status_label.config(text=status)
+
+    def show_results(self):
+        for algo in self.selected_algos:
+            gantt, completed, *metrics = self.outcomes[algo]
+            self.results[algo] = metrics
+            self.create_result_tab(algo, gantt, completed, metrics)
+        for algo, (_, _, *metrics) in self.outcomes.items():
+            self.results.setdefault(algo, metrics)
+        self.create_comparison_tab()
+
+    def create_result_tab(self, algo, gantt, completed, metrics):
+        tab = ttk.Frame(self.notebook)
+        self.notebook.add(tab, text=algo)
+
+        # Gantt Chart
+        plt, FigureCanvasTkAgg, NavigationToolbar2Tk, GanttPlot = _plotting()
+        fig, ax = plt.subplots(figsize=(5, 2))
+        GanttPlot(ax, gantt)
+        ax.set_xlabel("Time")
+        ax.set_ylabel("PID")
+        ax.set_title(f"{algo} Gantt Chart", fontsize=10)
+        ax.grid(axis="x", linestyle="--", alpha=0.7)
+        canvas = FigureCanvasTkAgg(fig, master=tab)
+        canvas.draw()
+        toolbar = NavigationToolbar2Tk(canvas, tab, pack_toolbar=False)
+        toolbar.update()
+        toolbar.pack(side=tk.TOP, fill=tk.X, padx=5)
+        canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=0, padx=5, pady=5)
+
+        # Process Table
+        table_frame = ttk.Frame(tab)
+        table_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=1, padx=5, pady=5)
+        view = VirtualTable(table_frame, [("PID", "PID", 50), ("Arrival", "Arrival", 80), ("Burst", "Burst", 80),
+                                          ("Completion", "Completion", 100), ("Waiting", "Waiting", 80),
+                                          ("Turnaround", "Turnaround", 100)])
+        table_frame.rowconfigure(0, weight=1)
+        table_frame.columnconfigure(0, weight=1)
+        columns = (completed.pid, completed.arrival_time, completed.burst_time,
+                   completed.completion_time, completed.waiting_time, completed.turnaround_time)
+        view.set_source(lambda index: tuple(column[index] for column in columns), len(completed))
+
+        # Metrics
+        metrics_frame = ttk.Frame(tab)
+        metrics_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=5, pady=5)
+        ttk.Label(metrics_frame, text=f"Avg Waiting: {metrics[0]:.2f}", font=("Helvetica", 10)).pack(pady=2)
+        ttk.Label(metrics_frame, text=f"Avg Turnaround: {metrics[1]:.2f}", font=("Helvetica", 10)).pack(pady=2)
+        ttk.Label(metrics_frame, text=f"CPU Util: {metrics[2]:.2f}%", font=("Helvetica", 10)).pack(pady=2)
+        ttk.Label(metrics_frame, text=f"Throughput: {metrics[3]:.4f}", font=("Helvetica", 10)).pack(pady=2)
+        try:
+            summary = summarize(gantt, completed).summary()
+        except ValueError as e:
+            texts = (f"No detailed metrics: {e}",)
+        else:
+            texts = (f"P50/P95/P99 Waiting: {summary['p50_waiting_time']}/{summary['p95_waiting_time']}/"
+                     f"{summary['p99_waiting_time']}",
+                     f"P95 Turnaround: {summary['p95_turnaround_time']}",
+                     f"Avg Response: {summary['avg_response_time']:.2f} (P95 {summary['p95_response_time']})",
+                     f"Context Switches: {summary['context_switches']}",
+                     f"Idle Time: {summary['idle_time']}",
+                     f"Fairness (Jain): {summary['fairness']:.3f}")
+        for text in texts:
+            ttk.Label(metrics_frame, text=text, font=("Helvetica", 10)).pack(pady=2)
+        ttk.Button(metrics_frame, text="Export Chart", command=lambda: fig.savefig(f"{algo}_gantt.png")).pack(pady=5)
+        ttk.Button(metrics_frame, text="Export Results",
+                   command=lambda: self.export_results(algo, gantt, completed)).pack(pady=5)
+        ttk.Button(metrics_frame, text="Profile", command=lambda: self.show_profile(algo)).pack(pady=5)
+
+    def export_results(self, algo, gantt, completed):
+        try:
+            write_results_binary(completed, f"{algo}_results.cpus")
+            write_gantt_binary(gantt, f"{algo}_gantt.cpus")
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not export {algo} results: {e}")
+            return
+        self.status_label.config(text=f"Saved {algo}_results.cpus and {algo}_gantt.cpus.")
+
+    def show_profile(self, algo):
+        # Reruns the algorithm under a Profiler on a background thread, so the
+        # Tk loop stays responsive, and shows where the time went once the
+        # report arrives: per-phase calls and time, counters, queue lengths.
+        algorithm = self.algorithms[algo]
+        if not algorithm.accepts("profiler"):
+            messagebox.showerror("Error", f"{algo} does not support profiling.")
+            return
+        if algo in self.profiling:
+            return
+        table, params = self.run_table, self.run_params[algo]
+        outcome = queue.Queue()
+
+        def profile():
+            # Touches no Tk state; poll_profile() picks up the outcome.
+            profiler = Profiler()
+            try:
+                algorithm.function(table, **params, profiler=profiler)
+            except Exception as e:
+                outcome.put(("error", e))
+            else:
+                outcome.put(("result", profiler))
+
+        self.profiling.add(algo)
+        self.status_label.config(text=f"Profiling {algo}...")
+        threading.Thread(target=profile, name=f"profile-{algo}", daemon=True).start()
+        self.root.after(50, self.poll_profile, algo, outcome)
+
+    def poll_profile(self, algo, outcome):
+        try:
+            kind, payload = outcome.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self.poll_profile, algo, outcome)
+            return
+        self.profiling.discard(algo)
+        self.status_label.config(text="")
+        if kind == "error":
+            messagebox.showerror("Error", f"{algo} failed: {payload}")
+            return
+        self.create_profile_window(algo, payload)
+
+    def create_profile_window(self, algo, profiler):
+        report = profiler.to_dict()
+        window = tk.Toplevel(self.root)
+        window.title(f"{algo} Profile")
+        run = report["runs"][-1]
+        rate = run["events_per_second"] or 0
+        ttk.Label(window, text=f"{run['steps']} steps in {run['seconds']:.3f}s ({rate:.0f} events/s)",
+                  font=("Helvetica", 10)).pack(padx=10, pady=5)
+        tree = ttk.Treeview(window, columns=("Phase", "Calls", "Time", "Share"), show="headings",
+                            height=len(report["phases"]))
+        for name, width in (("Phase", 100), ("Calls", 100), ("Time", 100), ("Share", 80)):
+            tree.heading(name, text=name)
+            tree.column(name, width=width)
+        for name, phase in report["phases"].items():
+            tree.insert("", "end", values=(name, phase["calls"], f"{phase['seconds'] * 1000:.1f} ms",
+                                           f"{phase['share'] * 100:.1f}%"))
+        tree.pack(fill=tk.BOTH, expand=1, padx=10, pady=5)
+        counters = ", ".join(f"{name}: {value}" for name, value in report["counters"].items())
+        ttk.Label(window, text=counters, font=("Helvetica", 10)).pack(padx=10, pady=2)
+        queue = report["queue_length"]
+        ttk.Label(window, text=f"Runnable processes: mean {queue['mean']:.1f}, p50 {queue['p50']}, "
+                               f"p95 {queue['p95']}, p99 {queue['p99']}, max {queue['max']}",
+                  font=("Helvetica", 10)).pack(padx=10, pady=2)
+        button_frame = ttk.Frame(window)
+        button_frame.pack(pady=5)
+        ttk.Button(button_frame, text="Export JSON",
+                   command=lambda: self.export_profile(window, profiler.write_json, algo, ".json")
+                   ).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Export Chrome Trace",
+                   command=lambda: self.export_profile(window, profiler.write_chrome_trace, algo, ".trace.json")
+                   ).pack(side=tk.LEFT, padx=5)
+
+    def export_profile(self, window, write, algo, extension):
+        path = filedialog.asksaveasfilename(parent=window, initialfile=f"{algo}_profile{extension}",
+                                            filetypes=[("JSON", "*.json"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            write(path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not save {path}: {e}")
+            return
+        self.status_label.config(text=f"Saved {path}.")
+
+    def create_comparison_tab(self):
+        tab = ttk.Frame(self.notebook)
+        self.notebook.add(tab, text="Comparison")
+
+        # Comparison Frame
+        comparison_frame = ttk.Frame(tab)
+        comparison_frame.pack(fill=tk.BOTH, expand=1, padx=10, pady=10)
+
+        # Header
+        ttk.Label(comparison_frame, text="Algorithm Comparison", font=("Helvetica", 14, "bold")).grid(row=0, column=0, columnspan=6, pady=5)
+        ttk.Label(comparison_frame, text="Algorithm", font=("Helvetica", 10, "bold")).grid(row=1, column=0, sticky="w", padx=5)
+        ttk.Label(comparison_frame, text="Avg Waiting", font=("Helvetica", 10, "bold")).grid(row=1, column=1, sticky="w", padx=5)
+        ttk.Label(comparison_frame, text="Avg Turnaround", font=("Helvetica", 10, "bold")).grid(row=1, column=2, sticky="w", padx=5)
+        ttk.Label(comparison_frame, text="CPU Util (%)", font=("Helvetica", 10, "bold")).grid(row=1, column=3, sticky="w", padx=5)
+        ttk.Label(comparison_frame, text="Throughput", font=("Helvetica", 10, "bold")).grid(row=1, column=4, sticky="w", padx=5)
+        ttk.Label(comparison_frame, text="Optimal", font=("Helvetica", 10, "bold")).grid(row=1, column=5, sticky="w", padx=5)
+
+        # Determine the optimal algorithm
+        optimal_algo = min(self.results, key=lambda algo: self.results[algo][0] + self.results[algo][1])
+        
+        # Data for all algorithms
+        for i, algo in enumerate(self.algorithms):
+            wait, turn, cpu, throughput = self.results[algo]
+            is_optimal = algo == optimal_algo
+            optimality_text = "Yes" if is_optimal else "No"
+            ttk.Label(comparison_frame, text=algo).grid(row=i+2, column=0, sticky="w", padx=5, pady=2)
+            ttk.Label(comparison_frame, text=f"{wait:.2f}").grid(row=i+2, column=1, sticky="w", padx=5, pady=2)
+            ttk.Label(comparison_frame, text=f"{turn:.2f}").grid(row=i+2, column=2, sticky="w", padx=5, pady=2)
+            ttk.Label(comparison_frame, text=f"{cpu:.2f}").grid(row=i+2, column=3, sticky="w", padx=5, pady=2)
+            ttk.Label(comparison_frame, text=f"{throughput:.4f}").grid(row=i+2, column=4, sticky="w", padx=5, pady=2)
+            ttk.Label(comparison_frame, text=optimality_text, foreground="green" if is_optimal else "red").grid(row=i+2, column=5, sticky="w", padx=5, pady=2)
+
+    def save_results(self):
+        with open("scheduling_results.txt", "w") as f:
+            for algo, metrics in self.results.items():
+                f.write(f"{algo}:\n")
+                f.write(f"  Avg Waiting Time: {metrics[0]}\n")
+                f.write(f"  Avg Turnaround Time: {metrics[1]}\n")
+                f.write(f"  CPU Utilization: {metrics[2]:.2f}%\n")
+                f.write(f"  Throughput: {metrics[3]:.4f}\n\n")
+        messagebox.showinfo("Success", "Results saved to 'scheduling_results.txt'")
+
+def main():
+    root = tk.Tk()
+    app = SchedulerApp(root)
+    root.mainloop()
+    app.worker.shutdown()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,260 @@
+from array import array
+
+from .backend import _numpy
+
+# Streaming metrics with bounded memory: averages and totals are running
+# sums, distributions go into log-linear histograms, so the accumulator is
+# the same size for ten processes or ten billion.
+
+PERCENTILES = (50, 95, 99)
+
+# Values below 2**SUB_BITS get a bucket each; above that every power of two
+# is split into 2**(SUB_BITS - 1) buckets, so a reported percentile is within
+# 1/128 of the true value and an int64 range needs under 4000 buckets.
+SUB_BITS = 7
+_HALF = 1 << (SUB_BITS - 1)
+
+def _bucket(value):
+    shift = value.bit_length() - SUB_BITS
+    if shift <= 0:
+        return value
+    return shift * _HALF + (value >> shift)
+
+def _bucket_value(index):
+    # Midpoint of the values that fall in bucket `index`.
+    if index < 2 * _HALF:
+        return index
+    shift = index // _HALF - 1
+    low = (index - shift * _HALF) << shift
+    return low + ((1 << shift) - 1) // 2
+
+def _bit_length(values):
+    np = _numpy()
+    bits = np.zeros(len(values), dtype=np.int64)
+    rest = values.copy()
+    for step in (32, 16, 8, 4, 2, 1):
+        big = rest >= (1 << step)
+        bits[big] += step
+        rest[big] >>= step
+    return bits + rest
+
+class Histogram:
+    # Counts of non-negative integers in log-linear buckets.
+    def __init__(self):
+        self.counts = array('q')
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _grow(self, size):
+        if size > len(self.counts):
+            self.counts.extend([0] * (size - len(self.counts)))
+
+    def _extremes(self, low, high):
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    def add(self, value, count=1):
+        if value < 0:
+            raise ValueError(f"Histogram values must be non-negative, got {value}")
+        index = _bucket(value)
+        self._grow(index + 1)
+        self.counts[index] += count
+        self.count += count
+        self.total += value * count
+        self._extremes(value, value)
+
+    def add_values(self, values):
+        np = _numpy()
+        if np is None:
+            for value in values:
+                self.add(value)
+            return
+        values = np.asarray(values, dtype=np.int64)
+        if not len(values):
+            return
+        if values.min() < 0:
+            raise ValueError(f"Histogram values must be non-negative, got {values.min()}")
+        shift = np.maximum(_bit_length(values) - SUB_BITS, 0)
+        counts = np.bincount(shift * _HALF + (values >> shift))
+        self._grow(len(counts))
+        for index in np.flatnonzero(counts).tolist():
+            self.counts[index] += int(counts[index])
+        self.count += len(values)
+        self.total += int(values.sum())
+        self._extremes(int(values.min()), int(values.max()))
+
+    def merge(self, other):
+        self._grow(len(other.counts))
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self._extremes(other.min, other.max)
+
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, q):
+        # Nearest-rank percentile, 0 < q <= 100.
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * q // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(max(_bucket_value(index), self.min), self.max)
+        return self.max
+
+class RunningMetrics:
+    # Accumulates calculate_metrics' averages plus percentiles of waiting,
+    # turnaround and response time (first dispatch - arrival), context
+    # switches, idle time and Jain's fairness index over the share of time
+    # each process got while in the system (burst / turnaround).
+    def __init__(self):
+        self.count = 0
+        self.total_waiting_time = 0
+        self.total_turnaround_time = 0
+        self.total_burst_time = 0
+        self.end_time = 0
+        self.context_switches = 0
+        self.waiting = Histogram()
+        self.turnaround = Histogram()
+        self.response = Histogram()
+        self.share_sum = 0.0
+        self.share_squares = 0.0
+
+    def add(self, arrival_time, burst_time, completion_time):
+        turnaround_time = completion_time - arrival_time
+        self.count += 1
+        self.total_turnaround_time += turnaround_time
+        self.total_waiting_time += turnaround_time - burst_time
+        self.total_burst_time += burst_time
+        if completion_time > self.end_time:
+            self.end_time = completion_time
+        self.waiting.add(turnaround_time - burst_time)
+        self.turnaround.add(turnaround_time)
+        share = burst_time / turnaround_time if turnaround_time else 1.0
+        self.share_sum += share
+        self.share_squares += share * share
+
+    def add_columns(self, arrival_times, burst_times, completion_times):
+        # add() for whole columns at once.
+        np = _numpy()
+        if np is None:
+            for arrival_time, burst_time, completion_time in zip(arrival_times, burst_times, completion_times):
+                self.add(arrival_time, burst_time, completion_time)
+            return
+        arrivals = np.asarray(arrival_times, dtype=np.int64)
+        if not len(arrivals):
+            return
+        bursts = np.asarray(burst_times, dtype=np.int64)
+        completions = np.asarray(completion_times, dtype=np.int64)
+        turnaround_times = completions - arrivals
+        waiting_times = turnaround_times - bursts
+        self.count += len(arrivals)
+        self.total_turnaround_time += int(turnaround_times.sum())
+        self.total_waiting_time += int(waiting_times.sum())
+        self.total_burst_time += int(bursts.sum())
+        self.end_time = max(self.end_time, int(completions.max()))
+        self.waiting.add_values(waiting_times)
+        self.turnaround.add_values(turnaround_times)
+        shares = np.divide(bursts, turnaround_times, out=np.ones(len(bursts)), where=turnaround_times != 0)
+        self.share_sum += float(shares.sum())
+        self.share_squares += float(np.dot(shares, shares))
+
+    def add_response(self, response_time):
+        self.response.add(response_time)
+
+    def idle_time(self):
+        return self.end_time - self.total_burst_time
+
+    def fairness(self):
+        # 1 when every process got the same share, down to 1/n.
+        return self.share_sum ** 2 / (self.count * self.share_squares) if self.share_squares else 0
+
+    def result(self):
+        if not self.count:
+            return 0, 0, 0, 0
+        end_time = self.end_time
+        avg_waiting_time = self.total_waiting_time / self.count
+        avg_turnaround_time = self.total_turnaround_time / self.count
+        cpu_utilization = (self.total_burst_time / end_time) * 100 if end_time > 0 else 0
+        throughput = self.count / end_time if end_time > 0 else 0
+        return avg_waiting_time, avg_turnaround_time, cpu_utilization, throughput
+
+    def summary(self):
+        avg_waiting_time, avg_turnaround_time, cpu_utilization, throughput = self.result()
+        summary = {"processes": self.count, "avg_waiting_time": avg_waiting_time,
+                   "avg_turnaround_time": avg_turnaround_time, "avg_response_time": self.response.mean(),
+                   "cpu_utilization": cpu_utilization, "throughput": throughput}
+        for name, histogram in (("waiting", self.waiting), ("turnaround", self.turnaround),
+                                ("response", self.response)):
+            for q in PERCENTILES:
+                summary[f"p{q}_{name}_time"] = histogram.percentile(q)
+        summary.update(context_switches=self.context_switches, idle_time=self.idle_time(),
+                       fairness=self.fairness())
+        return summary
+
+def summarize(gantt, completed, metrics=None):
+    # RunningMetrics for a finished (gantt, completed) result. Response times
+    # come from each pid's first Gantt segment, context switches from the
+    # points where the running pid changes. Segments only carry pids, so
+    # completed processes must have unique pids; segments of pids that are
+    # not in `completed` are left out of the response times.
+    metrics = metrics or RunningMetrics()
+    table = hasattr(completed, "completion_time") and not isinstance(completed, list)
+    if table:
+        arrival_times, burst_times = completed.arrival_time, completed.burst_time
+        completion_times, pids = completed.completion_time, completed.pid
+    else:
+        arrival_times = [p.arrival_time for p in completed]
+        burst_times = [p.burst_time for p in completed]
+        completion_times = [p.completion_time for p in completed]
+        pids = [p.pid for p in completed]
+    if hasattr(gantt, "pid"):
+        gantt_pids, starts = gantt.pid, gantt.start
+    else:
+        gantt_pids = [segment[0] for segment in gantt]
+        starts = [segment[1] for segment in gantt]
+    # Table pids are int64; a Process list may use any pids. Duplicates are
+    # rejected before anything is added to `metrics`.
+    np = _numpy() if table else None
+    if np is not None:
+        pids = np.asarray(pids, dtype=np.int64)
+        by_pid = np.argsort(pids, kind="stable")
+        sorted_pids = pids[by_pid]
+        duplicates = np.flatnonzero(sorted_pids[1:] == sorted_pids[:-1])
+        if len(duplicates):
+            raise ValueError(f"duplicate pid {sorted_pids[duplicates[0]]}: response times need unique pids")
+    else:
+        arrival_of = {}
+        for pid, arrival_time in zip(pids, arrival_times):
+            if pid in arrival_of:
+                raise ValueError(f"duplicate pid {pid}: response times need unique pids")
+            arrival_of[pid] = arrival_time
+    metrics.add_columns(arrival_times, burst_times, completion_times)
+    if not len(gantt_pids):
+        return metrics
+    if np is not None:
+        gantt_pids = np.asarray(gantt_pids, dtype=np.int64)
+        metrics.context_switches += int(np.count_nonzero(gantt_pids[1:] != gantt_pids[:-1]))
+        if not len(sorted_pids):
+            return metrics
+        first_pids, first = np.unique(gantt_pids, return_index=True)
+        found = np.minimum(np.searchsorted(sorted_pids, first_pids), len(sorted_pids) - 1)
+        known = sorted_pids[found] == first_pids
+        arrivals = np.asarray(arrival_times, dtype=np.int64)[by_pid]
+        metrics.response.add_values(np.asarray(starts, dtype=np.int64)[first[known]] - arrivals[found[known]])
+    else:
+        previous = None
+        for pid, start in zip(gantt_pids, starts):
+            if previous is not None and pid != previous:
+                metrics.context_switches += 1
+            previous = pid
+            if pid in arrival_of:
+                metrics.add_response(start - arrival_of.pop(pid))
+    return metrics
@@ -0,0 +1,131 @@
+import json
+import time
+
+from .metrics import PERCENTILES, Histogram
+
+# Instrumentation for the scheduling engines. Pass profiler=Profiler() to
+# simulate() or any algorithm built on it; with the default profiler=None
+# the engines skip every hook behind a single `is not None` test, as with
+# trace sinks. The engine loop reports:
+#   phases      admit, select, slice, gantt, requeue, complete, metrics:
+#               calls and wall time spent in each part of the loop
+#   counters    dispatches, preemptions, idle jumps
+#   queue       a histogram of runnable processes at every step
+#   event rate  steps per second, sampled every `sample_every` steps
+# and can be exported as JSON or as a Chrome trace (chrome://tracing or
+# Perfetto), where phases show as slices and the rate and queue length as
+# counters. Timing every phase makes a profiled run about three times
+# slower, so profile a representative slice of a workload, not all of it.
+
+PHASES = ("admit", "select", "slice", "gantt", "requeue", "complete", "metrics")
+
+class Profiler:
+    # max_spans bounds how many individual phase slices are kept for the
+    # Chrome trace; totals keep counting after that.
+    def __init__(self, sample_every=1024, max_spans=100000, clock=time.perf_counter_ns):
+        self.clock = clock
+        self.sample_every = sample_every
+        self.max_spans = max_spans
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.nanoseconds = dict.fromkeys(PHASES, 0)
+        self.counters = {}
+        # Runnable count -> steps; turned into a Histogram when reported.
+        self.queue_lengths = {}
+        self.runs = []
+        self.spans = []
+        self.dropped_spans = 0
+        self.samples = []
+        self.origin = clock()
+        self._steps = 0
+        self._sample_time = self.origin
+        self._sample_steps = 0
+
+    def begin(self, label):
+        self.runs.append({"label": label, "start": self.clock(), "end": None, "first_step": self._steps, "steps": 0})
+        self._sample_time = self.clock()
+        self._sample_steps = self._steps
+
+    def end(self):
+        run = self.runs[-1]
+        run["end"] = self.clock()
+        run["steps"] = self._steps - run["first_step"]
+
+    def step(self, runnable):
+        self._steps += 1
+        queue_lengths = self.queue_lengths
+        queue_lengths[runnable] = queue_lengths.get(runnable, 0) + 1
+        if self._steps - self._sample_steps >= self.sample_every:
+            now = self.clock()
+            rate = (self._steps - self._sample_steps) * 1e9 / max(now - self._sample_time, 1)
+            self.samples.append((now, rate, runnable))
+            self._sample_time = now
+            self._sample_steps = self._steps
+
+    def phase(self, name, started):
+        # Charges the time since `started` to a phase and returns the current
+        # clock, to be passed on as the start of the next phase.
+        now = self.clock()
+        if name in self.calls:
+            self.calls[name] += 1
+            self.nanoseconds[name] += now - started
+        else:
+            self.calls[name] = 1
+            self.nanoseconds[name] = now - started
+        if len(self.spans) < self.max_spans:
+            self.spans.append((name, started, now))
+        else:
+            self.dropped_spans += 1
+        return now
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def queue_length(self):
+        histogram = Histogram()
+        for runnable, steps in self.queue_lengths.items():
+            histogram.add(runnable, steps)
+        return histogram
+
+    def to_dict(self):
+        total = sum(self.nanoseconds.values())
+        runs = []
+        for run in self.runs:
+            seconds = ((run["end"] or self.clock()) - run["start"]) / 1e9
+            runs.append({"label": run["label"], "seconds": seconds, "steps": run["steps"],
+                         "events_per_second": run["steps"] / seconds if seconds else None})
+        histogram = self.queue_length()
+        queue = {"mean": histogram.mean(), "max": histogram.max or 0}
+        queue.update((f"p{q}", histogram.percentile(q)) for q in PERCENTILES)
+        return {"runs": runs,
+                "phases": {name: {"calls": self.calls[name], "seconds": self.nanoseconds[name] / 1e9,
+                                  "share": self.nanoseconds[name] / total if total else 0}
+                           for name in self.calls if self.calls[name]},
+                "counters": dict(self.counters),
+                "queue_length": queue,
+                "event_rate": [((t - self.origin) / 1e9, rate) for t, rate, _ in self.samples],
+                "dropped_spans": self.dropped_spans}
+
+    def write_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=1)
+
+    def chrome_trace(self):
+        def us(t):
+            return (t - self.origin) / 1000
+        events = [{"name": "process_name", "ph": "M", "pid": 0, "args": {"name": "scheduler"}}]
+        for run in self.runs:
+            end = run["end"] or self.clock()
+            events.append({"name": run["label"], "cat": "run", "ph": "X", "pid": 0, "tid": 0,
+                           "ts": us(run["start"]), "dur": (end - run["start"]) / 1000,
+                           "args": {"steps": run["steps"]}})
+        for name, start, end in self.spans:
+            events.append({"name": name, "cat": "phase", "ph": "X", "pid": 0, "tid": 1,
+                           "ts": us(start), "dur": (end - start) / 1000})
+        for t, rate, runnable in self.samples:
+            events.append({"name": "event rate", "ph": "C", "pid": 0, "ts": us(t), "args": {"steps/s": rate}})
+            events.append({"name": "runnable", "ph": "C", "pid": 0, "ts": us(t), "args": {"processes": runnable}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
@@ -0,0 +1,112 @@
+import importlib
+import inspect
+import os
+
+# Name -> Algorithm for every scheduling algorithm the GUI, batch and bench
+# tools offer. Targets may be given as "module:attribute" strings, which are
+# only imported when the algorithm first runs, so registering is free.
+_registry = {}
+
+# Comma-separated modules imported on the first lookup; each is expected to
+# call register() for the algorithms it provides.
+PLUGINS_VARIABLE = "CPUSCHED_PLUGINS"
+_plugins_loaded = False
+
+class PolicyRunner:
+    # Runs a Policy class through simulate(). Picklable, so it can be sent to
+    # worker processes, and named after the class for cache keys.
+    def __init__(self, policy_class):
+        self.policy_class = policy_class
+        self.__module__ = policy_class.__module__
+        self.__qualname__ = policy_class.__qualname__
+
+    def __call__(self, processes, context_switch=0, max_steps=None, trace=None, profiler=None, **params):
+        from .backend import simulate
+        return simulate(processes, self.policy_class(**params), context_switch, max_steps, trace, profiler)
+
+class Algorithm:
+    # target is called as target(processes, **params) and returns (gantt,
+    # completed, *metrics); params are its tunable keyword arguments with
+    # their defaults. A class is taken to be a Policy and run by simulate().
+    def __init__(self, name, label, target, params=None):
+        self.name = name
+        self.label = label
+        self.target = target
+        self.params = dict(params or {})
+
+    @property
+    def function(self):
+        if isinstance(self.target, str):
+            module, _, attribute = self.target.partition(":")
+            self.target = getattr(importlib.import_module(module), attribute)
+        if isinstance(self.target, type):
+            self.target = PolicyRunner(self.target)
+        return self.target
+
+    def run(self, processes, **params):
+        return self.function(processes, **dict(self.params, **params))
+
+    def accepts(self, parameter):
+        # Whether the target takes `parameter` (e.g. "profiler") as a keyword.
+        try:
+            signature = inspect.signature(self.function)
+        except (TypeError, ValueError):
+            return False
+        return any(p.name == parameter or p.kind is inspect.Parameter.VAR_KEYWORD
+                   for p in signature.parameters.values())
+
+    def __repr__(self):
+        return f"Algorithm({self.name!r}, {self.label!r}, {self.params!r})"
+
+def register(name, target=None, label=None, replace=False, **params):
+    # register("rr", round_robin, "Round Robin", quantum=2), or as a decorator
+    # on a function or Policy class: @register("lottery", tickets=10).
+    if target is None:
+        def decorator(target):
+            register(name, target, label, replace, **params)
+            return target
+        return decorator
+    if name in _registry and not replace:
+        raise ValueError(f"Algorithm '{name}' is already registered")
+    _registry[name] = Algorithm(name, label or name, target, params)
+    return _registry[name]
+
+def unregister(name):
+    _registry.pop(name, None)
+
+def load_plugins(modules=None):
+    # Imports the plugin modules, by default those listed in $CPUSCHED_PLUGINS.
+    global _plugins_loaded
+    if modules is None:
+        _plugins_loaded = True
+        modules = os.environ.get(PLUGINS_VARIABLE, "").split(",")
+    for module in modules:
+        if module.strip():
+            importlib.import_module(module.strip())
+
+def _ensure_plugins():
+    if not _plugins_loaded:
+        load_plugins()
+
+def get(name):
+    _ensure_plugins()
+    try:
+        return _registry[name]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm '{name}' (choose from {', '.join(_registry)})") from None
+
+def names():
+    _ensure_plugins()
+    return list(_registry)
+
+def algorithms():
+    _ensure_plugins()
+    return list(_registry.values())
+
+register("fcfs", "cpusched.backend:fcfs", "FCFS")
+register("sjf", "cpusched.backend:sjf", "SJF")
+register("srtf", "cpusched.backend:preemptive_sjf", "Preemptive SJF")
+register("rr", "cpusched.backend:round_robin", "Round Robin", quantum=2)
+register("priority", "cpusched.backend:priority_scheduling", "Priority")
+register("mlfq", "cpusched.backend:mlfq", "MLFQ", quanta=(2, 4, 8), boost=None, context_switch=0)
+register("cfs", "cpusched.backend:cfs", "CFS", latency=12, min_granularity=2, context_switch=0)
@@ -0,0 +1,226 @@
+import argparse
+import heapq
+from collections import deque
+
+from .backend import (GanttChart, StepBudgetExceeded, _arrival_order, _collect, _columns,
+                      _step_budget, calculate_metrics)
+from .files import load_workload
+
+# Ready-queue order of each policy: the _columns() column used as the heap
+# key, or None for plain FIFO (FCFS, or Round Robin when a quantum is set).
+POLICIES = {"fcfs": None, "sjf": 2, "priority": 3}
+QUEUES = ("global", "per-core")
+
+def smp_schedule(processes, cpus, policy="fcfs", quantum=None, queues="global", steal=True,
+                 max_steps=None, trace=None):
+    # Simulates `cpus` identical CPUs. With queues="global" every CPU takes
+    # the next process from one shared ready queue; with "per-core" each CPU
+    # has its own queue, arrivals go to an idle CPU (else round-robin) and a
+    # process stays on the CPU it last ran on. steal=True lets a CPU whose
+    # queue is empty take work from the longest other queue (a migration).
+    # quantum=None runs each dispatch to completion, otherwise processes are
+    # preempted after `quantum` and queued again.
+    #
+    # Returns (lanes, completed, avg waiting, avg turnaround, cpu utilization,
+    # throughput, per-core utilization, migrations): one GanttChart per CPU,
+    # utilization as a percentage of cpus x makespan, per-core utilization a
+    # list of percentages of the makespan.
+    if cpus < 1:
+        raise ValueError("cpus must be at least 1")
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}' (choose from {', '.join(POLICIES)})")
+    if queues not in QUEUES:
+        raise ValueError(f"Unknown queue layout '{queues}' (choose from {', '.join(QUEUES)})")
+    if quantum is not None and quantum <= 0:
+        raise ValueError("SMP needs a positive quantum")
+    columns = _columns(processes)
+    pids, arrival_times, burst_times = columns[:3]
+    keys = columns[POLICIES[policy]] if POLICIES[policy] is not None else None
+    order = _arrival_order(arrival_times)
+    n = len(order)
+    remaining_burst = list(burst_times)
+    per_core = queues == "per-core"
+    # FIFO queues are deques of indices; keyed ones heaps of (key, sequence, index).
+    ready = [[] if keys is not None else deque() for _ in range(cpus if per_core else 1)]
+    queued = 0
+    sequence = 0
+    placement = 0
+    migrations = 0
+    running = [None] * cpus
+    slice_start = [0] * cpus
+    # Idle CPUs: a heap of ids plus flags; heap entries of CPUs that were
+    # dispatched directly go stale and are skipped when popped.
+    idle = list(range(cpus))
+    is_idle = [True] * cpus
+    busy = []
+    lanes = [GanttChart() for _ in range(cpus)]
+    next_arrival = 0
+    current_time = 0
+    completed_order = []
+    completion_times = []
+    label = f"SMP {policy.upper()}"
+
+    def dispatch(core, index):
+        is_idle[core] = False
+        time_slice = remaining_burst[index] if quantum is None else min(quantum, remaining_burst[index])
+        remaining_burst[index] -= time_slice
+        running[core] = index
+        slice_start[core] = current_time
+        heapq.heappush(busy, (current_time + time_slice, core))
+        if trace is not None:
+            trace.emit("dispatch", pids[index], current_time, core)
+
+    def take_idle():
+        # Lowest-numbered idle CPU, or None.
+        while idle:
+            core = heapq.heappop(idle)
+            if is_idle[core]:
+                return core
+        return None
+
+    def enqueue(queue, index):
+        nonlocal sequence
+        if keys is None:
+            queue.append(index)
+        else:
+            heapq.heappush(queue, (keys[index], sequence, index))
+            sequence += 1
+
+    def dequeue(queue):
+        return queue.popleft() if keys is None else heapq.heappop(queue)[2]
+
+    if max_steps is None:
+        max_steps = _step_budget(n, burst_times, quantum or max(max(burst_times, default=0), 1))
+    steps = 0
+    if trace is not None:
+        trace.emit("begin", label, {"cpus": cpus, "queues": queues, "quantum": quantum, "steal": steal})
+    while next_arrival < n or busy or queued:
+        steps += 1
+        if steps > max_steps:
+            raise StepBudgetExceeded(label, steps, max_steps, [pids[i] for i in completed_order])
+        if busy and (next_arrival == n or busy[0][0] <= arrival_times[order[next_arrival]]):
+            current_time = busy[0][0]
+        elif next_arrival < n:
+            if not busy and arrival_times[order[next_arrival]] > current_time and trace is not None:
+                trace.emit("idle", arrival_times[order[next_arrival]])
+            current_time = max(current_time, arrival_times[order[next_arrival]])
+
+        # Slices ending now free their CPU.
+        freed = []
+        preempted = []
+        while busy and busy[0][0] == current_time:
+            core = heapq.heappop(busy)[1]
+            index = running[core]
+            running[core] = None
+            lane = lanes[core]
+            if lane.pid and lane.pid[-1] == pids[index] and lane.end[-1] == slice_start[core]:
+                lane.end[-1] = current_time
+            else:
+                lane.pid.append(pids[index])
+                lane.start.append(slice_start[core])
+                lane.end.append(current_time)
+            if trace is not None:
+                trace.emit("segment", pids[index], slice_start[core], current_time, core)
+            if remaining_burst[index] == 0:
+                completed_order.append(index)
+                completion_times.append(current_time)
+                if trace is not None:
+                    trace.emit("complete", pids[index], current_time)
+            else:
+                preempted.append((core, index))
+            freed.append(core)
+            is_idle[core] = True
+            heapq.heappush(idle, core)
+
+        # In the global queue this instant's arrivals go ahead of processes
+        # preempted now, as in round_robin. Per-core, a preempted process
+        # stays queued on its CPU, and arrivals go to an idle CPU with an
+        # empty queue, else round-robin over all CPUs.
+        if per_core:
+            for core, index in preempted:
+                enqueue(ready[core], index)
+                queued += 1
+        while next_arrival < n and arrival_times[order[next_arrival]] <= current_time:
+            index = order[next_arrival]
+            next_arrival += 1
+            if per_core:
+                core = take_idle()
+                while core is not None and ready[core]:
+                    # Has work of its own (and is in freed): served below.
+                    core = take_idle()
+                if core is None:
+                    core = placement
+                    placement = (placement + 1) % cpus
+                else:
+                    freed.append(core)
+                enqueue(ready[core], index)
+            else:
+                enqueue(ready[0], index)
+            queued += 1
+        if per_core:
+            for core in freed:
+                if is_idle[core] and ready[core]:
+                    queued -= 1
+                    dispatch(core, dequeue(ready[core]))
+        else:
+            for core, index in preempted:
+                enqueue(ready[0], index)
+                queued += 1
+
+        # Idle CPUs take queued work, lowest-numbered first: from the global
+        # queue, or by stealing from the longest per-core queue.
+        while queued and (not per_core or steal):
+            core = take_idle()
+            if core is None:
+                break
+            if per_core:
+                victim = max(range(cpus), key=lambda c: len(ready[c]))
+                # A thief takes the newest entry of a FIFO queue, the one
+                # that would otherwise wait longest; from a heap, the best.
+                index = ready[victim].pop() if keys is None else heapq.heappop(ready[victim])[2]
+                migrations += 1
+                if trace is not None:
+                    trace.emit("migrate", pids[index], victim, core, current_time)
+            else:
+                index = dequeue(ready[0])
+            queued -= 1
+            dispatch(core, index)
+
+    completed = _collect(processes, completed_order, completion_times)
+    avg_waiting_time, avg_turnaround_time, _, _ = calculate_metrics(completed)
+    end_time = max(completion_times, default=0)
+    busy_times = [sum(lane.end) - sum(lane.start) for lane in lanes]
+    if end_time > 0:
+        core_utilization = [busy_time / end_time * 100 for busy_time in busy_times]
+        cpu_utilization = sum(busy_times) / (cpus * end_time) * 100
+        throughput = n / end_time
+    else:
+        core_utilization = [0] * cpus
+        cpu_utilization = throughput = 0
+    if trace is not None:
+        trace.emit("metrics", avg_waiting_time, avg_turnaround_time, cpu_utilization, throughput)
+    return (lanes, completed, avg_waiting_time, avg_turnaround_time, cpu_utilization, throughput,
+            core_utilization, migrations)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate a workload on several CPUs and compare scaling.")
+    parser.add_argument("workload", help="workload file (.csv, .json or .cpus)")
+    parser.add_argument("-c", "--cpus", nargs="+", type=int, default=[1, 2, 4, 8], help="CPU counts to compare")
+    parser.add_argument("-p", "--policy", default="fcfs", choices=list(POLICIES))
+    parser.add_argument("-q", "--quantum", type=int, default=None, help="time slice (default: run to completion)")
+    parser.add_argument("--queues", nargs="+", default=list(QUEUES), choices=list(QUEUES))
+    parser.add_argument("--no-steal", dest="steal", action="store_false", help="disable work stealing")
+    args = parser.parse_args(argv)
+
+    processes = load_workload(args.workload)
+    print(f"{'cpus':>5} {'queues':>9} {'avg wait':>10} {'avg turn':>10} {'util %':>7} "
+          f"{'min core %':>10} {'max core %':>10} {'throughput':>10} {'migrations':>10}")
+    for queues in args.queues:
+        for cpus in args.cpus:
+            _, _, wait, turn, utilization, throughput, cores, migrations = smp_schedule(
+                processes, cpus, args.policy, args.quantum, queues, args.steal)
+            print(f"{cpus:>5} {queues:>9} {wait:>10.2f} {turn:>10.2f} {utilization:>7.2f} "
+                  f"{min(cores):>10.2f} {max(cores):>10.2f} {throughput:>10.4f} {migrations:>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import heapq
+
+from .backend import NO_PRIORITY
+from .metrics import RunningMetrics  # noqa: F401 - re-exported for stream callers
+
+# Generator versions of FCFS, SJF, priority scheduling and SRTF for traces
+# that are too large (or unbounded) to hold in memory. They pull processes
+# from an arrival-ordered iterable, only keep the ready queue, and yield
+#   ("segment", pid, start, end)
+#   ("complete", pid, arrival_time, burst_time, completion_time)
+# as the simulation advances. Pass a RunningMetrics to accumulate the same
+# averages calculate_metrics reports, plus percentiles, response times and
+# context switches, without keeping completed processes.
+
+def _records(arrivals):
+    # Normalizes Process-like objects or (pid, arrival, burst[, priority])
+    # tuples and checks that arrival times never go backwards.
+    last_arrival = None
+    for item in arrivals:
+        if isinstance(item, tuple):
+            pid, arrival_time, burst_time = item[:3]
+            priority = item[3] if len(item) > 3 else None
+        else:
+            pid, arrival_time, burst_time, priority = item.pid, item.arrival_time, item.burst_time, item.priority
+        if last_arrival is not None and arrival_time < last_arrival:
+            raise ValueError(f"P{pid} arrives at {arrival_time}, before the previous arrival at {last_arrival}")
+        last_arrival = arrival_time
+        yield pid, arrival_time, burst_time, NO_PRIORITY if priority is None else priority
+
+def stream_fcfs(arrivals, metrics=None):
+    current_time = 0
+    dispatched = False
+    for pid, arrival_time, burst_time, _ in _records(arrivals):
+        if current_time < arrival_time:
+            current_time = arrival_time
+        start_time = current_time
+        current_time += burst_time
+        yield ("segment", pid, start_time, current_time)
+        if metrics is not None:
+            metrics.context_switches += dispatched
+            dispatched = True
+            metrics.add_response(start_time - arrival_time)
+            metrics.add(arrival_time, burst_time, current_time)
+        yield ("complete", pid, arrival_time, burst_time, current_time)
+
+def _stream_nonpreemptive(arrivals, key_field, metrics):
+    source = _records(arrivals)
+    pending = next(source, None)
+    ready_queue = []
+    sequence = 0
+    current_time = 0
+    dispatched = False
+    while pending is not None or ready_queue:
+        while pending is not None and pending[1] <= current_time:
+            heapq.heappush(ready_queue, (pending[key_field], sequence, pending))
+            sequence += 1
+            pending = next(source, None)
+        if not ready_queue:
+            current_time = pending[1]
+            continue
+        pid, arrival_time, burst_time, _ = heapq.heappop(ready_queue)[2]
+        start_time = current_time
+        current_time += burst_time
+        yield ("segment", pid, start_time, current_time)
+        if metrics is not None:
+            metrics.context_switches += dispatched
+            dispatched = True
+            metrics.add_response(start_time - arrival_time)
+            metrics.add(arrival_time, burst_time, current_time)
+        yield ("complete", pid, arrival_time, burst_time, current_time)
+
+def stream_sjf(arrivals, metrics=None):
+    return _stream_nonpreemptive(arrivals, 2, metrics)
+
+def stream_priority(arrivals, metrics=None):
+    return _stream_nonpreemptive(arrivals, 3, metrics)
+
+def _srtf_dispatch(metrics, record, remaining_burst, current_time, switch):
+    # A process whose whole burst remains is being dispatched for the first time.
+    metrics.context_switches += switch
+    if remaining_burst == record[2]:
+        metrics.add_response(current_time - record[1])
+
+def stream_srtf(arrivals, metrics=None):
+    source = _records(arrivals)
+    pending = next(source, None)
+    ready_queue = []
+    sequence = 0
+    current_time = 0
+    running = None
+    remaining_burst = 0
+    segment_start = 0
+    dispatched = False
+    while pending is not None or ready_queue or running is not None:
+        while pending is not None and pending[1] <= current_time:
+            heapq.heappush(ready_queue, (pending[2], sequence, pending))
+            sequence += 1
+            pending = next(source, None)
+
+        if running is not None and remaining_burst == 0:
+            pid, arrival_time, burst_time, _ = running
+            yield ("segment", pid, segment_start, current_time)
+            if metrics is not None:
+                metrics.add(arrival_time, burst_time, current_time)
+            yield ("complete", pid, arrival_time, burst_time, current_time)
+            running = None
+
+        if ready_queue and running is None:
+            remaining_burst, _, running = heapq.heappop(ready_queue)
+            segment_start = current_time
+            if metrics is not None:
+                _srtf_dispatch(metrics, running, remaining_burst, current_time, dispatched)
+            dispatched = True
+        elif running is not None and ready_queue and remaining_burst > ready_queue[0][0]:
+            yield ("segment", running[0], segment_start, current_time)
+            heapq.heappush(ready_queue, (remaining_burst, sequence, running))
+            sequence += 1
+            remaining_burst, _, running = heapq.heappop(ready_queue)
+            segment_start = current_time
+            if metrics is not None:
+                _srtf_dispatch(metrics, running, remaining_burst, current_time, True)
+
+        if running is not None:
+            run_until = current_time + remaining_burst
+            if pending is not None and pending[1] < run_until:
+                run_until = pending[1]
+            remaining_burst -= run_until - current_time
+            current_time = run_until
+        elif pending is not None:
+            current_time = pending[1]
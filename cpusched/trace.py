@@ -0,0 +1,88 @@
+import sys
+
+# Events emitted by the scheduling algorithms, with the fields that follow
+# the event name in each call to sink.emit(event, *fields):
+#   "begin"     algorithm, parameters (dict)
+#   "idle"      time the CPU stays idle until
+#   "dispatch"  pid, time it was given the CPU
+#   "preempt"   pid that takes over, time
+#   "segment"   pid, start, end of a contiguous slice on the CPU
+#   "complete"  pid, completion time
+#   "migrate"   pid, CPU it was taken from, CPU it moves to, time
+#   "metrics"   avg waiting, avg turnaround, cpu utilization (%), throughput
+# Multi-CPU runs (cpusched.smp) add the CPU number as a last field to
+# "dispatch" and "segment".
+# Algorithms take trace=None by default and then emit nothing at all; any
+# object with an emit method can be passed in as a sink.
+EVENTS = ("begin", "idle", "dispatch", "preempt", "segment", "complete", "migrate", "metrics")
+
+def format_event(event, fields):
+    if event == "begin":
+        algorithm, parameters = fields
+        if parameters:
+            options = ", ".join(f"{key.capitalize()}={value}" for key, value in parameters.items())
+            return f"{algorithm} Execution ({options}):"
+        return f"{algorithm} Execution:"
+    if event == "idle":
+        return f"Idle until time {fields[0]}"
+    if event == "dispatch":
+        return f"P{fields[0]} started at {fields[1]}"
+    if event == "preempt":
+        return f"Preempted to P{fields[0]} at {fields[1]}"
+    if event == "segment":
+        return f"P{fields[0]}: Start={fields[1]}, End={fields[2]}"
+    if event == "complete":
+        return f"P{fields[0]} completed at {fields[1]}"
+    if event == "migrate":
+        return f"P{fields[0]} migrated from CPU {fields[1]} to CPU {fields[2]} at {fields[3]}"
+    if event == "metrics":
+        wait, turn, cpu, throughput = fields
+        return f"Metrics: Wait={wait:.2f}, Turn={turn:.2f}, CPU={cpu:.2f}%, Throughput={throughput:.4f}"
+    return " ".join(str(field) for field in (event,) + fields)
+
+class TraceSink:
+    # Base sink; events=None accepts everything, otherwise only the named events.
+    def __init__(self, events=None):
+        self.events = frozenset(events) if events is not None else None
+
+    def emit(self, event, *fields):
+        if self.events is None or event in self.events:
+            self.record(event, fields)
+
+    def record(self, event, fields):
+        raise NotImplementedError
+
+class StdoutTrace(TraceSink):
+    def __init__(self, events=None, stream=None):
+        super().__init__(events)
+        self.stream = stream
+
+    def record(self, event, fields):
+        print(format_event(event, fields), file=self.stream or sys.stdout)
+
+class ListTrace(TraceSink):
+    # Keeps the raw (event, *fields) tuples, e.g. for tests or later analysis.
+    def __init__(self, events=None):
+        super().__init__(events)
+        self.records = []
+
+    def record(self, event, fields):
+        self.records.append((event,) + fields)
+
+class FileTrace(TraceSink):
+    # Tab-separated "event<TAB>field..." lines through a buffered writer.
+    def __init__(self, path, events=None, buffer_size=1 << 20):
+        super().__init__(events)
+        self.file = open(path, "w", buffering=buffer_size)
+
+    def record(self, event, fields):
+        self.file.write("\t".join([event] + [str(field) for field in fields]) + "\n")
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,67 @@
+import multiprocessing
+import os
+import queue
+
+from .cache import snapshot
+
+def _simulate(function, processes, params):
+    return snapshot(function(processes, **params))
+
+class SimulationWorker:
+    # Runs simulations in a pool of child processes so the caller's thread
+    # (e.g. the Tk event loop) never blocks. Finished jobs are queued as
+    #   ("result", name, (gantt, completed, *metrics))
+    #   ("error", name, exception)
+    # and collected with poll(); cancel() kills whatever is still running.
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool = None
+        self._messages = queue.Queue()
+        self.total = 0
+        self.finished = 0
+
+    def submit(self, jobs):
+        # jobs: iterable of (name, function, processes, params). Processes
+        # are best passed as a ProcessTable, which pickles as flat arrays.
+        jobs = list(jobs)
+        if self._pool is None:
+            # spawn rather than fork: the parent may hold Tk/X11 state.
+            context = multiprocessing.get_context("spawn")
+            # Sized for max_workers, not this batch: the pool is reused by
+            # later, possibly larger, submissions.
+            self._pool = context.Pool(self.max_workers)
+        if not self.busy:
+            self.total = self.finished = 0
+        self.total += len(jobs)
+        messages = self._messages
+        for name, function, processes, params in jobs:
+            self._pool.apply_async(
+                _simulate, (function, processes, params),
+                callback=lambda result, name=name: messages.put(("result", name, result)),
+                error_callback=lambda error, name=name: messages.put(("error", name, error)))
+
+    def poll(self):
+        messages = []
+        while True:
+            try:
+                messages.append(self._messages.get_nowait())
+            except queue.Empty:
+                break
+        self.finished += len(messages)
+        return messages
+
+    @property
+    def busy(self):
+        return self.finished < self.total
+
+    def cancel(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+        self._messages = queue.Queue()
+        self.total = self.finished = 0
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
@@ -0,0 +1,125 @@
+import argparse
+import time
+from array import array
+
+import numpy as np
+
+from .backend import NO_PRIORITY, ProcessTable
+from .files import save_workload
+
+# Every distribution is drawn for all n processes at once from a seeded
+# numpy Generator, so equal arguments always give the same workload and
+# ten million processes take a few seconds.
+
+def poisson_arrivals(rng, n, rate=1.0):
+    # Exponential inter-arrival gaps: on average `rate` arrivals per time unit.
+    return np.floor(np.cumsum(rng.exponential(1.0 / rate, n))).astype(np.int64)
+
+def bursty_arrivals(rng, n, rate=1.0, burst_size=20, intensity=50.0):
+    # Clusters of about `burst_size` arrivals, `intensity` times denser than
+    # the long-run `rate`, separated by quiet gaps that keep that average. A
+    # cluster spans burst_size / rate on average; its burst_size - 1 dense
+    # gaps use part of that and the one quiet gap takes the rest.
+    if intensity < 1:
+        raise ValueError("bursty arrivals need intensity >= 1")
+    gaps = rng.exponential(1.0 / (rate * intensity), n)
+    heads = rng.random(n) < 1.0 / burst_size
+    quiet = burst_size / rate - (burst_size - 1) / (rate * intensity)
+    gaps[heads] = rng.exponential(quiet, np.count_nonzero(heads))
+    return np.floor(np.cumsum(gaps)).astype(np.int64)
+
+def batch_arrivals(rng, n):
+    # Everything is ready at time 0.
+    return np.zeros(n, dtype=np.int64)
+
+def exponential_bursts(rng, n, mean=10.0):
+    return rng.exponential(mean, n)
+
+def pareto_bursts(rng, n, mean=10.0, alpha=1.5):
+    # Heavy tail: most bursts are short, a few are very long. alpha > 1 so
+    # that the mean exists; numpy's pareto() is shifted by one (Lomax).
+    if alpha <= 1:
+        raise ValueError("pareto bursts need alpha > 1")
+    scale = mean * (alpha - 1) / alpha
+    return (rng.pareto(alpha, n) + 1) * scale
+
+def bimodal_bursts(rng, n, short=4.0, long=100.0, long_share=0.1):
+    # Interactive jobs mixed with a share of long CPU-bound ones.
+    means = np.where(rng.random(n) < long_share, long, short)
+    return rng.exponential(means)
+
+def uniform_priorities(rng, n, levels=5):
+    return rng.integers(1, levels + 1, n, dtype=np.int64)
+
+def zipf_priorities(rng, n, levels=5, skew=2.0):
+    # Priority 1 is the most common, higher numbers increasingly rare.
+    return np.minimum(rng.zipf(skew, n), levels).astype(np.int64)
+
+def no_priorities(rng, n):
+    return np.full(n, NO_PRIORITY, dtype=np.int64)
+
+ARRIVALS = {"poisson": poisson_arrivals, "bursty": bursty_arrivals, "batch": batch_arrivals}
+BURSTS = {"exponential": exponential_bursts, "pareto": pareto_bursts, "bimodal": bimodal_bursts}
+PRIORITIES = {"uniform": uniform_priorities, "zipf": zipf_priorities, "none": no_priorities}
+
+# Longest burst kept from the heavy-tailed distributions, so that burst and
+# completion-time sums stay far from int64 overflow.
+MAX_BURST = 2 ** 32
+
+def _column(values):
+    column = array('q')
+    column.frombytes(memoryview(np.ascontiguousarray(values, dtype=np.int64)).cast('B'))
+    return column
+
+def generate(n, arrivals="poisson", bursts="exponential", priorities="uniform", seed=None,
+             arrival_params=None, burst_params=None, priority_params=None):
+    # Returns a ProcessTable of n processes with pids 1..n in arrival order.
+    # The *_params dicts are passed on to the chosen distribution functions.
+    for name, table in ((arrivals, ARRIVALS), (bursts, BURSTS), (priorities, PRIORITIES)):
+        if name not in table:
+            raise ValueError(f"Unknown distribution '{name}' (choose from {', '.join(table)})")
+    rng = np.random.default_rng(seed)
+    arrival_time = ARRIVALS[arrivals](rng, n, **(arrival_params or {}))
+    burst_time = np.clip(np.rint(BURSTS[bursts](rng, n, **(burst_params or {}))), 1, MAX_BURST)
+    priority = PRIORITIES[priorities](rng, n, **(priority_params or {}))
+
+    table = ProcessTable.__new__(ProcessTable)
+    table.pid = _column(np.arange(1, n + 1))
+    table.arrival_time = _column(arrival_time)
+    table.burst_time = _column(burst_time)
+    table.priority = _column(priority)
+    table.completion_time = array('q', [0]) * n
+    table.waiting_time = array('q', [0]) * n
+    table.turnaround_time = array('q', [0]) * n
+    return table
+
+def _parameters(pairs):
+    # "name=value" command line options -> keyword arguments.
+    params = {}
+    for pair in pairs or ():
+        name, _, value = pair.partition("=")
+        params[name] = int(value) if value.lstrip("-").isdigit() else float(value)
+    return params
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic workload file.")
+    parser.add_argument("count", type=int, help="number of processes")
+    parser.add_argument("-o", "--output", required=True, help="workload file (.cpus, .csv or .json)")
+    parser.add_argument("--arrivals", default="poisson", choices=list(ARRIVALS))
+    parser.add_argument("--bursts", default="exponential", choices=list(BURSTS))
+    parser.add_argument("--priorities", default="uniform", choices=list(PRIORITIES))
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--arrival-param", nargs="*", metavar="NAME=VALUE", help="e.g. rate=0.1")
+    parser.add_argument("--burst-param", nargs="*", metavar="NAME=VALUE", help="e.g. mean=10 alpha=1.5")
+    parser.add_argument("--priority-param", nargs="*", metavar="NAME=VALUE", help="e.g. levels=5")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    table = generate(args.count, args.arrivals, args.bursts, args.priorities, args.seed,
+                     _parameters(args.arrival_param), _parameters(args.burst_param),
+                     _parameters(args.priority_param))
+    save_workload(table, args.output)
+    print(f"Wrote {len(table)} processes to {args.output} in {time.perf_counter() - started:.2f}s")
+
+if __name__ == "__main__":
+    main()
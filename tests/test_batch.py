@@ -0,0 +1,85 @@
+import csv
+import io
+import os
+
+import pytest
+
+from cpusched.backend import Process, ProcessTable, round_robin, sjf
+from cpusched.batch import SUMMARY_FIELDS, main, make_jobs, run_batch, write_results
+from cpusched.files import write_csv
+
+def workload():
+    return [Process(1, 0, 5, 3), Process(2, 1, 3, 1), Process(3, 2, 1, 2), Process(4, 3, 2, 0)]
+
+def test_make_jobs_expands_parameters_per_algorithm():
+    jobs = make_jobs(["a", "b"], ["sjf", "rr"], {"quantum": [1, 4]})
+    assert jobs == [
+        ("a", "sjf", {}), ("a", "rr", {"quantum": 1}), ("a", "rr", {"quantum": 4}),
+        ("b", "sjf", {}), ("b", "rr", {"quantum": 1}), ("b", "rr", {"quantum": 4}),
+    ]
+
+def test_make_jobs_rejects_unknown_algorithms():
+    with pytest.raises(ValueError):
+        make_jobs(["a"], ["lottery"], {})
+
+def test_make_jobs_falls_back_to_registered_defaults():
+    assert make_jobs(["a"], ["rr", "cfs"], {"latency": [6, 24]}) == [
+        ("a", "rr", {"quantum": 2}),
+        ("a", "cfs", {"latency": 6, "min_granularity": 2, "context_switch": 0}),
+        ("a", "cfs", {"latency": 24, "min_granularity": 2, "context_switch": 0}),
+    ]
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_run_batch_matches_direct_runs(tmp_path, max_workers):
+    path = str(tmp_path / "workload.csv")
+    write_csv(workload(), path)
+    workloads = {"table": ProcessTable.from_processes(workload()), "file": path}
+    rows = run_batch(workloads, ["sjf", "rr"], {"quantum": [2]}, max_workers=max_workers)
+    assert [(row["workload"], row["algorithm"]) for row in rows] == \
+        [("table", "sjf"), ("table", "rr"), ("file", "sjf"), ("file", "rr")]
+    expected = {"sjf": sjf(workload())[2:], "rr": round_robin(workload(), 2)[2:]}
+    for row in rows:
+        assert row["processes"] == 4
+        assert "error" not in row
+        metrics = (row["avg_waiting_time"], row["avg_turnaround_time"], row["cpu_utilization"], row["throughput"])
+        assert metrics == pytest.approx(expected[row["algorithm"]])
+        assert set(SUMMARY_FIELDS) <= set(row)
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_run_batch_records_invalid_parameters(max_workers):
+    rows = run_batch({"w": workload()}, ["rr", "cfs"], {"quantum": [0, 2], "min_granularity": [0]},
+                     max_workers=max_workers)
+    assert [(row["algorithm"], row.get("quantum"), "error" in row) for row in rows] == \
+        [("rr", 0, True), ("rr", 2, False), ("cfs", None, True)]
+    assert "avg_waiting_time" not in rows[0]
+
+def test_run_batch_records_duplicate_pids():
+    duplicates = ProcessTable([1, 1, 2], [0, 5, 1], [2, 2, 2])
+    rows = run_batch({"dup": duplicates, "w": workload()}, ["fcfs"], max_workers=1)
+    assert "duplicate pid 1" in rows[0]["error"]
+    assert "error" not in rows[1]
+
+def test_write_results():
+    rows = run_batch({"w": workload()}, ["rr"], {"quantum": [2]}, max_workers=1)
+    out = io.StringIO()
+    write_results(rows, out)
+    header, line = out.getvalue().splitlines()
+    assert header.split(",")[:4] == ["workload", "algorithm", "quantum", "processes"]
+    assert line.startswith("w,rr,2,4,")
+
+def test_run_batch_shares_an_on_disk_cache(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    first = run_batch({"w": workload()}, ["sjf", "rr"], {"quantum": [2]}, max_workers=1, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 2
+    second = run_batch({"w": workload()}, ["sjf", "rr"], {"quantum": [2]}, max_workers=2, cache_dir=cache_dir)
+    for a, b in zip(first, second):
+        assert a["avg_waiting_time"] == b["avg_waiting_time"]
+
+def test_main_collects_repeated_params(tmp_path):
+    path = str(tmp_path / "workload.csv")
+    output = str(tmp_path / "results.csv")
+    write_csv(workload(), path)
+    main([path, "-a", "mlfq", "-j", "1", "-o", output, "-p", "quanta=(1,2)", "-p", "boost=4", "boost=8"])
+    with open(output, newline="") as f:
+        parameters = [row["parameters"] for row in csv.DictReader(f)]
+    assert parameters == ["quanta=(1, 2) boost=4 context_switch=0", "quanta=(1, 2) boost=8 context_switch=0"]
@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+# The harness generates its workloads with cpusched.workload.
+pytest.importorskip("numpy")
+
+from cpusched.bench import compare, load_baseline, measure, run_benchmarks, save_baseline
+from cpusched.backend import Process, fcfs
+
+def row(seconds, algorithm="fcfs", size=1000, distribution="exponential", **extra):
+    return {"algorithm": algorithm, "size": size, "distribution": distribution, "seconds": seconds, **extra}
+
+def test_compare_reports_slowdowns_beyond_tolerance():
+    baseline = [row(1.0), row(1.0, algorithm="sjf"), row(1.0, algorithm="rr", quantum=4)]
+    results = [row(1.2), row(1.3, algorithm="sjf"), row(2.0, algorithm="rr", quantum=4)]
+    regressions = compare(baseline, results, tolerance=0.25)
+    assert [(new["algorithm"], old, ratio) for new, old, ratio in regressions] == [
+        ("sjf", 1.0, 1.3), ("rr", 1.0, 2.0)]
+
+def test_compare_skips_noise_and_unknown_cases():
+    baseline = [row(0.001), row(1.0, size=10)]
+    results = [row(0.005), row(5.0, size=20), row(5.0, algorithm="rr", quantum=2)]
+    assert compare(baseline, results, tolerance=0.25, min_seconds=0.01) == []
+
+def test_compare_keys_on_quantum():
+    baseline = [row(1.0, algorithm="rr", quantum=2)]
+    assert compare(baseline, [row(3.0, algorithm="rr", quantum=4)]) == []
+    assert len(compare(baseline, [row(3.0, algorithm="rr", quantum=2)])) == 1
+
+def test_measure_counts_segments_and_completions():
+    processes = [Process(1, 0, 2), Process(2, 5, 1)]
+    result = measure(fcfs, processes, repeat=1)
+    assert result["events"] == 4
+    assert result["seconds"] > 0 and result["peak_bytes"] > 0
+
+def test_baseline_round_trip(tmp_path):
+    path = tmp_path / "baseline.json"
+    results = [row(1.5, peak_bytes=10, events=4, events_per_second=2.0)]
+    save_baseline(results, path)
+    assert load_baseline(path) == results
+    assert set(json.loads(path.read_text())["environment"]) >= {"python", "machine", "time"}
+
+def test_run_benchmarks_covers_every_case():
+    results = run_benchmarks(["fcfs", "rr"], sizes=(50,), distributions=["exponential"], quantum=3, repeat=1)
+    assert [(r["algorithm"], r["size"], r.get("quantum")) for r in results] == [("fcfs", 50, None), ("rr", 50, 3)]
+    assert all(r["events"] >= 50 for r in results)
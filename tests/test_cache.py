@@ -0,0 +1,101 @@
+import os
+
+from cpusched import cache as cache_module
+from cpusched.backend import Process, ProcessTable, fcfs, round_robin
+from cpusched.cache import ResultCache, fingerprint, result_size
+
+def workload():
+    return [Process(1, 0, 5, 3), Process(2, 1, 3, 1), Process(3, 2, 1, None)]
+
+def test_fingerprint_depends_on_content_not_representation():
+    key = fingerprint(workload(), "rr", {"quantum": 2})
+    assert fingerprint(ProcessTable.from_processes(workload()), "rr", {"quantum": 2}) == key
+    assert fingerprint(workload(), "rr", {"quantum": 3}) != key
+    assert fingerprint(workload(), "sjf", {"quantum": 2}) != key
+    changed = workload()
+    changed[2].priority = 0
+    assert fingerprint(changed, "rr", {"quantum": 2}) != key
+
+def test_hits_return_a_snapshot():
+    cache = ResultCache()
+    processes = workload()
+    gantt, completed, *metrics = cache.run(round_robin, processes, quantum=2)
+    assert (cache.hits, cache.misses) == (0, 1)
+    # A later run overwrites the Process objects; the cached copy is unaffected.
+    fcfs(processes)
+    cached_gantt, cached_completed, *cached_metrics = cache.run(round_robin, workload(), quantum=2)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cached_gantt == round_robin(workload(), 2)[0]
+    assert [p.completion_time for p in cached_completed] == [p.completion_time for p in round_robin(workload(), 2)[1]]
+    assert cached_metrics == metrics
+
+def test_lists_that_do_not_fit_a_table():
+    def processes():
+        return [Process("A", 0.5, 2.5), Process("B", 1, 1.5)]
+    cache = ResultCache()
+    key = fingerprint(processes(), "fcfs")
+    assert fingerprint(processes()[::-1], "fcfs") != key
+    gantt, completed, *metrics = cache.run(fcfs, processes())
+    assert gantt == [("A", 0.5, 3.0), ("B", 3.0, 4.5)]
+    cached_gantt, cached_completed, *cached_metrics = cache.run(fcfs, processes())
+    assert cache.hits == 1
+    assert [(p.pid, p.completion_time) for p in cached_completed] == [("A", 3.0), ("B", 4.5)]
+    assert cached_metrics == metrics
+
+def test_lru_eviction():
+    cache = ResultCache(maxsize=2)
+    for burst in (1, 2, 3):
+        cache.run(fcfs, [Process(1, 0, burst)])
+    cache.run(fcfs, [Process(1, 0, 1)])
+    assert cache.misses == 4
+    cache.run(fcfs, [Process(1, 0, 3)])
+    assert cache.hits == 1
+
+def test_memory_is_bounded_by_bytes(tmp_path):
+    # Each one-process result holds 3 Gantt and 7 table columns of 8 bytes.
+    size = result_size(ResultCache().run(fcfs, [Process(1, 0, 1)]))
+    assert size == 80
+    cache = ResultCache(max_bytes=2 * size, directory=str(tmp_path))
+    for burst in (1, 2, 3):
+        cache.run(fcfs, [Process(1, 0, burst)])
+    assert (len(cache._entries), cache.nbytes) == (2, 2 * size)
+    # Too big to keep in memory at all, but still stored on disk.
+    cache.run(fcfs, workload())
+    assert len(cache._entries) == 2
+    assert cache.run(fcfs, workload())[1][0].completion_time == 5
+    assert cache.hits == 1
+    cache.clear()
+    assert cache.nbytes == 0
+
+def test_directory_survives_a_new_cache(tmp_path):
+    ResultCache(directory=str(tmp_path)).run(fcfs, workload())
+    assert len(os.listdir(tmp_path)) == 1
+    cache = ResultCache(directory=str(tmp_path))
+    gantt, *_ = cache.run(fcfs, workload())
+    assert cache.hits == 1
+    assert gantt == fcfs(workload())[0]
+
+def test_fingerprint_changes_with_cache_version(monkeypatch):
+    key = fingerprint(workload(), "fcfs")
+    monkeypatch.setattr(cache_module, "CACHE_VERSION", cache_module.CACHE_VERSION + 1)
+    assert fingerprint(workload(), "fcfs") != key
+
+def test_directory_is_bounded(tmp_path):
+    cache = ResultCache(directory=str(tmp_path), max_files=3)
+    for burst in range(1, 6):
+        cache.run(fcfs, [Process(1, 0, burst)])
+    assert len(os.listdir(tmp_path)) == 3
+    assert cache.run(fcfs, [Process(1, 0, 5)])[1][0].completion_time == 5
+
+def test_disk_hits_count_as_recent_use(tmp_path):
+    cache = ResultCache(directory=str(tmp_path), max_files=2)
+    cache.run(fcfs, [Process(1, 0, 1)])
+    cache.run(fcfs, [Process(1, 0, 2)])
+    first, second = (cache._path(cache.key(fcfs, [Process(1, 0, burst)])) for burst in (1, 2))
+    os.utime(first, (1000, 1000))
+    os.utime(second, (2000, 2000))
+    fresh = ResultCache(directory=str(tmp_path), max_files=2)
+    fresh.run(fcfs, [Process(1, 0, 1)])
+    assert fresh.hits == 1
+    fresh.run(fcfs, [Process(1, 0, 3)])
+    assert os.path.exists(first) and not os.path.exists(second)
@@ -0,0 +1,73 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import cpusched
+from cpusched.backend import round_robin, sjf
+from cpusched.cli import main, run
+from cpusched.files import write_csv
+from tests.test_engines import workload
+
+@pytest.fixture
+def workload_file(tmp_path):
+    path = str(tmp_path / "workload.csv")
+    write_csv(workload(), path)
+    return path
+
+def test_run_json(workload_file, capsys):
+    assert run([workload_file, "-a", "sjf", "rr", "-p", "quantum=1", "-f", "json"]) == 0
+    rows = json.loads(capsys.readouterr().out)
+    assert [(row["algorithm"], row.get("quantum")) for row in rows] == [("sjf", None), ("rr", 1)]
+    expected = {"sjf": sjf(workload())[2:], "rr": round_robin(workload(), 1)[2:]}
+    for row in rows:
+        metrics = (row["avg_waiting_time"], row["avg_turnaround_time"], row["cpu_utilization"], row["throughput"])
+        assert metrics == pytest.approx(expected[row["algorithm"]])
+        assert "fairness" not in row
+
+def test_run_collects_repeated_params(workload_file, capsys):
+    assert run([workload_file, "-a", "mlfq", "-p", "quanta=(1,2)", "-p", "boost=4", "-f", "json"]) == 0
+    row, = json.loads(capsys.readouterr().out)
+    assert (row["quanta"], row["boost"]) == ([1, 2], 4)
+
+def test_run_reports_invalid_parameters(workload_file, capsys):
+    assert run([workload_file, "-a", "rr", "sjf", "-p", "quantum=0", "-f", "json"]) == 0
+    captured = capsys.readouterr()
+    rows = json.loads(captured.out)
+    assert "positive quantum" in rows[0]["error"]
+    assert "error" not in rows[1]
+    assert captured.err.startswith("rr: ")
+
+def test_run_table_with_metrics(workload_file, capsys):
+    assert main(["run", workload_file, "-a", "fcfs", "cfs", "-m"]) == 0
+    header, *lines = capsys.readouterr().out.splitlines()
+    assert header.split()[:3] == ["algorithm", "avg", "wait"]
+    assert header.split()[-1] == "fairness"
+    assert [line.split()[0] for line in lines] == ["fcfs", "cfs"]
+
+def test_run_rejects_bad_parameters(workload_file):
+    with pytest.raises(SystemExit):
+        run([workload_file, "-p", "quantum=two"])
+    with pytest.raises(SystemExit):
+        main(["lottery"])
+
+def test_commands_hand_over_their_arguments(workload_file, capsys):
+    main(["smp", workload_file, "-c", "1", "2", "--queues", "global"])
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[0] for line in lines[1:]] == ["1", "2"]
+
+def test_package_exports_load_lazily():
+    assert cpusched.round_robin is round_robin
+    assert "generate" in dir(cpusched)
+    with pytest.raises(AttributeError):
+        cpusched.lottery
+    # Importing the package and running the CLI's help loads neither Tk nor
+    # matplotlib.
+    code = ("import sys, cpusched.cli\n"
+            "try:\n    cpusched.cli.main(['-h'])\nexcept SystemExit:\n    pass\n"
+            "assert not {'tkinter', 'matplotlib'} & set(sys.modules)")
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+    # Nor does loading the batch runner and its metrics load numpy.
+    code = "import sys, cpusched.batch\nassert 'numpy' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
@@ -0,0 +1,298 @@
+import pickle
+import random
+
+import pytest
+
+from cpusched.backend import (NO_PRIORITY, FifoPolicy, GanttChart, Process, ProcessTable, StepBudgetExceeded,
+                               cfs, fcfs, mlfq, preemptive_sjf, priority_scheduling, round_robin, simulate, sjf,
+                               step_budget)
+
+def workload():
+    # pid, arrival, burst, priority
+    return [Process(1, 0, 5, 3), Process(2, 1, 3, 1), Process(3, 2, 1, 2), Process(4, 3, 2, 0)]
+
+def completions(completed):
+    return [(p.pid, p.completion_time) for p in completed]
+
+def random_workload(rng, n=12):
+    arrival = 0
+    processes = []
+    for pid in range(n):
+        arrival += rng.randint(0, 4)
+        processes.append(Process(pid, arrival, rng.randint(1, 8), rng.choice([None, 0, 1, 2])))
+    rng.shuffle(processes)
+    return processes
+
+ENGINES = {
+    "fcfs": fcfs,
+    "sjf": sjf,
+    "srtf": preemptive_sjf,
+    "rr": lambda processes: round_robin(processes, 2),
+    "priority": priority_scheduling,
+    "mlfq": mlfq,
+    "cfs": cfs,
+}
+
+@pytest.mark.parametrize("as_table", [False, True], ids=["list", "table"])
+def test_fcfs_schedule(as_table):
+    processes = workload()
+    if as_table:
+        processes = ProcessTable.from_processes(processes[::-1])
+    gantt, completed, wait, turn, cpu, throughput = fcfs(processes)
+    assert list(gantt) == [(1, 0, 5), (2, 5, 8), (3, 8, 9), (4, 9, 11)]
+    assert completions(completed) == [(1, 5), (2, 8), (3, 9), (4, 11)]
+    assert [p.waiting_time for p in completed] == [0, 4, 6, 6]
+    assert (wait, turn, cpu, throughput) == (4, 6.75, 100, 4 / 11)
+
+def test_fcfs_idle_gaps_as_table():
+    table = ProcessTable([1, 2, 3], [3, 4, 20], [2, 1, 5])
+    gantt, completed, wait, turn, cpu, throughput = fcfs(table)
+    assert list(gantt) == [(1, 3, 5), (2, 5, 6), (3, 20, 25)]
+    assert cpu == 100 * 8 / 25
+    # Already in arrival order, so no sort: the input is still left alone.
+    assert list(table.completion_time) == [0, 0, 0]
+    completed.completion_time[0] = 99
+    assert gantt[0] == (1, 3, 5)
+
+def test_gantt_chart_behaves_like_a_list():
+    chart = GanttChart([1, 2], [0, 2], [2, 5])
+    assert len(chart) == 2
+    assert chart[1] == (2, 2, 5)
+    assert chart[-1] == (2, 2, 5)
+    assert chart[:1] == [(1, 0, 2)]
+    assert chart == [(1, 0, 2), (2, 2, 5)]
+    assert chart != [(1, 0, 2)]
+    assert list(chart) == [(1, 0, 2), (2, 2, 5)]
+
+def test_sjf_schedule():
+    gantt, completed, *_ = sjf(workload())
+    assert gantt == [(1, 0, 5), (3, 5, 6), (4, 6, 8), (2, 8, 11)]
+    assert completions(completed) == [(1, 5), (3, 6), (4, 8), (2, 11)]
+
+def test_priority_schedule():
+    gantt, completed, *_ = priority_scheduling(workload())
+    assert gantt == [(1, 0, 5), (4, 5, 7), (2, 7, 10), (3, 10, 11)]
+    assert completions(completed) == [(1, 5), (4, 7), (2, 10), (3, 11)]
+
+def test_priority_without_priority_runs_last():
+    processes = [Process(1, 0, 1), Process(2, 0, 1, 5), Process(3, 0, 1)]
+    gantt, completed, *_ = priority_scheduling(processes)
+    assert [p.pid for p in completed] == [2, 1, 3]
+
+def test_nonpreemptive_ties_are_fifo():
+    processes = [Process(1, 0, 2), Process(2, 0, 2), Process(3, 0, 2)]
+    assert [p.pid for p in sjf(processes)[1]] == [1, 2, 3]
+
+def test_preemptive_sjf_completions():
+    # P2 preempts P1 and P3 preempts P2; at 3 P2 and P4 tie on 2 left and
+    # the earlier-queued P2 goes first.
+    gantt, completed, *_ = preemptive_sjf(workload())
+    assert completions(completed) == [(3, 3), (2, 5), (4, 7), (1, 11)]
+
+def test_preemptive_sjf_merges_slices():
+    gantt, completed, *_ = preemptive_sjf(workload())
+    assert gantt == [(1, 0, 1), (2, 1, 2), (3, 2, 3), (2, 3, 5), (4, 5, 7), (1, 7, 11)]
+
+def test_preemptive_sjf_jumps_between_events():
+    # An arrival that does not preempt leaves the running slice whole.
+    gantt, completed, *_ = preemptive_sjf([Process(1, 0, 10 ** 9), Process(2, 5, 10 ** 9 + 1)])
+    assert gantt == [(1, 0, 10 ** 9), (2, 10 ** 9, 2 * 10 ** 9 + 1)]
+
+def test_round_robin_schedule():
+    # Arrivals during a slice queue ahead of the preempted process.
+    gantt, completed, *_ = round_robin(workload(), 2)
+    assert gantt == [(1, 0, 2), (2, 2, 4), (3, 4, 5), (1, 5, 7), (4, 7, 9), (2, 9, 10), (1, 10, 11)]
+    assert completions(completed) == [(3, 5), (4, 9), (2, 10), (1, 11)]
+
+def test_round_robin_staggered_arrivals():
+    # P2 arrives during P1's first quantum, P3 at the end of P1's second,
+    # and the gap before P4 leaves the CPU idle.
+    processes = [Process(1, 0, 5), Process(2, 1, 2), Process(3, 6, 2), Process(4, 20, 3)]
+    gantt, completed, *_ = round_robin(processes, 2)
+    assert gantt == [(1, 0, 2), (2, 2, 4), (1, 4, 6), (3, 6, 8), (1, 8, 9), (4, 20, 23)]
+    assert completions(completed) == [(2, 4), (3, 8), (1, 9), (4, 23)]
+
+def test_round_robin_does_not_run_processes_before_they_arrive():
+    gantt, completed, *_ = round_robin([Process(1, 5, 2), Process(2, 0, 1)], 2)
+    assert gantt == [(2, 0, 1), (1, 5, 7)]
+
+def test_round_robin_alone_runs_whole_quanta_until_arrival():
+    # P1 is cut at 6, the end of the quantum in which P2 arrives.
+    gantt, completed, *_ = round_robin([Process(1, 0, 10), Process(2, 5, 1)], 2)
+    assert gantt == [(1, 0, 6), (2, 6, 7), (1, 7, 11)]
+
+def test_round_robin_rejects_non_positive_quantum():
+    with pytest.raises(ValueError):
+        round_robin(workload(), 0)
+
+def test_round_robin_leaves_callers_processes_in_place():
+    processes = workload()
+    gantt, completed, *_ = round_robin(processes, 2)
+    assert sorted(completed, key=lambda p: p.pid) == processes
+
+def test_mlfq_schedule():
+    gantt, completed, *_ = mlfq(workload())
+    assert gantt == [(1, 0, 2), (2, 2, 4), (3, 4, 5), (4, 5, 7), (1, 7, 10), (2, 10, 11)]
+    assert completions(completed) == [(3, 5), (4, 7), (1, 10), (2, 11)]
+
+def test_mlfq_context_switch():
+    gantt, *_ = mlfq(workload(), (2, 4), context_switch=2)
+    assert gantt == [(1, 0, 2), (2, 4, 6), (3, 8, 9), (4, 11, 13), (1, 15, 18), (2, 20, 21)]
+
+def test_mlfq_single_level_is_round_robin():
+    assert list(mlfq(workload(), (1,))[0]) == list(round_robin(workload(), 1)[0])
+
+def test_mlfq_boost():
+    # At 6 both processes are back on level 0 and share single-unit slices.
+    gantt, *_ = mlfq([Process(1, 0, 10), Process(2, 0, 10)], (1, 2), boost=5)
+    assert gantt[:6] == [(1, 0, 1), (2, 1, 2), (1, 2, 4), (2, 4, 6), (1, 6, 7), (2, 7, 8)]
+
+def test_mlfq_needs_positive_quanta():
+    with pytest.raises(ValueError):
+        mlfq(workload(), ())
+    with pytest.raises(ValueError):
+        mlfq(workload(), (2, 0))
+
+def test_cfs_shares_equally():
+    processes = [Process(1, 0, 4), Process(2, 0, 4)]
+    assert cfs(processes, latency=4, min_granularity=1)[0] == [(1, 0, 2), (2, 2, 4), (1, 4, 6), (2, 6, 8)]
+    gantt, *_ = cfs(processes, latency=4, min_granularity=1, context_switch=1)
+    assert gantt == [(1, 0, 2), (2, 3, 5), (1, 6, 8), (2, 9, 11)]
+
+def test_cfs_weights_by_nice_value():
+    gantt, *_ = cfs([Process(1, 0, 20, -5), Process(2, 0, 20, 5)], latency=12, min_granularity=1)
+    assert gantt[:3] == [(1, 0, 10), (2, 10, 12), (1, 12, 22)]
+
+def test_cfs_idle_gap():
+    gantt, completed, wait, turn, *_ = cfs([Process(1, 0, 3), Process(2, 10, 2)])
+    assert gantt == [(1, 0, 3), (2, 10, 12)]
+    assert (wait, turn) == (0, 2.5)
+
+def test_cfs_needs_positive_granularity():
+    with pytest.raises(ValueError):
+        cfs(workload(), min_granularity=0)
+
+# MLFQ and CFS also run with a context switch, which is where a zero slice
+# used to be mistaken for an arrival during the switch.
+@pytest.mark.parametrize("name, context_switch", [(name, 0) for name in ENGINES] + [("mlfq", 1), ("cfs", 1)])
+@pytest.mark.parametrize("as_table", [False, True], ids=["list", "table"])
+def test_zero_burst_completes(name, as_table, context_switch):
+    processes = [Process(1, 0, 3, 1), Process(2, 1, 0, 1), Process(3, 2, 2, 1)]
+    if as_table:
+        processes = ProcessTable.from_processes(processes)
+    if context_switch:
+        gantt, completed, *_ = ENGINES[name](processes, context_switch=context_switch)
+    else:
+        gantt, completed, *_ = ENGINES[name](processes)
+    assert sorted(p.pid for p in completed) == [1, 2, 3]
+    zero = next(p for p in completed if p.pid == 2)
+    assert zero.completion_time >= zero.arrival_time
+    assert any(pid == 2 and start == end for pid, start, end in gantt)
+
+@pytest.mark.parametrize("name", ENGINES)
+def test_process_lists_take_any_pids_and_times(name):
+    # Only tables are int64; Process lists may have string pids and
+    # fractional times, as they always could.
+    processes = [Process("A", 0.5, 2.5, 1), Process("B", 1, 1.5, 2), Process("C", 6.5, 0.5, 0)]
+    gantt, completed, wait, turn, cpu, throughput = ENGINES[name](processes)
+    assert sorted(p.pid for p in completed) == ["A", "B", "C"]
+    assert all(p.completion_time >= p.arrival_time + p.burst_time for p in completed)
+    assert sum(end - start for _, start, end in gantt) == 4.5
+    assert cpu == 100 * 4.5 / 7
+
+def test_sjf_with_fractional_times():
+    gantt, completed, *_ = sjf([Process("A", 0.5, 2.5, 1), Process("B", 1, 1.5, 2)])
+    assert gantt == [("A", 0.5, 3.0), ("B", 3.0, 4.5)]
+    assert completions(completed) == [("A", 3.0), ("B", 4.5)]
+
+def test_idle_gap():
+    gantt, completed, *_ = sjf([Process(1, 0, 2), Process(2, 10, 1)])
+    assert gantt == [(1, 0, 2), (2, 10, 11)]
+
+def test_metrics():
+    gantt, completed, wait, turn, cpu, throughput = sjf(workload())
+    assert turn == (5 + 4 + 5 + 10) / 4
+    assert wait == turn - 11 / 4
+    assert cpu == 100
+    assert throughput == 4 / 11
+
+@pytest.mark.parametrize("engine", [sjf, preemptive_sjf, priority_scheduling, mlfq, cfs])
+def test_step_budget_exceeded(engine):
+    with pytest.raises(StepBudgetExceeded) as raised:
+        engine(workload(), max_steps=3)
+    assert raised.value.budget == 3
+    assert raised.value.steps == 4
+
+def test_round_robin_step_budget():
+    with pytest.raises(StepBudgetExceeded) as raised:
+        round_robin(workload(), 1, max_steps=2)
+    assert raised.value.algorithm == "Round Robin"
+
+def test_no_fixed_iteration_cap():
+    # Far more than the old 1000 iterations.
+    processes = [Process(pid, pid, 3) for pid in range(2000)]
+    assert step_budget(processes) > 2000
+    gantt, completed, *_ = round_robin(processes, 1)
+    assert len(completed) == 2000
+
+def test_default_step_budget_is_enough_for_long_bursts():
+    processes = [Process(pid, pid, 10 ** 9 + pid) for pid in range(50)]
+    assert step_budget(processes) > 50
+    gantt, completed, *_ = preemptive_sjf(processes)
+    assert len(completed) == 50
+
+class StuckPolicy(FifoPolicy):
+    # Never lets the selected process run.
+    def time_slice(self, index, time, next_arrival):
+        return 0
+
+def test_non_preemptive_budget_ignores_burst_length():
+    processes = [Process(1, 0, 2 ** 40), Process(2, 1, 2 ** 40)]
+    assert step_budget(processes, None) == 7
+    gantt, completed, *_ = sjf(processes)
+    assert completions(completed) == [(1, 2 ** 40), (2, 2 ** 41)]
+    with pytest.raises(StepBudgetExceeded) as raised:
+        simulate(processes, StuckPolicy())
+    assert raised.value.budget == 7
+
+def test_process_table_take():
+    table = ProcessTable([1, 2, 3], [0, 3, 5], [4, 5, 6], [None, 7, 1])
+    for indices in (range(3), [0, 1, 2], [2, 0]):
+        taken = table.take(indices)
+        assert [taken[i].pid for i in range(len(taken))] == [table[i].pid for i in indices]
+        assert list(taken.priority) == [table.priority[i] for i in indices]
+        taken.burst_time[0] = 0
+        assert list(table.burst_time) == [4, 5, 6]
+
+def test_process_table_rows():
+    table = ProcessTable([1, 2], [0, 3], [4, 5], [None, 7])
+    assert len(table) == 2
+    assert list(table.priority) == [NO_PRIORITY, 7]
+    assert table[0].priority is None
+    assert (table[-1].pid, table[-1].arrival_time, table[-1].burst_time, table[-1].priority) == (2, 3, 5, 7)
+    table.append(3, 4, 1)
+    assert table[2].burst_time == 1
+    with pytest.raises(IndexError):
+        table[3]
+    with pytest.raises(ValueError):
+        ProcessTable([1, 2], [0], [1, 2])
+
+@pytest.mark.parametrize("name", ENGINES)
+def test_list_and_table_input_agree(name):
+    rng = random.Random(name)
+    for _ in range(50):
+        processes = random_workload(rng)
+        table = ProcessTable.from_processes(processes)
+        gantt, completed, *metrics = ENGINES[name](processes)
+        table_gantt, table_completed, *table_metrics = ENGINES[name](table)
+        assert list(table_gantt) == list(gantt)
+        assert completions(table_completed) == completions(completed)
+        assert [p.waiting_time for p in table_completed] == [p.waiting_time for p in completed]
+        assert table_metrics == pytest.approx(metrics)
+        # The input table is left untouched.
+        assert list(table.completion_time) == [0] * len(table)
+
+def test_step_budget_exceeded_pickles():
+    error = pickle.loads(pickle.dumps(StepBudgetExceeded("SJF", 4, 3, [2, 1])))
+    assert (error.algorithm, error.steps, error.budget, error.completed_pids) == ("SJF", 4, 3, [2, 1])
+    assert str(error) == "SJF: exceeded step budget of 3 after 4 steps with 2 processes completed"
@@ -0,0 +1,121 @@
+import pytest
+
+from cpusched.backend import GanttChart, Process, ProcessTable, fcfs, round_robin, sjf
+from cpusched.files import (load_workload, read_binary, read_csv, read_json, write_csv, write_gantt_binary,
+                          write_json, write_results_binary, write_workload_binary)
+
+def workload():
+    return [Process(1, 0, 5, 3), Process(2, 1, 3, None), Process(3, 2, 0, -2), Process(4, 3, 2 ** 40, 0)]
+
+def rows(processes):
+    return [(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]
+
+def test_csv_round_trip(tmp_path):
+    path = str(tmp_path / "workload.csv")
+    write_csv(workload(), path)
+    assert rows(load_workload(path)) == rows(workload())
+
+def test_csv_defaults(tmp_path):
+    path = tmp_path / "workload.csv"
+    path.write_text("arrival_time,burst_time,priority\n0,3,-\n2,4,\n")
+    assert rows(read_csv(str(path))) == [(1, 0, 3, None), (2, 2, 4, None)]
+
+def test_csv_missing_columns(tmp_path):
+    path = tmp_path / "workload.csv"
+    path.write_text("pid,arrival_time\n1,0\n")
+    with pytest.raises(ValueError, match="burst_time"):
+        read_csv(str(path))
+
+def test_text_formats_reject_duplicate_pids(tmp_path):
+    path = tmp_path / "workload.csv"
+    path.write_text("pid,arrival_time,burst_time\n1,0,2\n2,1,2\n1,5,2\n")
+    with pytest.raises(ValueError, match="duplicate pid 1"):
+        read_csv(str(path))
+    path = tmp_path / "workload.json"
+    path.write_text('{"pid": [4, 4], "arrival_time": [0, 1], "burst_time": [1, 1]}')
+    with pytest.raises(ValueError, match="duplicate pid 4"):
+        read_json(str(path))
+
+def test_unknown_extension():
+    with pytest.raises(ValueError):
+        load_workload("workload.xlsx")
+
+def test_json_round_trip(tmp_path):
+    path = str(tmp_path / "workload.json")
+    write_json(workload(), path)
+    assert rows(load_workload(path)) == rows(workload())
+
+def test_json_records(tmp_path):
+    path = tmp_path / "workload.json"
+    path.write_text('[{"arrival_time": 0, "burst_time": 3}, {"pid": 7, "arrival_time": 1, "burst_time": 2, "priority": 4}]')
+    assert rows(read_json(str(path))) == [(1, 0, 3, None), (7, 1, 2, 4)]
+
+def test_csv_columns_in_any_order_and_blank_lines(tmp_path):
+    path = tmp_path / "workload.csv"
+    path.write_text("burst_time, arrival_time ,pid\n3,0,5\n\n2,1,6\n")
+    assert rows(read_csv(str(path))) == [(5, 0, 3, None), (6, 1, 2, None)]
+
+def test_binary_workload_round_trip(tmp_path):
+    path = str(tmp_path / "workload.cpus")
+    write_workload_binary(workload(), path)
+    table = load_workload(path)
+    assert isinstance(table, ProcessTable)
+    assert rows(table) == rows(workload())
+    assert list(table.completion_time) == [0, 0, 0, 0]
+
+def test_binary_workload_runs_and_leaves_the_file_alone(tmp_path):
+    path = str(tmp_path / "workload.cpus")
+    write_workload_binary(workload(), path)
+    gantt, completed, *_ = sjf(read_binary(path))
+    assert sorted(p.pid for p in completed) == [1, 2, 3, 4]
+    assert rows(read_binary(path)) == rows(workload())
+
+def test_binary_workload_through_fcfs_shares_input_columns(tmp_path):
+    pytest.importorskip("numpy")
+    path = str(tmp_path / "workload.cpus")
+    write_workload_binary(workload(), path)
+    table = read_binary(path)
+    gantt, completed, *_ = fcfs(table)
+    # In arrival order and read-only, so the input columns are not copied.
+    assert completed.pid is table.pid and completed.burst_time is table.burst_time
+    assert gantt == fcfs(workload())[0]
+    results = str(tmp_path / "results.cpus")
+    write_results_binary(completed, results)
+    assert list(read_binary(results).completion_time) == list(completed.completion_time)
+
+def test_binary_results_round_trip(tmp_path):
+    gantt, completed, *_ = round_robin(workload(), 2)
+    path = str(tmp_path / "results.cpus")
+    write_results_binary(completed, path)
+    table = read_binary(path)
+    assert rows(table) == rows(completed)
+    for name in ("completion_time", "waiting_time", "turnaround_time"):
+        assert list(getattr(table, name)) == [getattr(p, name) for p in completed]
+
+def test_binary_gantt_round_trip(tmp_path):
+    gantt, *_ = round_robin(ProcessTable.from_processes(workload()), 2)
+    path = str(tmp_path / "gantt.cpus")
+    write_gantt_binary(gantt, path)
+    loaded = read_binary(path)
+    assert isinstance(loaded, GanttChart)
+    assert loaded == gantt
+    write_gantt_binary(list(gantt), path)
+    assert read_binary(path) == gantt
+
+def test_binary_empty_round_trip(tmp_path):
+    path = str(tmp_path / "empty.cpus")
+    write_workload_binary(ProcessTable(), path)
+    assert len(read_binary(path)) == 0
+
+def test_binary_rejects_other_files(tmp_path):
+    path = tmp_path / "bad.cpus"
+    path.write_bytes(b"not a workload file at all, just text" * 2)
+    with pytest.raises(ValueError):
+        read_binary(str(path))
+
+def test_binary_rejects_truncated_files(tmp_path):
+    path = tmp_path / "workload.cpus"
+    write_workload_binary(workload(), str(path))
+    path.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(ValueError):
+        read_binary(str(path))
@@ -0,0 +1,51 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+from cpusched.backend import GanttChart
+from cpusched.gantt import GanttPlot, coalesce, gantt_columns, merge_segments
+
+def test_gantt_columns_from_tuples_and_charts():
+    for gantt in ([(1, 0, 2), (2, 2, 5)], GanttChart.from_segments([(1, 0, 2), (2, 2, 5)])):
+        pids, starts, ends = gantt_columns(gantt)
+        assert (pids.tolist(), starts.tolist(), ends.tolist()) == ([1, 2], [0, 2], [2, 5])
+
+def test_merge_segments_joins_touching_slices_of_one_pid():
+    pids, starts, ends = merge_segments(np.array([1, 1, 2, 1]), np.array([0, 2, 3, 5]), np.array([2, 3, 5, 6]))
+    assert list(zip(pids.tolist(), starts.tolist(), ends.tolist())) == [(1, 0, 3), (2, 3, 5), (1, 5, 6)]
+
+def test_coalesce_merges_gaps_below_resolution_per_pid():
+    pids, starts, ends = coalesce(np.array([1, 2, 1, 1]), np.array([0, 1, 3, 10]), np.array([2, 2, 4, 12]), 1)
+    assert list(zip(pids.tolist(), starts.tolist(), ends.tolist())) == [(1, 0, 4), (1, 10, 12), (2, 1, 2)]
+
+def test_plot_draws_one_collection_and_rerenders_on_zoom():
+    fig, ax = plt.subplots()
+    gantt = GanttChart.from_segments([(pid % 3, t, t + 1) for pid, t in zip(range(10000), range(0, 20000, 2))])
+    plot = GanttPlot(ax, gantt)
+    bars = plot._artists[0]
+    assert len(bars.get_paths()) < len(gantt)
+    ax.set_xlim(0, 10)
+    assert plot._artists[0] is not bars
+    assert len(plot._artists[0].get_paths()) <= 6
+    plt.close(fig)
+
+def test_coalesce_keeps_spans_that_swallow_nested_segments():
+    # One band holding a long span of one pid and short ones of others.
+    rows, starts, ends = coalesce(np.zeros(3, dtype=np.int64), np.array([0, 2, 8]), np.array([10, 3, 9]), 0)
+    assert list(zip(rows.tolist(), starts.tolist(), ends.tolist())) == [(0, 0, 10)]
+
+def test_plot_bands_pids_closer_than_a_pixel():
+    fig, ax = plt.subplots(figsize=(4, 2), dpi=50)
+    gantt = GanttChart.from_segments([(pid, pid, pid + 1) for pid in range(20000)])
+    plot = GanttPlot(ax, gantt)
+    # At most one rectangle per pixel band and x pixel, and no labels.
+    assert len(plot._artists[0].get_paths()) <= ax.bbox.height * ax.bbox.width
+    assert len(plot._artists[0].get_paths()) < 2000
+    assert len(plot._artists) == 1
+    ax.set_ylim(0, 5)
+    assert len(plot._artists[0].get_paths()) <= 6
+    plt.close(fig)
@@ -0,0 +1,130 @@
+import pytest
+
+import cpusched.metrics
+from cpusched.backend import GanttChart, Process, ProcessTable, calculate_metrics, fcfs, round_robin
+from cpusched.metrics import Histogram, RunningMetrics, _bucket, _bucket_value, summarize
+from tests.test_engines import workload
+
+@pytest.fixture(params=["numpy", "pure"])
+def backend(request, monkeypatch):
+    # Every test runs on the vectorized path and on the pure-Python fallback.
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(cpusched.metrics, "_numpy", lambda: None)
+    return request.param
+
+def test_bucket_arithmetic():
+    # Exact below 128, then 64 buckets per power of two.
+    assert [_bucket(value) for value in (0, 1, 127)] == [0, 1, 127]
+    assert [_bucket(value) for value in (128, 129, 130, 255, 256, 259, 260)] == [128, 128, 129, 191, 192, 192, 193]
+    assert [_bucket_value(index) for index in (5, 127, 128, 129, 192)] == [5, 127, 128, 130, 257]
+    for value in (1000, 12345, 2 ** 40 + 17, 2 ** 62):
+        assert abs(_bucket_value(_bucket(value)) - value) <= value / 128
+
+def test_histogram_percentiles_are_nearest_rank(backend):
+    histogram = Histogram()
+    histogram.add_values(range(1, 11))
+    assert [histogram.percentile(q) for q in (10, 50, 95, 99, 100)] == [1, 5, 10, 10, 10]
+    assert (histogram.count, histogram.total, histogram.min, histogram.max) == (10, 55, 1, 10)
+    assert histogram.mean() == 5.5
+
+def test_histogram_clamps_to_observed_values(backend):
+    # 1000..1007 share a bucket whose midpoint, 1003, was never seen.
+    histogram = Histogram()
+    histogram.add_values([1000])
+    assert histogram.percentile(50) == 1000
+    histogram.add_values([1001, 1007])
+    assert histogram.percentile(50) == 1003
+    histogram.add_values([1])
+    assert histogram.percentile(100) == 1003
+    histogram = Histogram()
+    histogram.add_values([1004, 1005])
+    assert histogram.percentile(1) == 1004
+
+def test_histogram_add_values_matches_add(backend):
+    values = [0, 3, 127, 128, 500, 4096, 99999, 2 ** 40]
+    one, many = Histogram(), Histogram()
+    for value in values:
+        one.add(value)
+    many.add_values(values)
+    assert list(many.counts) == list(one.counts)
+    with pytest.raises(ValueError):
+        many.add_values([3, -1])
+
+def test_histogram_merge():
+    first, second = Histogram(), Histogram()
+    first.add(4, count=3)
+    second.add(200)
+    first.merge(second)
+    first.merge(Histogram())
+    assert (first.count, first.total, first.min, first.max) == (4, 212, 4, 200)
+    assert first.percentile(75) == 4 and first.percentile(100) == 200
+
+def test_empty_metrics():
+    metrics = RunningMetrics()
+    assert metrics.result() == (0, 0, 0, 0)
+    assert metrics.fairness() == 0
+    assert metrics.summary()["p99_waiting_time"] == 0
+
+def test_fairness(backend):
+    metrics = RunningMetrics()
+    # Shares 2/2 and 1/2: (1.5 ** 2) / (2 * 1.25).
+    metrics.add_columns([0, 0], [2, 1], [2, 2])
+    assert metrics.fairness() == pytest.approx(0.9)
+    equal = RunningMetrics()
+    equal.add_columns([0, 5, 9], [3, 3, 3], [6, 11, 15])
+    assert equal.fairness() == pytest.approx(1)
+
+def test_summarize_looks_up_response_times_by_pid(backend):
+    # Completed out of pid order; P7 runs first, P3 waits 1 before its
+    # first slice, and the CPU switches twice.
+    gantt = [(7, 0, 1), (3, 1, 3), (7, 3, 4)]
+    completed = [Process(3, 0, 2), Process(7, 0, 2)]
+    completed[0].completion_time, completed[1].completion_time = 3, 4
+    summary = summarize(gantt, completed).summary()
+    assert summary["avg_response_time"] == 0.5
+    assert summary["p99_response_time"] == 1
+    assert summary["context_switches"] == 2
+    assert summary["idle_time"] == 0
+    assert summary["p50_waiting_time"] == 1 and summary["p99_turnaround_time"] == 4
+
+@pytest.mark.parametrize("as_table", [False, True], ids=["list", "table"])
+def test_summarize_rejects_duplicate_pids(backend, as_table):
+    processes = [Process(1, 0, 2), Process(1, 5, 2), Process(2, 1, 2)]
+    if as_table:
+        processes = ProcessTable.from_processes(processes)
+    gantt, completed, *_ = fcfs(processes)
+    metrics = RunningMetrics()
+    with pytest.raises(ValueError, match="duplicate pid 1"):
+        summarize(gantt, completed, metrics)
+    assert metrics.count == 0
+
+@pytest.mark.parametrize("as_table", [False, True], ids=["list", "table"])
+def test_summarize_skips_pids_missing_from_completed(backend, as_table):
+    # P9 and P0 are in the chart but not in completed.
+    gantt = GanttChart([9, 3, 7, 0], [0, 1, 3, 5], [1, 3, 5, 6])
+    completed = [Process(3, 0, 2), Process(7, 2, 2)]
+    completed[0].completion_time, completed[1].completion_time = 3, 5
+    if as_table:
+        completed = ProcessTable.from_processes(completed)
+    metrics = summarize(gantt, completed)
+    assert (metrics.response.count, metrics.response.total) == (2, 2)
+    assert metrics.context_switches == 3
+
+def test_summarize_matches_calculate_metrics(backend):
+    gantt, completed, *metrics = round_robin(workload(), 2)
+    running = summarize(gantt, completed)
+    assert running.result() == pytest.approx(metrics)
+    assert running.count == 4
+    table = ProcessTable.from_processes(completed)
+    for process, index in zip(completed, range(len(table))):
+        table.completion_time[index] = process.completion_time
+    assert summarize(GanttChart.from_segments(gantt), table).summary() == running.summary()
+
+def test_idle_time(backend):
+    gantt = [(1, 0, 2), (2, 10, 11)]
+    completed = [Process(1, 0, 2), Process(2, 10, 1)]
+    completed[0].completion_time, completed[1].completion_time = 2, 11
+    assert calculate_metrics(completed)[2] == pytest.approx(300 / 11)
+    assert summarize(gantt, completed).idle_time() == 8
@@ -0,0 +1,73 @@
+import json
+from itertools import count
+
+import pytest
+
+from cpusched import registry
+from cpusched.backend import Process, ProcessTable, fcfs, round_robin
+from cpusched.profiling import PHASES, Profiler
+from tests.test_engines import workload
+
+def ticking_profiler(**options):
+    # Every clock read advances one microsecond.
+    ticks = count(0, 1000)
+    return Profiler(clock=lambda: next(ticks), **options)
+
+def test_profiled_run_is_unchanged():
+    profiler = ticking_profiler()
+    gantt, completed, *metrics = round_robin(workload(), 2, profiler=profiler)
+    expected_gantt, _, *expected = round_robin(workload(), 2)
+    assert list(gantt) == list(expected_gantt)
+    assert metrics == expected
+
+def test_round_robin_profile():
+    profiler = ticking_profiler(sample_every=2)
+    round_robin(workload(), 2, profiler=profiler)
+    report = profiler.to_dict()
+    # Seven slices: four dispatches, three preemptions, four completions.
+    assert [(run["label"], run["steps"]) for run in report["runs"]] == [("Round Robin", 7)]
+    assert report["counters"] == {"dispatches": 4, "preemptions": 3}
+    calls = {name: phase["calls"] for name, phase in report["phases"].items()}
+    assert calls == {"admit": 10, "select": 7, "slice": 7, "gantt": 7, "requeue": 3, "complete": 4, "metrics": 1}
+    assert set(calls) <= set(PHASES)
+    assert sum(phase["share"] for phase in report["phases"].values()) == pytest.approx(1)
+    assert report["phases"]["select"]["seconds"] == pytest.approx(7e-6)
+    assert report["queue_length"]["max"] == 4
+    assert len(report["event_rate"]) == 3
+
+def test_idle_jumps_are_counted():
+    profiler = ticking_profiler()
+    round_robin([Process(1, 0, 5), Process(2, 20, 1)], 2, profiler=profiler)
+    assert profiler.counters["idle"] == 1
+
+def test_vectorized_fcfs_is_one_select():
+    pytest.importorskip("numpy")
+    profiler = ticking_profiler()
+    fcfs(ProcessTable.from_processes(workload()), profiler=profiler)
+    assert profiler.calls["select"] == 1 and profiler.calls["metrics"] == 1
+    assert profiler.counters == {"dispatches": 4}
+
+@pytest.mark.parametrize("name", ["srtf", "mlfq", "cfs"])
+def test_every_simulated_algorithm_accepts_a_profiler(name):
+    profiler = ticking_profiler()
+    registry.get(name).run(workload(), profiler=profiler)
+    assert profiler.runs[0]["steps"] > 0
+    assert profiler.calls["complete"] == 4
+
+def test_spans_are_bounded():
+    profiler = ticking_profiler(max_spans=5)
+    round_robin(workload(), 1, profiler=profiler)
+    assert len(profiler.spans) == 5
+    assert profiler.dropped_spans == sum(profiler.calls.values()) - 5
+
+def test_exports(tmp_path):
+    profiler = ticking_profiler(sample_every=1)
+    round_robin(workload(), 2, profiler=profiler)
+    profiler.write_json(tmp_path / "profile.json")
+    assert json.loads((tmp_path / "profile.json").read_text())["counters"]["preemptions"] == 3
+    profiler.write_chrome_trace(tmp_path / "trace.json")
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    phases = [event for event in events if event.get("cat") == "phase"]
+    assert len(phases) == sum(profiler.calls.values())
+    assert all(event["dur"] == 1 for event in phases)
+    assert {event["name"] for event in events if event["ph"] == "C"} == {"event rate", "runnable"}
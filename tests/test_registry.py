@@ -0,0 +1,103 @@
+import pickle
+
+import pytest
+
+from cpusched import registry
+from cpusched.backend import Policy, round_robin, simulate
+from cpusched.trace import ListTrace
+from tests.test_engines import ENGINES, completions, workload
+
+class LastInPolicy(Policy):
+    # Runs the most recent arrival first, to completion.
+    label = "LIFO"
+
+    def __init__(self, limit=None):
+        self.limit = limit
+
+    def start(self, columns, remaining_burst):
+        super().start(columns, remaining_burst)
+        self.stack = []
+
+    def admit(self, index, time):
+        self.stack.append(index)
+
+    def select(self, time):
+        return self.stack.pop() if self.stack else None
+
+@pytest.fixture
+def registered():
+    names = []
+
+    def register(name, *args, **params):
+        algorithm = registry.register(name, *args, **params)
+        names.append(name)
+        return algorithm
+
+    yield register
+    for name in names:
+        registry.unregister(name)
+
+def test_builtin_algorithms():
+    assert registry.names()[:7] == ["fcfs", "sjf", "srtf", "rr", "priority", "mlfq", "cfs"]
+    assert registry.get("rr").params == {"quantum": 2}
+    assert registry.get("srtf").label == "Preemptive SJF"
+
+@pytest.mark.parametrize("name", ["fcfs", "sjf", "srtf", "priority", "mlfq", "cfs"])
+def test_builtins_run_the_backend(name):
+    gantt, completed, *metrics = registry.get(name).run(workload())
+    expected_gantt, expected, *expected_metrics = ENGINES[name](workload())
+    assert list(gantt) == list(expected_gantt)
+    assert metrics == pytest.approx(expected_metrics)
+
+def test_run_overrides_defaults():
+    gantt, *_ = registry.get("rr").run(workload(), quantum=1)
+    assert list(gantt) == list(round_robin(workload(), 1)[0])
+
+def test_unknown_and_duplicate_names(registered):
+    with pytest.raises(ValueError, match="Unknown algorithm 'lottery'"):
+        registry.get("lottery")
+    with pytest.raises(ValueError, match="already registered"):
+        registered("rr", round_robin)
+    registered("lifo", LastInPolicy)
+    assert registered("lifo", LastInPolicy, "LIFO", replace=True).label == "LIFO"
+
+def test_policy_class_runs_through_simulate(registered):
+    algorithm = registered("lifo", LastInPolicy, "LIFO", limit=3)
+    gantt, completed, *_ = algorithm.run(workload())
+    assert list(gantt) == [(1, 0, 5), (4, 5, 7), (3, 7, 8), (2, 8, 11)]
+    assert completions(completed) == completions(simulate(workload(), LastInPolicy())[1])
+    # Runners travel to worker processes and keep the policy's name.
+    runner = pickle.loads(pickle.dumps(algorithm.function))
+    assert runner.__qualname__ == "LastInPolicy"
+    assert list(runner(workload(), trace=ListTrace(["complete"]))[0]) == list(gantt)
+
+def test_decorator_and_lazy_targets(registered):
+    @registered("newest")
+    def newest(processes, context_switch=0):
+        return simulate(processes, LastInPolicy(), context_switch)
+
+    assert registry.get("newest").target is newest
+    algorithm = registered("round", "cpusched.backend:round_robin", quantum=3)
+    assert isinstance(algorithm.target, str)
+    assert algorithm.function is round_robin and algorithm.target is round_robin
+
+def test_plugins_from_the_environment(monkeypatch, tmp_path):
+    (tmp_path / "lifo_plugin.py").write_text(
+        "from cpusched import registry\n"
+        "from tests.test_registry import LastInPolicy\n"
+        "registry.register('lifo-plugin', LastInPolicy, 'LIFO')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv(registry.PLUGINS_VARIABLE, "lifo_plugin, ")
+    monkeypatch.setattr(registry, "_plugins_loaded", False)
+    try:
+        assert "lifo-plugin" in registry.names()
+    finally:
+        registry.unregister("lifo-plugin")
+
+def test_accepts(registered):
+    assert registry.get("rr").accepts("profiler")
+    assert registry.get("rr").accepts("quantum")
+    assert not registry.get("rr").accepts("latency")
+    assert registered("plain", lambda processes: None).accepts("profiler") is False
+    assert registered("lifo", LastInPolicy).accepts("profiler")
+    assert registered("anything", lambda processes, **params: None).accepts("profiler")
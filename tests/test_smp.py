@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from cpusched.backend import Process, ProcessTable, StepBudgetExceeded
+from cpusched.smp import smp_schedule
+from cpusched.trace import ListTrace
+from tests.test_engines import ENGINES, completions, random_workload, workload
+
+SINGLE_CPU = {"fcfs": ("fcfs", None), "sjf": ("sjf", None), "priority": ("priority", None), "rr": ("fcfs", 2)}
+
+# Per-core, a preempted process is queued before this instant's arrivals,
+# so only the global queue reproduces round_robin exactly.
+@pytest.mark.parametrize("engine, queues", [(engine, queues) for engine in SINGLE_CPU
+                                            for queues in ("global", "per-core")
+                                            if (engine, queues) != ("rr", "per-core")])
+def test_one_cpu_matches_single_engine(engine, queues):
+    policy, quantum = SINGLE_CPU[engine]
+    rng = random.Random(engine)
+    for _ in range(20):
+        processes = random_workload(rng)
+        lanes, completed, *result = smp_schedule(processes, 1, policy, quantum, queues)
+        gantt, expected, *metrics = ENGINES[engine](processes)
+        assert list(lanes[0]) == list(gantt)
+        assert completions(completed) == completions(expected)
+        assert result[:4] == pytest.approx(metrics[:4])
+        assert result[5] == 0
+
+def test_global_queue_schedule():
+    lanes, completed, wait, turn, utilization, throughput, cores, migrations = smp_schedule(workload(), 2)
+    assert [list(lane) for lane in lanes] == [[(1, 0, 5), (4, 5, 7)], [(2, 1, 4), (3, 4, 5)]]
+    assert completions(completed) == [(2, 4), (1, 5), (3, 5), (4, 7)]
+    assert (wait, turn) == (1.0, 3.75)
+    assert cores == pytest.approx([100.0, 400 / 7])
+    assert utilization == pytest.approx(1100 / 14)
+    assert migrations == 0
+
+def test_per_core_queues_keep_affinity():
+    lanes, *_, migrations = smp_schedule(workload(), 2, quantum=2, queues="per-core")
+    assert [list(lane) for lane in lanes] == [[(1, 0, 4), (3, 4, 5), (1, 5, 6)], [(2, 1, 4), (4, 4, 6)]]
+    assert migrations == 0
+
+@pytest.mark.parametrize("steal", [True, False])
+def test_work_stealing(steal):
+    processes = [Process(1, 0, 10), Process(2, 0, 1), Process(3, 0, 1), Process(4, 0, 1)]
+    trace = ListTrace(["migrate"])
+    lanes, completed, *_, migrations = smp_schedule(processes, 2, queues="per-core", steal=steal, trace=trace)
+    if steal:
+        assert list(lanes[1]) == [(2, 0, 1), (4, 1, 2), (3, 2, 3)]
+        assert migrations == 1 and trace.records == [("migrate", 3, 0, 1, 2)]
+    else:
+        assert list(lanes[0]) == [(1, 0, 10), (3, 10, 11)]
+        assert migrations == 0 and trace.records == []
+
+def test_more_cpus_never_hurt_global_fcfs():
+    rng = random.Random(3)
+    for _ in range(10):
+        processes = random_workload(rng, 30)
+        turnarounds = [smp_schedule(processes, cpus)[3] for cpus in (1, 2, 4, 30)]
+        assert turnarounds == sorted(turnarounds, reverse=True)
+        assert turnarounds[-1] == pytest.approx(sum(p.burst_time for p in processes) / len(processes))
+
+@pytest.mark.parametrize("queues", ["global", "per-core"])
+def test_table_input(queues):
+    lanes, completed, *metrics = smp_schedule(ProcessTable.from_processes(workload()), 2, "sjf", 2, queues)
+    expected_lanes, expected, *expected_metrics = smp_schedule(workload(), 2, "sjf", 2, queues)
+    assert [list(lane) for lane in lanes] == [list(lane) for lane in expected_lanes]
+    assert completions(completed) == completions(expected)
+    assert metrics == expected_metrics
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="cpus"):
+        smp_schedule(workload(), 0)
+    with pytest.raises(ValueError, match="policy"):
+        smp_schedule(workload(), 2, "mlfq")
+    with pytest.raises(ValueError, match="queue layout"):
+        smp_schedule(workload(), 2, queues="shared")
+    for quantum in (0, -2):
+        with pytest.raises(ValueError, match="quantum"):
+            smp_schedule(workload(), 2, quantum=quantum)
+
+@pytest.mark.parametrize("quantum", [None, 2])
+@pytest.mark.parametrize("queues", ["global", "per-core"])
+def test_zero_bursts(queues, quantum):
+    lanes, completed, wait, turn, utilization, throughput, cores, _ = smp_schedule(
+        [Process(1, 0, 0), Process(2, 0, 0), Process(3, 1, 0)], 2, quantum=quantum, queues=queues)
+    assert completions(completed) == [(1, 0), (2, 0), (3, 1)]
+    assert [list(lane) for lane in lanes] == [[(1, 0, 0), (3, 1, 1)], [(2, 0, 0)]]
+    assert (wait, turn) == (0, 0)
+    assert smp_schedule([Process(1, 0, 0)], 1, quantum=quantum, queues=queues)[3] == 0
+
+def test_step_budget():
+    with pytest.raises(StepBudgetExceeded):
+        smp_schedule(workload(), 2, quantum=1, max_steps=3)
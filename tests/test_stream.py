@@ -0,0 +1,64 @@
+import itertools
+import random
+
+import pytest
+
+from cpusched.backend import Process, fcfs, preemptive_sjf, priority_scheduling, sjf
+from cpusched.files import iter_csv, write_csv
+from cpusched.stream import RunningMetrics, stream_fcfs, stream_priority, stream_sjf, stream_srtf
+
+STREAMS = {
+    "fcfs": (stream_fcfs, fcfs),
+    "sjf": (stream_sjf, sjf),
+    "priority": (stream_priority, priority_scheduling),
+    "srtf": (stream_srtf, preemptive_sjf),
+}
+
+def arrival_ordered(rng, n=12):
+    arrival = 0
+    processes = []
+    for pid in range(n):
+        arrival += rng.randint(0, 4)
+        processes.append(Process(pid, arrival, rng.randint(0, 8), rng.choice([None, 0, 1, 2])))
+    return processes
+
+@pytest.mark.parametrize("name", STREAMS)
+def test_stream_matches_batch(name):
+    stream, batch = STREAMS[name]
+    rng = random.Random(name)
+    for _ in range(50):
+        processes = arrival_ordered(rng)
+        metrics = RunningMetrics()
+        events = list(stream(((p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes), metrics))
+        gantt, completed, *batch_metrics = batch(processes)
+        assert [event[1:] for event in events if event[0] == "segment"] == list(gantt)
+        assert [(event[1], event[4]) for event in events if event[0] == "complete"] == \
+            [(p.pid, p.completion_time) for p in completed]
+        assert metrics.result() == pytest.approx(batch_metrics)
+
+def test_stream_accepts_process_objects():
+    events = list(stream_sjf([Process(1, 0, 3), Process(2, 1, 1)]))
+    assert events == [("segment", 1, 0, 3), ("complete", 1, 0, 3, 3),
+                      ("segment", 2, 3, 4), ("complete", 2, 1, 1, 4)]
+
+def test_stream_is_lazy():
+    arrivals = ((pid, pid * 10, 5) for pid in itertools.count())
+    events = list(itertools.islice(stream_srtf(arrivals), 4))
+    assert events == [("segment", 0, 0, 5), ("complete", 0, 0, 5, 5),
+                      ("segment", 1, 10, 15), ("complete", 1, 10, 5, 15)]
+
+def test_stream_rejects_out_of_order_arrivals():
+    with pytest.raises(ValueError):
+        list(stream_fcfs([(1, 5, 1), (2, 3, 1)]))
+
+def test_stream_from_csv(tmp_path):
+    path = str(tmp_path / "trace.csv")
+    write_csv([Process(1, 0, 2, 1), Process(2, 1, 1)], path)
+    assert list(iter_csv(path)) == [(1, 0, 2, 1), (2, 1, 1, None)]
+    metrics = RunningMetrics()
+    for _ in stream_fcfs(iter_csv(path), metrics):
+        pass
+    assert metrics.result() == (0.5, 2.0, 100.0, 2 / 3)
+
+def test_running_metrics_empty():
+    assert RunningMetrics().result() == (0, 0, 0, 0)
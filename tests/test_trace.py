@@ -0,0 +1,90 @@
+import io
+import random
+
+import pytest
+
+from cpusched.backend import Process, ProcessTable, cfs, fcfs, mlfq, preemptive_sjf, priority_scheduling, round_robin, sjf
+from cpusched.trace import FileTrace, ListTrace, StdoutTrace, format_event
+
+ENGINES = {
+    "fcfs": fcfs,
+    "sjf": sjf,
+    "srtf": preemptive_sjf,
+    "rr": lambda processes, trace: round_robin(processes, 2, trace=trace),
+    "priority": priority_scheduling,
+}
+
+def workload():
+    return [Process(1, 0, 5, 3), Process(2, 1, 3, 1), Process(3, 2, 1, 2), Process(4, 9, 2, 0)]
+
+@pytest.mark.parametrize("name", ENGINES)
+def test_silent_without_a_sink(name, capsys):
+    ENGINES[name](workload(), trace=None)
+    assert capsys.readouterr().out == ""
+
+@pytest.mark.parametrize("name", ENGINES)
+def test_segments_match_the_gantt_chart(name):
+    trace = ListTrace()
+    gantt, completed, *metrics = ENGINES[name](workload(), trace=trace)
+    assert trace.records[0][0] == "begin"
+    assert trace.records[-1] == ("metrics", *metrics)
+    assert [record[1:] for record in trace.records if record[0] == "segment"] == list(gantt)
+    assert [record[1:] for record in trace.records if record[0] == "complete"] == \
+        [(p.pid, p.completion_time) for p in completed]
+
+def test_segments_match_with_context_switches():
+    # A slice cut to nothing by an arrival during the switch must not make
+    # the next switch report the previous segment again.
+    trace = ListTrace(events=("segment",))
+    processes = [Process(1, 8, 3), Process(2, 1, 4), Process(3, 1, 6), Process(4, 10, 5)]
+    gantt, *_ = mlfq(processes, (2, 4), None, 2, trace=trace)
+    assert [record[1:] for record in trace.records] == list(gantt)
+    rng = random.Random(19)
+    for _ in range(200):
+        processes = [Process(pid, rng.randint(0, 30), rng.randint(0, 8), rng.randint(-5, 5)) for pid in range(8)]
+        for engine in (mlfq, cfs):
+            trace = ListTrace(events=("segment",))
+            gantt, *_ = engine(processes, context_switch=rng.randint(1, 3), trace=trace)
+            assert [record[1:] for record in trace.records] == list(gantt)
+
+def test_event_filter():
+    trace = ListTrace(events=("complete",))
+    sjf(workload(), trace=trace)
+    assert trace.records == [("complete", 1, 5), ("complete", 3, 6), ("complete", 2, 9), ("complete", 4, 11)]
+
+def test_idle_event():
+    trace = ListTrace(events=("idle",))
+    sjf([Process(1, 2, 3)], trace=trace)
+    assert trace.records == [("idle", 2)]
+
+def test_fcfs_trace_matches_for_list_and_table():
+    pytest.importorskip("numpy")
+    rows = [(1, 2, 3), (2, 3, 0), (3, 9, 2), (4, 9, 1)]
+    from_list, from_table = ListTrace(), ListTrace()
+    fcfs([Process(*row) for row in rows], trace=from_list)
+    fcfs(ProcessTable.from_processes([Process(*row) for row in rows]), trace=from_table)
+    assert from_table.records == from_list.records
+    assert ("idle", 9) in from_table.records
+    assert ("dispatch", 1, 2) in from_table.records
+
+def test_stdout_trace_keeps_the_old_messages():
+    stream = io.StringIO()
+    fcfs([Process(1, 0, 2)], trace=StdoutTrace(stream=stream))
+    assert stream.getvalue().splitlines() == [
+        "FCFS Execution:",
+        "P1 started at 0",
+        "P1: Start=0, End=2",
+        "P1 completed at 2",
+        "Metrics: Wait=0.00, Turn=2.00, CPU=100.00%, Throughput=0.5000",
+    ]
+
+def test_format_event():
+    assert format_event("begin", ("Round Robin", {"quantum": 2})) == "Round Robin Execution (Quantum=2):"
+    assert format_event("preempt", (3, 7)) == "Preempted to P3 at 7"
+    assert format_event("custom", (1, 2)) == "custom 1 2"
+
+def test_file_trace(tmp_path):
+    path = tmp_path / "trace.tsv"
+    with FileTrace(str(path), events=("segment",)) as trace:
+        fcfs([Process(1, 0, 2), Process(2, 0, 3)], trace=trace)
+    assert path.read_text().splitlines() == ["segment\t1\t0\t2", "segment\t2\t2\t5"]
@@ -0,0 +1,60 @@
+import time
+
+from cpusched.backend import Process, ProcessTable, StepBudgetExceeded, round_robin, sjf
+from cpusched.worker import SimulationWorker
+
+def workload():
+    return ProcessTable.from_processes([Process(1, 0, 5, 3), Process(2, 1, 3, 1), Process(3, 2, 1, None)])
+
+def wait_for(worker, timeout=60):
+    messages = []
+    deadline = time.monotonic() + timeout
+    while worker.busy and time.monotonic() < deadline:
+        messages += worker.poll()
+        time.sleep(0.01)
+    return messages
+
+def test_results_arrive_through_poll():
+    worker = SimulationWorker(max_workers=2)
+    try:
+        worker.submit([("sjf", sjf, workload(), {}), ("rr", round_robin, workload(), {"quantum": 2}),
+                       ("bad", round_robin, workload(), {"quantum": 2, "bogus": 1})])
+        assert worker.total == 3
+        messages = {name: (kind, value) for kind, name, value in wait_for(worker)}
+    finally:
+        worker.shutdown()
+    assert not worker.busy
+    assert messages["sjf"][0] == "result"
+    assert messages["sjf"][1][0] == sjf(workload())[0]
+    assert messages["rr"][1][2:] == round_robin(workload(), 2)[2:]
+    assert messages["bad"][0] == "error"
+
+def test_scheduling_errors_come_back_intact():
+    worker = SimulationWorker(max_workers=1)
+    try:
+        worker.submit([("rr", round_robin, workload(), {"quantum": 1, "max_steps": 2}),
+                       ("sjf", sjf, workload(), {})])
+        messages = {name: (kind, value) for kind, name, value in wait_for(worker)}
+    finally:
+        worker.shutdown()
+    kind, error = messages["rr"]
+    assert kind == "error" and isinstance(error, StepBudgetExceeded)
+    assert (error.algorithm, error.steps, error.budget) == ("Round Robin", 3, 2)
+    assert messages["sjf"][0] == "result"
+
+def test_cancel_resets_progress():
+    worker = SimulationWorker(max_workers=1)
+    worker.submit([("sjf", sjf, workload(), {})])
+    worker.cancel()
+    assert not worker.busy
+    assert worker.poll() == []
+
+def test_pool_is_sized_for_max_workers():
+    # A first batch of one job must not leave later batches on one process.
+    worker = SimulationWorker(max_workers=2)
+    try:
+        worker.submit([("sjf", sjf, workload(), {})])
+        wait_for(worker)
+        assert worker._pool._processes == 2
+    finally:
+        worker.shutdown()
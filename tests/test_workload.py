@@ -0,0 +1,58 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cpusched.backend import NO_PRIORITY
+from cpusched.files import load_workload
+from cpusched.workload import ARRIVALS, BURSTS, PRIORITIES, MAX_BURST, bursty_arrivals, generate, main
+
+def columns(table):
+    return [list(getattr(table, name)) for name in ("pid", "arrival_time", "burst_time", "priority")]
+
+@pytest.mark.parametrize("arrivals", ARRIVALS)
+@pytest.mark.parametrize("bursts", BURSTS)
+def test_same_seed_same_workload(arrivals, bursts):
+    first = generate(500, arrivals, bursts, seed=7)
+    assert columns(generate(500, arrivals, bursts, seed=7)) == columns(first)
+    assert columns(generate(500, arrivals, bursts, seed=8)) != columns(first)
+
+@pytest.mark.parametrize("arrivals", ARRIVALS)
+@pytest.mark.parametrize("bursts", BURSTS)
+@pytest.mark.parametrize("priorities", PRIORITIES)
+def test_columns_are_valid(arrivals, bursts, priorities):
+    table = generate(1000, arrivals, bursts, priorities, seed=1)
+    assert list(table.pid) == list(range(1, 1001))
+    arrival_times = np.asarray(table.arrival_time)
+    assert arrival_times[0] >= 0 and np.all(np.diff(arrival_times) >= 0)
+    burst_times = np.asarray(table.burst_time)
+    assert burst_times.min() >= 1 and burst_times.max() <= MAX_BURST
+    if priorities == "none":
+        assert set(table.priority) == {NO_PRIORITY}
+    else:
+        assert 1 <= min(table.priority) and max(table.priority) <= 5
+
+def test_distribution_parameters():
+    table = generate(20000, "poisson", "exponential", seed=3, arrival_params={"rate": 0.5},
+                     burst_params={"mean": 20.0})
+    assert table.arrival_time[-1] / 20000 == pytest.approx(2.0, rel=0.05)
+    assert np.mean(table.burst_time) == pytest.approx(20.0, rel=0.05)
+    assert set(generate(100, "batch", seed=3).arrival_time) == {0}
+
+def test_bursty_arrivals_keep_the_long_run_rate():
+    arrival_times = bursty_arrivals(np.random.default_rng(3), 4000000, rate=0.5)
+    assert arrival_times[-1] / 4000000 == pytest.approx(2.0, rel=0.01)
+    with pytest.raises(ValueError):
+        bursty_arrivals(np.random.default_rng(3), 10, intensity=0.5)
+
+def test_rejects_unknown_distributions_and_bad_parameters():
+    with pytest.raises(ValueError):
+        generate(10, arrivals="gaussian")
+    with pytest.raises(ValueError):
+        generate(10, bursts="pareto", burst_params={"alpha": 1.0})
+
+def test_main_writes_a_workload_file(tmp_path, capsys):
+    path = str(tmp_path / "workload.cpus")
+    main(["100", "-o", path, "--seed", "5", "--bursts", "pareto", "--burst-param", "alpha=2.5"])
+    assert "Wrote 100 processes" in capsys.readouterr().out
+    assert columns(load_workload(path)) == columns(generate(100, bursts="pareto", seed=5,
+                                                            burst_params={"alpha": 2.5}))